@@ -2,19 +2,70 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import partial
+from datetime import datetime, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later, async_track_time_change
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .const import DOMAIN
+from .const import (
+    API_REGIONS,
+    CONF_BASE_URL,
+    CONF_POLL_MODE,
+    CONF_PREWARM,
+    CONF_PROFILING,
+    CONF_RECORD_CASSETTE,
+    CONF_REGION,
+    CONF_WATCHDOG_RECOVER,
+    CONSUMED_PROPERTIES,
+    DEFAULT_POLL_MODE,
+    DEFAULT_REGION,
+    DOMAIN,
+    ENTITY_PROFILE_FULL,
+    EVENT_ERROR_FLAG_CHANGED,
+    EVENT_PROPERTY_CHANGED,
+    EXECUTOR_MAX_QUEUE,
+    EXECUTOR_MAX_WORKERS,
+    POLL_DEADLINE_FRACTION,
+    POLL_MODE_FULL,
+    POLL_MODE_PUSH_GATED,
+    PREWARM_LEAD,
+    PUSH_GATE_MAX_FAILURES,
+    PUSH_GATE_SAFETY_INTERVAL,
+    SIGNAL_ITEMS_RETIRED,
+    VERSION_PROPERTIES,
+)
+from .attribution import PetWeightClusterer
+from .bin_predictor import WasteBinPredictor
+from .cassette import CassetteRecorder
+from .command_queue import FurbulousCommandQueue
+from .discovery import async_track_removed_items
+from .errors import ErrorFlagTracker
+from .executor import FurbulousCatBusyError, FurbulousExecutor
+from .fleet import FleetAggregates
 from .furbulous_api import FurbulousCatAPI, FurbulousCatAuthError
+from .profiles import entity_profile
+from .profiling import HotPathProfiler
+from .services import async_setup_services, async_unload_services
+from .snapshot import FIELD_DEVICES, FIELD_PETS, FurbulousSnapshotStore
+from .statistics_import import UsageStatisticsImporter
+from .transport import create_session, reset_transport
+from .usage_windows import UsageWindows
+from .visits import VisitDetector
+from .watchdog import FurbulousWatchdog
+from .weight_stats import WeightStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,75 +74,368 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.B
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Furbulous Cat from a config entry."""
+    base_url = entry.data.get(CONF_BASE_URL)
+    # Entries created before regions existed all live in the US region
+    region = entry.data.get(CONF_REGION, DEFAULT_REGION)
+    if region not in API_REGIONS:
+        region = DEFAULT_REGION
+
+    # Keep-alive pool with one connection per worker that can send a request
+    session = create_session(EXECUTOR_MAX_WORKERS)
+
+    # Optionally record every request/response pair (redacted) for offline replay
+    if entry.options.get(CONF_RECORD_CASSETTE):
+        cassette_path = hass.config.path(f"furbulous_{entry.entry_id}_{int(time.time())}.jsonl.gz")
+        _LOGGER.warning("Recording Furbulous API traffic to %s", cassette_path)
+        session = CassetteRecorder(cassette_path, session)
+
+    # Close the pooled connections (and the cassette) when the entry unloads
+    entry.async_on_unload(partial(hass.async_add_executor_job, session.close))
+
+    # Blocking API calls run on their own bounded pool, not the shared executor
+    executor = FurbulousExecutor(entry.entry_id, EXECUTOR_MAX_WORKERS, EXECUTOR_MAX_QUEUE)
+    entry.async_on_unload(executor.shutdown)
+
+    # Firmware versions are only shown by the full entity profile
+    property_keys = CONSUMED_PROPERTIES
+    if entity_profile(entry) != ENTITY_PROFILE_FULL:
+        property_keys = CONSUMED_PROPERTIES - VERSION_PROPERTIES
+
     # Check if using token directly or email/password
     if "token" in entry.data:
         api = FurbulousCatAPI(
             email="",
             password="",
             account_type=1,
-            token=entry.data["token"]
+            token=entry.data["token"],
+            base_url=base_url,
+            session=session,
+            region=region,
+            property_keys=property_keys,
         )
         # No need to authenticate, token is already set
     else:
         api = FurbulousCatAPI(
             email=entry.data.get("email"),
             password=entry.data.get("password"),
-            account_type=entry.data.get("account_type", 1)
+            account_type=entry.data.get("account_type", 1),
+            base_url=base_url,
+            session=session,
+            region=region,
+            property_keys=property_keys,
         )
         
         try:
-            await hass.async_add_executor_job(api.authenticate)
+            await executor.async_run(api.authenticate)
         except FurbulousCatAuthError as err:
             raise ConfigEntryAuthFailed from err
 
+    # Device commands issued while the cloud is unreachable, replayed later
+    command_queue = FurbulousCommandQueue(hass, entry, api, executor)
+    await command_queue.async_load()
+
+    # Hourly/daily usage aggregates written to long-term statistics
+    statistics_importer = UsageStatisticsImporter(hass, entry.entry_id)
+    await statistics_importer.async_load()
+
+    # Single snapshot shared by both refresh cadences
+    store = FurbulousSnapshotStore()
+
+    # Account-level totals and error flag transitions, updated from the
+    # devices each refresh changed
+    fleet = FleetAggregates()
+    error_flags = ErrorFlagTracker()
+
+    # Opt-in timing of entity state writes and listener fan-out
+    profiler = HotPathProfiler(entry.options.get(CONF_PROFILING, False))
+
+    # 7 and 30 day usage windows over the days closed by the statistics importer
+    usage_windows = UsageWindows(statistics_importer)
+
     # Regular coordinator (5 minutes) for general data
-    coordinator = FurbulousCatDataUpdateCoordinator(hass, api)
+    coordinator = FurbulousCatDataUpdateCoordinator(
+        hass, api, executor, store, statistics_importer, usage_windows
+    )
+    coordinator.profiler = profiler
+    coordinator.command_queue = command_queue
+    coordinator.fleet = fleet
+    coordinator.error_flags = error_flags
+    coordinator.prewarm = entry.options.get(CONF_PREWARM, False)
+    entry.async_on_unload(coordinator.async_cancel_prewarm)
     await coordinator.async_config_entry_first_refresh()
     
+    # Weight statistics per box and per attributed pet, fed from visits seen
+    # by the fast coordinator
+    weight_stats = WeightStatistics(hass, entry.entry_id)
+    await weight_stats.async_load()
+
+    # Visit attribution to registered pets for multi-cat households
+    attribution = PetWeightClusterer(hass, entry.entry_id)
+    await attribution.async_load()
+
+    # Waste bin fill prediction from cleaning cycles seen by the fast coordinator
+    bin_predictor = WasteBinPredictor(hass, entry.entry_id)
+    await bin_predictor.async_load()
+
     # Fast coordinator (20 seconds) for detecting the cat in the litter box
-    fast_coordinator = FurbulousCatFastUpdateCoordinator(hass, api)
+    fast_coordinator = FurbulousCatFastUpdateCoordinator(
+        hass,
+        api,
+        executor,
+        store,
+        weight_stats,
+        attribution,
+        statistics_importer,
+        bin_predictor,
+        poll_mode=entry.options.get(CONF_POLL_MODE, DEFAULT_POLL_MODE),
+    )
+    fast_coordinator.profiler = profiler
+    fast_coordinator.command_queue = command_queue
+    fast_coordinator.fleet = fleet
+    fast_coordinator.error_flags = error_flags
+    fast_coordinator.prewarm = entry.options.get(CONF_PREWARM, False)
+    entry.async_on_unload(fast_coordinator.async_cancel_prewarm)
     await fast_coordinator.async_config_entry_first_refresh()
 
+    # Detect refreshes that hang or stop succeeding, optionally dropping the
+    # pooled connections to recover
+    recover = None
+    if entry.options.get(CONF_WATCHDOG_RECOVER, False):
+        recover = partial(reset_transport, api.session, EXECUTOR_MAX_WORKERS)
+    watchdog = FurbulousWatchdog(hass, entry, (coordinator, fast_coordinator), recover)
+    entry.async_on_unload(watchdog.async_start())
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "fast_coordinator": fast_coordinator,
+        "store": store,
+        "fleet": fleet,
+        "executor": executor,
+        "command_queue": command_queue,
+        "profiler": profiler,
+        "watchdog": watchdog,
+        "weight_stats": weight_stats,
+        "attribution": attribution,
+        "statistics_importer": statistics_importer,
+        "usage_windows": usage_windows,
+        "bin_predictor": bin_predictor,
     }
 
+    @callback
+    def _async_flush_statistics(now: datetime) -> None:
+        """Import completed hourly buckets shortly after each hour boundary."""
+        statistics_importer.async_flush()
+
+    entry.async_on_unload(
+        async_track_time_change(hass, _async_flush_statistics, minute=1, second=0)
+    )
+
+    @callback
+    def _async_expire_weight_trends(now: datetime) -> None:
+        """Let the weight trends age on days without visits."""
+        weight_stats.async_expire(now.timestamp())
+
+    entry.async_on_unload(
+        async_track_time_change(hass, _async_expire_weight_trends, minute=2, second=0)
+    )
+
+    # Retire devices and pets removed from the account without a reload
+    entry.async_on_unload(async_track_removed_items(hass, entry, coordinator))
+
+    @callback
+    def _async_items_retired(field: str, ids: set[Any]) -> None:
+        """Forget the learned weight of retired pets."""
+        if field == FIELD_PETS:
+            attribution.forget(ids)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_ITEMS_RETIRED.format(entry.entry_id), _async_items_retired)
+    )
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    async_setup_services(hass)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_unload_services(hass)
 
     return unload_ok
 
 
-class FurbulousCatDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Furbulous Cat data."""
+class FurbulousCatBaseCoordinator(DataUpdateCoordinator, ABC):
+    """Coordinator writing into the shared snapshot store.
 
-    def __init__(self, hass: HomeAssistant, api: FurbulousCatAPI) -> None:
+    The coordinator data is the store version it last saw, so listeners are
+    only called when the store moved. Entities read the freshest values
+    through ``snapshot`` whichever cadence they follow.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: FurbulousCatAPI,
+        executor: FurbulousExecutor,
+        store: FurbulousSnapshotStore,
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
         """Initialize."""
         self.api = api
+        self.executor = executor
+        self.store = store
+        self.profiler = HotPathProfiler()
+        self.command_queue: FurbulousCommandQueue | None = None
+        self.fleet = FleetAggregates()
+        self.error_flags = ErrorFlagTracker()
+        # Open the connection shortly before each scheduled poll
+        self.prewarm = False
+        self._prewarm_unsub: CALLBACK_TYPE | None = None
+        # time.monotonic() of the running refresh and of the last successful one
+        self.refresh_started: float | None = None
+        self.last_success: float | None = None
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(minutes=5),
+            name=name,
+            update_interval=update_interval,
+            # An unchanged store version skips the listener fan-out
+            always_update=False,
         )
 
-    async def _async_update_data(self):
+    @property
+    def snapshot(self) -> dict[str, Any]:
+        """Return the freshest shared snapshot."""
+        return self.store.data
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Register a listener, wrapped so it is timed when profiling."""
+
+        @callback
+        def _async_timed_update() -> None:
+            if not self.profiler.enabled:
+                update_callback()
+                return
+            start = time.perf_counter()
+            update_callback()
+            owner = getattr(update_callback, "__self__", None)
+            name = getattr(owner, "entity_id", None) or getattr(update_callback, "__qualname__", repr(update_callback))
+            self.profiler.record_listener(name, time.perf_counter() - start)
+
+        return super().async_add_listener(_async_timed_update, context)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the fan-out when profiling."""
+        if not self.profiler.enabled:
+            super().async_update_listeners()
+            return
+
+        start = time.perf_counter()
+        super().async_update_listeners()
+        self.profiler.record_fanout(self.name, time.perf_counter() - start)
+
+    async def _async_update_data(self) -> int:
+        """Fetch new data, then schedule the connection pre-warm."""
+        self.refresh_started = time.monotonic()
+        try:
+            version = await self._async_fetch()
+        finally:
+            self.refresh_started = None
+            self._async_schedule_prewarm()
+        self.last_success = time.monotonic()
+
+        # The cloud answered, send the commands queued during the outage
+        if self.command_queue is not None:
+            self.command_queue.async_schedule_replay()
+        return version
+
+    @abstractmethod
+    async def _async_fetch(self) -> int:
+        """Fetch data and return the store version."""
+
+    @callback
+    def _async_schedule_prewarm(self) -> None:
+        """Warm the connection up just before the next scheduled refresh."""
+        self.async_cancel_prewarm()
+        if not self.prewarm or self.update_interval is None:
+            return
+        delay = self.update_interval.total_seconds() - PREWARM_LEAD
+        if delay > 0:
+            self._prewarm_unsub = async_call_later(self.hass, delay, self._async_prewarm)
+
+    async def _async_prewarm(self, _now: datetime) -> None:
+        """Open or refresh a pooled connection in the worker pool."""
+        self._prewarm_unsub = None
+        try:
+            await self.executor.async_run(self.api.warm_up, coalesce_key="warm_up")
+        except FurbulousCatBusyError:
+            _LOGGER.debug("Worker pool busy, skipping connection pre-warm")
+
+    @callback
+    def async_cancel_prewarm(self) -> None:
+        """Cancel a scheduled pre-warm."""
+        if self._prewarm_unsub is not None:
+            self._prewarm_unsub()
+            self._prewarm_unsub = None
+
+    def _deadline(self) -> float:
+        """Return the time.monotonic() value the current refresh must finish by."""
+        return time.monotonic() + self.update_interval.total_seconds() * POLL_DEADLINE_FRACTION
+
+    def async_apply_snapshot(self, data: dict[str, Any], fields: tuple[str, ...]) -> int:
+        """Merge fetched data into the store and publish what changed."""
+        for change in self.store.apply(data, fields):
+            self.hass.bus.async_fire(EVENT_PROPERTY_CHANGED, change.as_event_data())
+        self.fleet.update(self.store.changed_devices, self.store.removed_devices)
+        self.error_flags.forget(self.store.removed_devices)
+        for flag_change in self.error_flags.process(self.store.changed_devices):
+            self.hass.bus.async_fire(EVENT_ERROR_FLAG_CHANGED, flag_change.as_event_data())
+        return self.store.version
+
+
+class FurbulousCatDataUpdateCoordinator(FurbulousCatBaseCoordinator):
+    """Class to manage fetching Furbulous Cat data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: FurbulousCatAPI,
+        executor: FurbulousExecutor,
+        store: FurbulousSnapshotStore,
+        statistics_importer: UsageStatisticsImporter,
+        usage_windows: UsageWindows,
+    ) -> None:
+        """Initialize."""
+        self.statistics_importer = statistics_importer
+        self.usage_windows = usage_windows
+        super().__init__(hass, api, executor, store, DOMAIN, timedelta(minutes=5))
+
+    async def _async_fetch(self):
         """Update data via library."""
         try:
             _LOGGER.debug("Regular coordinator: Starting data update (5 min interval)")
-            data = await self.hass.async_add_executor_job(self.api.get_data)
+            data = await self.executor.async_run(
+                self.api.get_data, True, None, self._deadline(), coalesce_key="get_data"
+            )
             _LOGGER.info("Regular coordinator: Successfully updated data - found %d devices, %d pets",
                         len(data.get("devices", [])), len(data.get("pets", [])))
-            return data
         except FurbulousCatAuthError as err:
             _LOGGER.error("Regular coordinator: Authentication failed during update")
             raise ConfigEntryAuthFailed from err
@@ -99,31 +443,114 @@ class FurbulousCatDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Regular coordinator: Update failed - %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        version = self.async_apply_snapshot(data, (FIELD_DEVICES, FIELD_PETS))
+        self.usage_windows.refresh(self.statistics_importer.update_daily(self.snapshot))
+        return version
+
 
-class FurbulousCatFastUpdateCoordinator(DataUpdateCoordinator):
+class FurbulousCatFastUpdateCoordinator(FurbulousCatBaseCoordinator):
     """Class to manage fast fetching of cat presence data (20 seconds)."""
 
-    def __init__(self, hass: HomeAssistant, api: FurbulousCatAPI) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: FurbulousCatAPI,
+        executor: FurbulousExecutor,
+        store: FurbulousSnapshotStore,
+        weight_stats: WeightStatistics,
+        attribution: PetWeightClusterer,
+        statistics_importer: UsageStatisticsImporter,
+        bin_predictor: WasteBinPredictor,
+        poll_mode: str = DEFAULT_POLL_MODE,
+    ) -> None:
         """Initialize fast coordinator for cat detection."""
-        self.api = api
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"{DOMAIN}_fast",
-            update_interval=timedelta(seconds=20),  # Fast refresh every 20 seconds
-        )
+        self.poll_mode = poll_mode
+        self._push_marker = None
+        self._push_marker_failures = 0
+        self._last_full_refresh = 0.0
+        self.statistics_importer = statistics_importer
+        self.weight_stats = weight_stats
+        self.attribution = attribution
+        self.bin_predictor = bin_predictor
+        self.visit_detector = VisitDetector()
+        # Fast refresh every 20 seconds
+        super().__init__(hass, api, executor, store, f"{DOMAIN}_fast", timedelta(seconds=20))
 
-    async def _async_update_data(self):
+    async def _async_fetch(self):
         """Update cat presence data via library."""
         try:
             _LOGGER.debug("Fast coordinator: Starting data update (20 sec interval)")
-            data = await self.hass.async_add_executor_job(self.api.get_data)
+            if self.poll_mode == POLL_MODE_PUSH_GATED and self.data is not None:
+                marker = await self._async_push_marker()
+                if marker is not None and not self._needs_full_refresh(marker):
+                    _LOGGER.debug("Fast coordinator: Unread push counter unchanged, skipping full refresh")
+                    return self.store.version
+            # Pets only change on the regular cadence
+            data = await self.executor.async_run(
+                self.api.get_data, False, None, self._deadline(), coalesce_key="get_data_devices"
+            )
+            self._last_full_refresh = time.monotonic()
             _LOGGER.debug("Fast coordinator: Successfully updated data - found %d devices",
                          len(data.get("devices", [])))
-            return data
         except FurbulousCatAuthError as err:
             _LOGGER.error("Fast coordinator: Authentication failed during update")
             raise ConfigEntryAuthFailed from err
         except Exception as err:
             _LOGGER.error("Fast coordinator: Update failed - %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        version = self.async_apply_snapshot(data, (FIELD_DEVICES,))
+
+        snapshot = self.snapshot
+        self.attribution.update_pets(snapshot.get("pets", []))
+        for visit in self.visit_detector.process(snapshot):
+            self.weight_stats.add(visit.iotid, visit.weight, visit.ended_at)
+            self.statistics_importer.record_visit(visit.iotid, visit.ended_at)
+            pet_id = self.attribution.assign(visit.weight, visit.ended_at)
+            if pet_id is not None:
+                self.weight_stats.add(f"pet_{pet_id}", visit.weight, visit.ended_at)
+        self.bin_predictor.process(snapshot)
+
+        return version
+
+    async def _async_push_marker(self):
+        """Return the unread push marker, or None when a full refresh must run instead."""
+        try:
+            marker = await self.executor.async_run(
+                self.api.get_unread_push_marker, coalesce_key="unread_push_marker"
+            )
+        except FurbulousCatAuthError:
+            raise
+        except Exception as err:
+            self._push_marker_failures += 1
+            if self._push_marker_failures >= PUSH_GATE_MAX_FAILURES:
+                _LOGGER.warning(
+                    "Fast coordinator: Unread push counter failed %d times in a row, disabling push gating: %s",
+                    self._push_marker_failures,
+                    err,
+                )
+                self.poll_mode = POLL_MODE_FULL
+            else:
+                _LOGGER.debug("Fast coordinator: Unread push counter failed, doing a full refresh: %s", err)
+            return None
+        self._push_marker_failures = 0
+        return marker
+
+    def _needs_full_refresh(self, marker) -> bool:
+        """Return True when a push-gated cycle must fetch everything."""
+        changed = marker != self._push_marker
+        self._push_marker = marker
+        if changed:
+            _LOGGER.debug("Fast coordinator: Unread push counter changed to %s", marker)
+            return True
+
+        # Periodic safety refresh in case a change did not produce a notification
+        if time.monotonic() - self._last_full_refresh >= PUSH_GATE_SAFETY_INTERVAL:
+            return True
+
+        # Keep polling fully while a box is busy so the end of a visit or
+        # cleaning cycle is caught without waiting for a notification
+        for device in self.snapshot.get("devices", []):
+            if device.get("properties", {}).get("workstatus") not in (None, 0):
+                return True
+        return False
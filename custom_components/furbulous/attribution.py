@@ -0,0 +1,128 @@
+"""Multi-cat visit attribution by online weight clustering."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTRIBUTION_LEARNING_RATE,
+    ATTRIBUTION_MAX_DEVIATION,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+def pet_weight_grams(pet: dict[str, Any]) -> float | None:
+    """Return the registered weight of a pet in grams.
+
+    The pet list reports the weight as entered in the app, which is usually
+    kilograms; values that are already in grams are passed through.
+    """
+    try:
+        weight = float(pet.get("weight") or 0)
+    except (TypeError, ValueError):
+        return None
+    if weight <= 0:
+        return None
+    return weight * 1000 if weight < 100 else weight
+
+
+class PetWeightClusterer:
+    """Assign visits to the registered pet with the nearest weight centroid.
+
+    Centroids are seeded from the pet list and follow each cat's weight with
+    a small learning rate, so attribution adapts as cats gain or lose weight.
+    Each visit costs O(pets) and no API call.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the clusterer."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.attribution")
+        self._centroids: dict[int, float] = {}
+        self._counters: dict[int, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load persisted centroids and counters."""
+        stored = await self._store.async_load() or {}
+        self._centroids = {int(pet_id): value for pet_id, value in stored.get("centroids", {}).items()}
+        self._counters = {int(pet_id): value for pet_id, value in stored.get("counters", {}).items()}
+
+    def update_pets(self, pets: list[dict[str, Any]]) -> None:
+        """Seed centroids for pets seen for the first time.
+
+        An empty list is what a failed pet fetch returns, so nothing is
+        dropped here; removed pets are forgotten through forget().
+        """
+        for pet in pets:
+            pet_id = pet.get("pet_id")
+            if pet_id is None or pet_id in self._centroids:
+                continue
+            weight = pet_weight_grams(pet)
+            if weight is not None:
+                self._centroids[pet_id] = weight
+                _LOGGER.debug("Seeded weight centroid for pet %s: %.0f g", pet_id, weight)
+
+    def forget(self, pet_ids: set[int]) -> None:
+        """Drop the centroids and counters of pets removed from the account."""
+        for pet_id in pet_ids:
+            self._centroids.pop(pet_id, None)
+            self._counters.pop(pet_id, None)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def assign(self, weight: int, timestamp: float) -> int | None:
+        """Attribute a visit weight to a pet and return its id."""
+        best_id = None
+        best_distance = None
+        for pet_id, centroid in self._centroids.items():
+            distance = abs(weight - centroid)
+            if best_distance is None or distance < best_distance:
+                best_id, best_distance = pet_id, distance
+
+        if best_id is None:
+            return None
+
+        centroid = self._centroids[best_id]
+        if best_distance > centroid * ATTRIBUTION_MAX_DEVIATION:
+            _LOGGER.debug("Visit weight %d g too far from any registered pet", weight)
+            return None
+
+        self._centroids[best_id] = centroid + ATTRIBUTION_LEARNING_RATE * (weight - centroid)
+
+        today = dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date().isoformat()
+        counter = self._counters.setdefault(best_id, {"total": 0, "today": 0, "day": today})
+        if counter["day"] != today:
+            counter["day"] = today
+            counter["today"] = 0
+        counter["total"] += 1
+        counter["today"] += 1
+        counter["last_visit"] = timestamp
+        counter["last_weight"] = weight
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return best_id
+
+    def centroid(self, pet_id: int) -> float | None:
+        """Return the current weight centroid of a pet."""
+        centroid = self._centroids.get(pet_id)
+        return round(centroid) if centroid is not None else None
+
+    def counters(self, pet_id: int) -> dict[str, Any]:
+        """Return the visit counters of a pet."""
+        counter = self._counters.get(pet_id)
+        if not counter:
+            return {"total": 0, "today": 0}
+        if counter["day"] != dt_util.now().date().isoformat():
+            return {**counter, "today": 0}
+        return counter
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"centroids": self._centroids, "counters": self._counters}
@@ -0,0 +1,162 @@
+"""Waste bin fill prediction from cleaning cycle counts."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import BIN_CAPACITY_LEARNING_RATE, DOMAIN
+from .device import property_value
+from .errors import error_value, is_bin_full
+from .visits import WORKSTATUS_CAT_DETECTED
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+# workstatus value reported while the box runs a cleaning cycle
+WORKSTATUS_CLEANING = 2
+
+
+class WasteBinState:
+    """Fill state of the waste bin of one device.
+
+    Cleaning cycles and visits are counted since the bin was last emptied.
+    When the box reports a full bin, the cycle count at that moment updates
+    the learned capacity; the bin counts as emptied once the report clears.
+    """
+
+    def __init__(
+        self,
+        cycles: int = 0,
+        visits: int = 0,
+        emptied_at: float | None = None,
+        capacity: float | None = None,
+        full: bool = False,
+    ) -> None:
+        """Initialize the state, optionally from persisted values."""
+        self.cycles = cycles
+        self.visits = visits
+        self.emptied_at = emptied_at if emptied_at is not None else time.time()
+        self.capacity = capacity
+        self.full = full
+        self.status: Any = None
+
+    def process(self, status: Any, error_code: int, now: float) -> bool:
+        """Apply the latest workstatus and error code, return whether the state changed."""
+        changed = False
+        previous, self.status = self.status, status
+        if previous is not None and previous != status:
+            # A cat usually leaves straight into a cleaning cycle (5 -> 2)
+            if status == WORKSTATUS_CLEANING:
+                self.cycles += 1
+                changed = True
+            if previous == WORKSTATUS_CAT_DETECTED:
+                self.visits += 1
+                changed = True
+
+        full = is_bin_full(error_code)
+        if full and not self.full:
+            self._learn_capacity()
+            changed = True
+        elif self.full and not full:
+            self.empty(now)
+            changed = True
+        self.full = full
+        return changed
+
+    def _learn_capacity(self) -> None:
+        """Blend the cycles counted until this full report into the capacity."""
+        if self.cycles <= 0:
+            return
+        if self.capacity is None:
+            self.capacity = float(self.cycles)
+        else:
+            self.capacity += BIN_CAPACITY_LEARNING_RATE * (self.cycles - self.capacity)
+
+    def empty(self, now: float) -> None:
+        """Start counting from an empty bin."""
+        self.cycles = 0
+        self.visits = 0
+        self.emptied_at = now
+
+    def fill_percent(self) -> float | None:
+        """Return the estimated fill level, once a capacity was learned."""
+        if self.full:
+            return 100.0
+        if not self.capacity:
+            return None
+        return round(min(100.0, self.cycles / self.capacity * 100), 1)
+
+    def hours_to_full(self, now: float) -> float | None:
+        """Return the estimated hours left at the cycle rate since the bin was emptied."""
+        if self.full:
+            return 0.0
+        if not self.capacity or self.cycles <= 0:
+            return None
+        elapsed = now - self.emptied_at
+        if elapsed <= 0:
+            return None
+        remaining = max(0.0, self.capacity - self.cycles)
+        return round(remaining * elapsed / self.cycles / 3600, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        return {
+            "cycles": self.cycles,
+            "visits": self.visits,
+            "emptied_at": self.emptied_at,
+            "capacity": self.capacity,
+            "full": self.full,
+        }
+
+
+class WasteBinPredictor:
+    """Waste bin fill states for every device of a config entry, persisted to storage.
+
+    Each snapshot costs O(1) per device and no extra API calls are made.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the predictor."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.waste_bin")
+        self._bins: dict[str, WasteBinState] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted fill states."""
+        stored = await self._store.async_load() or {}
+        for iotid, state in stored.get("devices", {}).items():
+            self._bins[iotid] = WasteBinState(**state)
+        _LOGGER.debug("Loaded waste bin states for %d device(s)", len(self._bins))
+
+    def process(self, data: dict[str, Any]) -> None:
+        """Count cycles and visits and watch the full reports of every device."""
+        now = time.time()
+        changed = False
+        for device in data.get("devices", []):
+            iotid = device.get("iotid")
+            properties = device.get("properties")
+            if not iotid or not properties:
+                continue
+            state = self._bins.setdefault(iotid, WasteBinState())
+            if state.process(property_value(properties, "workstatus"), error_value(properties), now):
+                changed = True
+        if changed:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def empty(self, iotid: str) -> None:
+        """Record that the bin of a device was emptied by hand."""
+        self._bins.setdefault(iotid, WasteBinState()).empty(time.time())
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def get(self, iotid: str) -> WasteBinState | None:
+        """Return the fill state of a device."""
+        return self._bins.get(iotid)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"devices": {iotid: state.as_dict() for iotid, state in self._bins.items()}}
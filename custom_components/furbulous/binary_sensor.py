@@ -6,13 +6,17 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FurbulousCatDataUpdateCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_PROFILE_FULL, ENTITY_PROFILE_MINIMAL, ENTITY_PROFILE_STANDARD
 from .device import get_device_info
+from .discovery import async_track_new_items
+from .errors import active_flags, describe, error_value, is_bin_full
+from .profiles import async_apply_entity_profile
 
 
 async def async_setup_entry(
@@ -25,50 +29,51 @@ async def async_setup_entry(
     coordinator = coordinators["coordinator"]
     fast_coordinator = coordinators["fast_coordinator"]
 
-    entities = []
-    
-    # Add binary sensors for each device
-    devices = coordinator.data.get("devices", [])
-    for device in devices:
+    @callback
+    def _build_device_entities(device: dict) -> list[BinarySensorEntity]:
+        """Create the binary sensors of a device."""
         device_id = device.get("id")
-        iotid = device.get("iotid")
-        
-        if iotid:
-            entities.extend([
-                # Device online status
-                FurbulousCatOnlineBinarySensor(coordinator, device_id),
-
-                # Cat in box sensor (FAST UPDATE - 30 seconds)
-                FurbulousCatInBoxSensor(fast_coordinator, device_id),
-
-                # Property-based binary sensors (English names)
-                FurbulousCatPropertyBinarySensor(
-                    coordinator, device_id, "FullAutoModeSwitch", "Full auto mode", "running"
-                ),
-                FurbulousCatPropertyBinarySensor(
-                    coordinator, device_id, "catCleanOnOff", "Automatic cleaning", "running"
-                ),
-                FurbulousCatPropertyBinarySensor(
-                    coordinator, device_id, "childLockOnOff", "Child lock", "lock"
-                ),
-                FurbulousCatPropertyBinarySensor(
-                    coordinator, device_id, "masterSleepOnOff", "Sleep mode", "running"
-                ),
-                FurbulousCatPropertyBinarySensor(
-                    coordinator, device_id, "DisplaySwitch", "Display", "power"
-                ),
-                FurbulousCatPropertyBinarySensor(
-                    coordinator, device_id, "handMode", "Manual mode", "running"
-                ),
-
-                # Error sensor
-                FurbulousCatErrorBinarySensor(coordinator, device_id),
-
-                # Waste bin full sensor (NEW)
-                FurbulousCatWasteBinFullSensor(coordinator, device_id),
-            ])
-    
-    async_add_entities(entities)
+        if not device.get("iotid"):
+            return []
+
+        return async_apply_entity_profile(hass, config_entry, Platform.BINARY_SENSOR, [
+            # Device online status
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatOnlineBinarySensor(coordinator, device_id)),
+
+            # Cat in box sensor (FAST UPDATE - 30 seconds)
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatInBoxSensor(fast_coordinator, device_id)),
+
+            # Property-based binary sensors (English names)
+            (ENTITY_PROFILE_STANDARD, FurbulousCatPropertyBinarySensor(
+                coordinator, device_id, "masterSleepOnOff", "Sleep mode", "running"
+            )),
+            (ENTITY_PROFILE_STANDARD, FurbulousCatPropertyBinarySensor(
+                coordinator, device_id, "DisplaySwitch", "Display", "power"
+            )),
+            (ENTITY_PROFILE_STANDARD, FurbulousCatPropertyBinarySensor(
+                coordinator, device_id, "handMode", "Manual mode", "running"
+            )),
+
+            # Settings that also have a switch
+            (ENTITY_PROFILE_FULL, FurbulousCatPropertyBinarySensor(
+                coordinator, device_id, "FullAutoModeSwitch", "Full auto mode", "running", enabled_default=False
+            )),
+            (ENTITY_PROFILE_FULL, FurbulousCatPropertyBinarySensor(
+                coordinator, device_id, "catCleanOnOff", "Automatic cleaning", "running", enabled_default=False
+            )),
+            (ENTITY_PROFILE_FULL, FurbulousCatPropertyBinarySensor(
+                coordinator, device_id, "childLockOnOff", "Child lock", "lock", enabled_default=False
+            )),
+
+            # Error sensor
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatErrorBinarySensor(coordinator, device_id)),
+
+            # Waste bin full sensor (NEW)
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatWasteBinFullSensor(coordinator, device_id)),
+        ])
+
+    # Add binary sensors for each device, including devices added later on
+    async_track_new_items(config_entry, coordinator, async_add_entities, "devices", "id", _build_device_entities)
 
 
 class FurbulousCatOnlineBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -94,7 +99,7 @@ class FurbulousCatOnlineBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -146,7 +151,7 @@ class FurbulousCatInBoxSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -253,7 +258,7 @@ class FurbulousCatWasteBinFullSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -275,17 +280,10 @@ class FurbulousCatWasteBinFullSensor(CoordinatorEntity, BinarySensorEntity):
         if device:
             properties = device.get("properties", {})
 
-            # Method 1: Check error codes for full bin
-            error_prop = properties.get("errorReportEvent")
-            if error_prop:
-                if isinstance(error_prop, dict):
-                    error_code = error_prop.get("value", 0)
-                else:
-                    error_code = error_prop
-
-                # Error code 16 = Litter full, Error code 32 = Waste bin full
-                if error_code in [16, 32]:
-                    return True
+            # Method 1: Check error flags for full bin
+            # Flag 16 = Litter full, flag 32 = Waste bin full
+            if is_bin_full(error_value(properties)):
+                return True
 
             # Method 2: Logic based on completionStatus
             # completionStatus == 1 could indicate "finished/full"
@@ -332,12 +330,8 @@ class FurbulousCatWasteBinFullSensor(CoordinatorEntity, BinarySensorEntity):
             attrs = {}
 
             # Error code
-            error_prop = properties.get("errorReportEvent")
-            if error_prop:
-                if isinstance(error_prop, dict):
-                    error_code = error_prop.get("value", 0)
-                else:
-                    error_code = error_prop
+            error_code = error_value(properties)
+            if error_code:
                 attrs["error_code"] = error_code
 
             # Completion status
@@ -386,6 +380,7 @@ class FurbulousCatPropertyBinarySensor(CoordinatorEntity, BinarySensorEntity):
         property_key: str,
         friendly_name: str,
         device_class: str | None = None,
+        enabled_default: bool = True,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
@@ -393,6 +388,7 @@ class FurbulousCatPropertyBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._property_key = property_key
         self._friendly_name = friendly_name
         self._attr_unique_id = f"furbulous_{device_id}_{property_key}_binary"
+        self._attr_entity_registry_enabled_default = enabled_default
         
         if device_class:
             self._attr_device_class = device_class
@@ -405,7 +401,7 @@ class FurbulousCatPropertyBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -484,7 +480,7 @@ class FurbulousCatErrorBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -504,15 +500,7 @@ class FurbulousCatErrorBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Return true if there is an error."""
         device = self.device_data
         if device:
-            properties = device.get("properties", {})
-            error_prop = properties.get("errorReportEvent")
-            if error_prop:
-                # Handle both dict {"value": x} and direct value cases
-                if isinstance(error_prop, dict):
-                    error_code = error_prop.get("value", 0)
-                else:
-                    error_code = error_prop
-                return error_code != 0
+            return error_value(device.get("properties", {})) != 0
         return False
 
     @property
@@ -520,16 +508,12 @@ class FurbulousCatErrorBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Return additional attributes."""
         device = self.device_data
         if device:
-            properties = device.get("properties", {})
-            error_prop = properties.get("errorReportEvent")
-            if error_prop:
-                # Handle both dict {"value": x} and direct value cases
-                if isinstance(error_prop, dict):
-                    error_code = error_prop.get("value", 0)
-                else:
-                    error_code = error_prop
+            error_code = error_value(device.get("properties", {}))
+            if error_code:
                 return {
                     "error_code": error_code,
+                    "error_message": describe(error_code),
+                    "active_errors": list(active_flags(error_code)),
                 }
         return {}
 
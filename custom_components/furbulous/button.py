@@ -6,15 +6,18 @@ from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_PROFILE_FULL, ENTITY_PROFILE_MINIMAL, ENTITY_PROFILE_STANDARD
 from .device import get_device_info
+from .discovery import async_track_new_items
+from .profiles import async_apply_entity_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,19 +30,25 @@ async def async_setup_entry(
     """Set up Furbulous Cat buttons from a config entry."""
     coordinators = hass.data[DOMAIN][entry.entry_id]
     coordinator = coordinators["coordinator"]
-
-    buttons = []
-    for device in coordinator.data.get("devices", []):
-        # Add manual clean button
-        buttons.append(FurbulousCatManualCleanButton(coordinator, device))
-        # Add dump button
-        buttons.append(FurbulousCatDumpButton(coordinator, device))
-        # Add auto-pack button
-        buttons.append(FurbulousCatAutoPackButton(coordinator, device))
-        # Add DND toggle button
-        buttons.append(FurbulousCatDNDButton(coordinator, device))
-
-    async_add_entities(buttons)
+    fast_coordinator = coordinators["fast_coordinator"]
+
+    @callback
+    def _build_device_entities(device: dict[str, Any]) -> list[ButtonEntity]:
+        """Create the buttons of a device."""
+        return async_apply_entity_profile(hass, entry, Platform.BUTTON, [
+            # Add manual clean button
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatManualCleanButton(coordinator, device)),
+            # Add dump button
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatDumpButton(coordinator, device)),
+            # Add auto-pack button
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatAutoPackButton(coordinator, device)),
+            # Reset the waste bin fill prediction after emptying it early
+            (ENTITY_PROFILE_STANDARD, FurbulousCatBinEmptiedButton(fast_coordinator, device)),
+            # Add DND toggle button (the DND switch shows the state as well)
+            (ENTITY_PROFILE_FULL, FurbulousCatDNDButton(coordinator, device)),
+        ])
+
+    async_track_new_items(entry, coordinator, async_add_entities, "devices", "id", _build_device_entities)
 
 
 class FurbulousCatManualCleanButton(ButtonEntity):
@@ -61,8 +70,7 @@ class FurbulousCatManualCleanButton(ButtonEntity):
         iotid = self.device_data["iotid"]
         
         # Set handMode to 1 to trigger manual clean
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_send_action(
             iotid,
             {"handMode": 1}
         )
@@ -94,8 +102,7 @@ class FurbulousCatDumpButton(ButtonEntity):
         iotid = self.device_data["iotid"]
         
         # Set handMode to 2 to trigger dump mode
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_send_action(
             iotid,
             {"handMode": 2}
         )
@@ -127,8 +134,7 @@ class FurbulousCatAutoPackButton(ButtonEntity):
         iotid = self.device_data["iotid"]
         
         # Set handMode to 3 to trigger auto-pack mode
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_send_action(
             iotid,
             {"handMode": 3}
         )
@@ -141,9 +147,34 @@ class FurbulousCatAutoPackButton(ButtonEntity):
             _LOGGER.error("Failed to start auto-pack mode for device %s", iotid)
 
 
+class FurbulousCatBinEmptiedButton(ButtonEntity):
+    """Button recording that the waste bin was emptied."""
+
+    def __init__(
+        self, coordinator: DataUpdateCoordinator, device: dict[str, Any]
+    ) -> None:
+        """Initialize the button."""
+        self.coordinator = coordinator
+        self.device_data = device
+        self._attr_unique_id = f"{device['iotid']}_waste_bin_emptied"
+        self._attr_name = f"{device['name']} Waste Bin Emptied"
+        self._attr_icon = "mdi:delete-restore"
+        self._attr_device_info = get_device_info(device)
+
+    async def async_press(self) -> None:
+        """Handle the button press - restart the fill prediction from empty."""
+        iotid = self.device_data["iotid"]
+        self.coordinator.bin_predictor.empty(iotid)
+        _LOGGER.info("Waste bin of device %s marked as emptied", iotid)
+        self.coordinator.async_update_listeners()
+
+
 class FurbulousCatDNDButton(ButtonEntity):
     """Representation of a Furbulous Cat Do Not Disturb toggle button."""
 
+    # Redundant with the DND switch
+    _attr_entity_registry_enabled_default = False
+
     def __init__(
         self, coordinator: DataUpdateCoordinator, device: dict[str, Any]
     ) -> None:
@@ -164,8 +195,7 @@ class FurbulousCatDNDButton(ButtonEntity):
         new_dnd = 0 if current_dnd == 1 else 1
         
         # Toggle DND mode
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_disturb,
+        success = await self.coordinator.command_queue.async_set_disturb(
             iotid,
             bool(new_dnd)
         )
@@ -0,0 +1,245 @@
+"""Record-and-replay cassettes for the Furbulous Cat API client."""
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from .const import CASSETTE_MAX_AGE, CASSETTE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+REDACTED = "**REDACTED**"
+
+# Request headers and JSON keys (request or response) that carry secrets
+REDACTED_HEADERS = {"authorization", "sign"}
+REDACTED_KEYS = {
+    "account",
+    "client_token",
+    "email",
+    "identityid",
+    "password",
+    "phone",
+    "token",
+    "username",
+}
+
+
+def redact(value: Any) -> Any:
+    """Return a copy of a JSON value with credentials and tokens replaced."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_KEYS and value[key] else redact(value[key])
+            for key in value
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def _request_key(method: str, url: str) -> str:
+    """Return the replay key of a request: method, path and query."""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    return f"{method.upper()} {path}"
+
+
+def _encode_body(content: bytes) -> Any:
+    """Return a redacted JSON body, or the raw text when it is not JSON."""
+    try:
+        return {"json": redact(json.loads(content))}
+    except ValueError:
+        return {"text": content.decode(errors="replace")}
+
+
+class CassetteRecorder:
+    """requests.Session wrapper that appends every exchange to a cassette.
+
+    A cassette is a gzip-compressed JSON-lines file with one redacted
+    request/response pair per line. The file stays open and is flushed after
+    every line, so a crash never loses what was already recorded. Recording
+    stops once max_bytes of JSON were written or max_age seconds passed; the
+    session keeps working without recording.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        session: requests.Session | None = None,
+        max_bytes: int = CASSETTE_MAX_BYTES,
+        max_age: float = CASSETTE_MAX_AGE,
+    ) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._session = session or requests.Session()
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._deadline = time.time() + max_age
+        self._written = 0
+        self._file: gzip.GzipFile | None = None
+        self.recording = True
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else (headers, adapters, close...) to the session."""
+        return getattr(self._session, name)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request and record the exchange."""
+        started = time.time()
+        response = self._session.request(method, url, **kwargs)
+        elapsed = time.time() - started
+
+        headers = {
+            key: REDACTED if key.lower() in REDACTED_HEADERS else value
+            for key, value in (kwargs.get("headers") or {}).items()
+        }
+        interaction = {
+            "at": round(started, 3),
+            "elapsed": round(elapsed, 4),
+            "request": {
+                "method": method.upper(),
+                "key": _request_key(method, url),
+                "headers": headers,
+                "json": redact(kwargs.get("json")),
+            },
+            "response": {
+                "status": response.status_code,
+                "headers": {key: value for key, value in response.headers.items() if key.lower() in ("date", "content-type")},
+                **_encode_body(response.content),
+            },
+        }
+        line = (json.dumps(interaction, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+        with self._lock:
+            self._write(line)
+        return response
+
+    def _write(self, line: bytes) -> None:
+        """Append a line unless a cap was reached, closing the cassette then."""
+        if not self.recording:
+            return
+        if self._written + len(line) > self._max_bytes or time.time() > self._deadline:
+            _LOGGER.warning("Cassette %s reached its size or age limit, recording stopped", self.path)
+            self._stop()
+            return
+        if self._file is None:
+            self._file = gzip.open(self.path, "ab")
+        self._file.write(line)
+        self._file.flush()
+        self._written += len(line)
+
+    def _stop(self) -> None:
+        """Stop recording and close the cassette file."""
+        self.recording = False
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        """Close the cassette and the wrapped session."""
+        with self._lock:
+            self._stop()
+        self._session.close()
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a HEAD request without recording it (no body to replay)."""
+        return self._session.head(url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send and record a GET request."""
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send and record a POST request."""
+        return self._request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send and record a PUT request."""
+        return self._request("PUT", url, **kwargs)
+
+
+class ReplayResponse(requests.Response):
+    """Response rebuilt from a cassette entry."""
+
+    def __init__(self, url: str, entry: dict[str, Any]) -> None:
+        """Initialize the response."""
+        super().__init__()
+        self.url = url
+        self.status_code = entry["status"]
+        self.headers.update(entry.get("headers", {}))
+        if "json" in entry:
+            self._content = json.dumps(entry["json"], separators=(",", ":"), ensure_ascii=False).encode()
+        else:
+            self._content = entry.get("text", "").encode()
+        self.encoding = "utf-8"
+
+
+class ReplaySession:
+    """Drop-in replacement for requests.Session serving a cassette.
+
+    Responses are served per request key (method, path and query) in the
+    order they were recorded; once a key is exhausted its last response is
+    repeated, so replay is deterministic however long the client runs.
+    ``speed`` scales the recorded latencies: 1 replays in real time, 10 ten
+    times faster, 0 without any delay.
+    """
+
+    def __init__(self, interactions: list[dict[str, Any]], speed: float = 0) -> None:
+        """Initialize the replay session."""
+        self.speed = speed
+        self.headers: dict[str, str] = {}
+        self._queues: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self._last: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        for interaction in interactions:
+            self._queues[interaction["request"]["key"]].append(interaction)
+
+    @classmethod
+    def load(cls, path: str, speed: float = 0) -> ReplaySession:
+        """Load a cassette file."""
+        with gzip.open(path, "rt", encoding="utf-8") as cassette:
+            interactions = [json.loads(line) for line in cassette if line.strip()]
+        _LOGGER.debug("Loaded %d interactions from %s", len(interactions), path)
+        return cls(interactions, speed)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Serve the next recorded response for this request."""
+        key = _request_key(method, url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            else:
+                interaction = self._last.get(key)
+        if interaction is None:
+            raise requests.exceptions.ConnectionError(f"No recorded response for {key}")
+
+        if self.speed:
+            time.sleep(interaction["elapsed"] / self.speed)
+        return ReplayResponse(url, interaction["response"])
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Answer a HEAD request (region probe, pre-warm) with an empty 200."""
+        return ReplayResponse(url, {"status": 200})
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Replay a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Replay a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        """Replay a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def close(self) -> None:
+        """Nothing to release."""
@@ -0,0 +1,198 @@
+"""Durable per-device command queue replayed when the cloud is back."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import COMMAND_QUEUE_MAX_AGE, DOMAIN
+from .executor import FurbulousCatBusyError, FurbulousExecutor
+from .furbulous_api import FurbulousCatAPI, FurbulousCatConnectionError
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 1
+
+COMMAND_PROPERTY = "property"
+COMMAND_DISTURB = "disturb"
+
+# Properties that trigger a one-shot action (clean, empty, auto-pack)
+ACTION_PROPERTIES = {"handMode"}
+
+
+class FurbulousCommandQueue:
+    """Send device commands, queuing them while the cloud is unreachable.
+
+    Commands are kept per device in the order they were issued. A new write
+    to a property that is already queued replaces the older one and moves to
+    the back, so only the latest intent is replayed. While a device has
+    queued commands, new ones queue behind them to keep the order.
+    Connection errors, timeouts and 5xx answers all count as offline.
+
+    Only idempotent state writes are queued. One-shot actions go through
+    async_send_action and fail right away when the cloud is unreachable:
+    replaying a clean an hour late could start it with a cat inside.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, api: FurbulousCatAPI, executor: FurbulousExecutor
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._entry = entry
+        self._api = api
+        self._executor = executor
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.command_queue")
+        # iotid -> {(kind, key): (value, queued_at)}, insertion ordered
+        self._queues: dict[str, dict[tuple[str, str], tuple[Any, float]]] = {}
+        self._lock = asyncio.Lock()
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Load the commands queued before a restart."""
+        stored = await self._store.async_load() or {}
+        for iotid, commands in stored.get("devices", {}).items():
+            self._queues[iotid] = {
+                (kind, key): (value, queued_at)
+                for kind, key, value, queued_at in commands
+                # Actions queued by older versions are never replayed
+                if not (kind == COMMAND_PROPERTY and key in ACTION_PROPERTIES)
+            }
+        if self.pending:
+            _LOGGER.info("Loaded %d queued Furbulous command(s)", self.pending)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of queued commands over all devices."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def depth(self, iotid: str) -> int:
+        """Return the number of commands queued for a device."""
+        return len(self._queues.get(iotid, ()))
+
+    def oldest(self, iotid: str) -> float | None:
+        """Return when the oldest queued command of a device was issued."""
+        queue = self._queues.get(iotid)
+        if not queue:
+            return None
+        return min(queued_at for _, queued_at in queue.values())
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call update_callback whenever a queue changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_changed(self) -> None:
+        """Persist the queues and notify listeners."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def async_set_property(self, iotid: str, properties: dict[str, Any]) -> bool:
+        """Set device properties now, or queue them when offline.
+
+        Returns False only when the cloud rejected the command.
+        """
+        return await self._async_send(iotid, [(COMMAND_PROPERTY, key, value) for key, value in properties.items()])
+
+    async def async_set_disturb(self, iotid: str, is_disturb: bool) -> bool:
+        """Set Do Not Disturb now, or queue it when offline."""
+        return await self._async_send(iotid, [(COMMAND_DISTURB, "is_disturb", is_disturb)])
+
+    async def async_send_action(self, iotid: str, properties: dict[str, Any]) -> bool:
+        """Trigger a one-shot action now, never queuing it."""
+        try:
+            return await self._executor.async_run(self._api.set_device_property, iotid, properties)
+        except FurbulousCatConnectionError as err:
+            raise HomeAssistantError(f"Furbulous cloud unreachable, action not sent: {err}") from err
+
+    async def _async_send(self, iotid: str, commands: list[tuple[str, str, Any]]) -> bool:
+        """Send commands unless the device already has a backlog."""
+        if self.depth(iotid):
+            self._async_enqueue(iotid, commands)
+            return True
+
+        for index, (kind, key, value) in enumerate(commands):
+            try:
+                if not await self._async_execute(iotid, kind, key, value):
+                    return False
+            except FurbulousCatConnectionError as err:
+                _LOGGER.warning("Furbulous cloud unreachable, queuing command for %s: %s", iotid, err)
+                self._async_enqueue(iotid, commands[index:])
+                return True
+        return True
+
+    async def _async_execute(self, iotid: str, kind: str, key: str, value: Any) -> bool:
+        """Send a single command in the worker pool."""
+        if kind == COMMAND_DISTURB:
+            return await self._executor.async_run(self._api.set_device_disturb, iotid, value)
+        return await self._executor.async_run(self._api.set_device_property, iotid, {key: value})
+
+    @callback
+    def _async_enqueue(self, iotid: str, commands: list[tuple[str, str, Any]]) -> None:
+        """Append commands, replacing queued writes of the same property."""
+        queue = self._queues.setdefault(iotid, {})
+        now = time.time()
+        for kind, key, value in commands:
+            queue.pop((kind, key), None)
+            queue[(kind, key)] = (value, now)
+        _LOGGER.info("%d command(s) queued for %s", len(queue), iotid)
+        self._async_changed()
+
+    @callback
+    def async_schedule_replay(self) -> None:
+        """Replay queued commands in a background task cancelled on unload."""
+        if self.pending and not self._lock.locked():
+            self._entry.async_create_background_task(
+                self.hass, self.async_replay(), f"{DOMAIN} command replay"
+            )
+
+    async def async_replay(self) -> None:
+        """Send queued commands in order, stopping at the first connection error."""
+        async with self._lock:
+            for iotid in list(self._queues):
+                queue = self._queues[iotid]
+                while queue:
+                    (kind, key), (value, queued_at) = next(iter(queue.items()))
+                    if time.time() - queued_at > COMMAND_QUEUE_MAX_AGE:
+                        _LOGGER.warning("Dropping stale queued command %s=%s for %s", key, value, iotid)
+                    else:
+                        try:
+                            sent = await self._async_execute(iotid, kind, key, value)
+                        except (FurbulousCatConnectionError, FurbulousCatBusyError) as err:
+                            _LOGGER.debug("Keeping queued commands for the next refresh: %s", err)
+                            return
+                        if sent:
+                            _LOGGER.info("Replayed queued command %s=%s for %s", key, value, iotid)
+                        else:
+                            _LOGGER.error("Queued command %s=%s for %s was rejected", key, value, iotid)
+                    # The entry may have been replaced by a newer write meanwhile
+                    if queue.get((kind, key)) == (value, queued_at):
+                        del queue[(kind, key)]
+                    self._async_changed()
+                del self._queues[iotid]
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "devices": {
+                iotid: [[kind, key, value, queued_at] for (kind, key), (value, queued_at) in queue.items()]
+                for iotid, queue in self._queues.items()
+                if queue
+            }
+        }
@@ -4,25 +4,51 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import requests
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import CONF_ACCOUNT_TYPE, CONF_TOKEN, DEFAULT_ACCOUNT_TYPE, DOMAIN
-from .furbulous_api import FurbulousCatAPI, FurbulousCatAuthError
+from .const import (
+    CONF_ACCOUNT_TYPE,
+    CONF_ENTITY_PROFILE,
+    CONF_POLL_MODE,
+    CONF_PREWARM,
+    CONF_PROFILING,
+    CONF_RECORD_CASSETTE,
+    CONF_REGION,
+    CONF_TOKEN,
+    CONF_WATCHDOG_RECOVER,
+    API_REGIONS,
+    DEFAULT_ACCOUNT_TYPE,
+    DEFAULT_POLL_MODE,
+    DOMAIN,
+    ENTITY_PROFILES,
+    POLL_MODES,
+    REGION_AUTO,
+    REGIONS,
+)
+from .furbulous_api import (
+    FurbulousCatAPI,
+    FurbulousCatAuthError,
+    FurbulousCatSignatureError,
+    probe_regions,
+)
+from .profiles import entity_profile
+from .transport import create_session
 
 _LOGGER = logging.getLogger(__name__)
 
-from .const import CONF_ACCOUNT_TYPE, CONF_TOKEN, DEFAULT_ACCOUNT_TYPE, DOMAIN
-
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_TOKEN): str,
         vol.Optional(CONF_EMAIL): str,
         vol.Optional(CONF_PASSWORD): str,
         vol.Optional(CONF_ACCOUNT_TYPE, default=DEFAULT_ACCOUNT_TYPE): int,
+        vol.Optional(CONF_REGION, default=REGION_AUTO): vol.In(REGIONS),
     }
 )
 
@@ -32,6 +58,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -45,23 +79,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
                 # Check if user provided a token directly
                 if CONF_TOKEN in user_input and user_input[CONF_TOKEN]:
                     _LOGGER.debug("Using token authentication")
-                    api = FurbulousCatAPI(
-                        email="",
-                        password="",
-                        account_type=DEFAULT_ACCOUNT_TYPE,
-                        token=user_input[CONF_TOKEN]
+                    region = await self._async_validate_token(
+                        user_input[CONF_TOKEN], user_input.get(CONF_REGION, REGION_AUTO)
                     )
-                    
-                    _LOGGER.debug("Testing token by fetching device list")
-                    devices = await self.hass.async_add_executor_job(api.get_devices)
-                    _LOGGER.info("Token validated successfully, found %d devices", len(devices))
-                    
+
                     await self.async_set_unique_id(f"furbulous_token_{user_input[CONF_TOKEN][:10]}")
                     self._abort_if_unique_id_configured()
                     
                     return self.async_create_entry(
                         title="Furbulous Cat (Token)",
-                        data={CONF_TOKEN: user_input[CONF_TOKEN]},
+                        data={CONF_TOKEN: user_input[CONF_TOKEN], CONF_REGION: region},
                     )
                 
                 # Otherwise use email/password authentication
@@ -76,28 +103,24 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
                         errors=errors,
                     )
                 
-                api = FurbulousCatAPI(
-                    email=user_input[CONF_EMAIL],
-                    password=user_input[CONF_PASSWORD],
-                    account_type=user_input.get(CONF_ACCOUNT_TYPE, DEFAULT_ACCOUNT_TYPE)
-                    # REMOVED: region=user_input.get(CONF_REGION, DEFAULT_REGION)
-                )
-                
                 _LOGGER.debug("Attempting authentication for email: %s", user_input[CONF_EMAIL])
-                await self.hass.async_add_executor_job(api.authenticate)
-                _LOGGER.info("Authentication successful for %s", user_input[CONF_EMAIL])
+                region = await self._async_authenticate(user_input)
+                _LOGGER.info("Authentication successful for %s in region %s", user_input[CONF_EMAIL], region)
 
                 await self.async_set_unique_id(user_input[CONF_EMAIL])
                 self._abort_if_unique_id_configured()
 
                 return self.async_create_entry(
                     title=f"Furbulous Cat ({user_input[CONF_EMAIL]})",
-                    data=user_input,
+                    data={**user_input, CONF_REGION: region},
                 )
 
             except FurbulousCatAuthError as err:
                 _LOGGER.error("Authentication failed: %s", err)
                 errors["base"] = "invalid_auth"
+            except FurbulousCatSignatureError as err:
+                _LOGGER.error("Request signature rejected, check the system clock: %s", err)
+                errors["base"] = "clock_skew"
             except Exception as err:
                 _LOGGER.exception("Unexpected exception during config flow: %s", err)
                 errors["base"] = "unknown"
@@ -106,4 +129,121 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
             step_id="user",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+    async def _async_candidate_regions(self, region: str, session: requests.Session) -> list[str]:
+        """Return the regions to try, fastest first when probing.
+
+        The probe result is only used here; the region the account logs in
+        to is stored in the entry so later startups never probe again.
+        """
+        if region != REGION_AUTO:
+            return [region]
+        latencies = await self.hass.async_add_executor_job(probe_regions, session)
+        _LOGGER.debug("Region latencies: %s", {key: round(value * 1000) for key, value in latencies.items()})
+        # Unreachable regions are tried last, the probe may be filtered upstream
+        return [*latencies, *(key for key in API_REGIONS if key not in latencies)]
+
+    async def _async_authenticate(self, user_input: dict[str, Any]) -> str:
+        """Log in to the first candidate region that accepts the account."""
+        error: FurbulousCatAuthError | None = None
+        # One short-lived session for the probe and every attempt, closed afterwards
+        session = create_session(1)
+        try:
+            for region in await self._async_candidate_regions(user_input.get(CONF_REGION, REGION_AUTO), session):
+                api = FurbulousCatAPI(
+                    email=user_input[CONF_EMAIL],
+                    password=user_input[CONF_PASSWORD],
+                    account_type=user_input.get(CONF_ACCOUNT_TYPE, DEFAULT_ACCOUNT_TYPE),
+                    session=session,
+                    region=region,
+                )
+                try:
+                    await self.hass.async_add_executor_job(api.authenticate)
+                except FurbulousCatAuthError as err:
+                    _LOGGER.debug("Login rejected in region %s: %s", region, err)
+                    error = err
+                    continue
+                return region
+        finally:
+            await self.hass.async_add_executor_job(session.close)
+        raise error or FurbulousCatAuthError("No region available")
+
+    async def _async_validate_token(self, token: str, region: str) -> str:
+        """Return the first candidate region where the token lists devices."""
+        fallback = None
+        # One short-lived session for the probe and every attempt, closed afterwards
+        session = create_session(1)
+        try:
+            for candidate in await self._async_candidate_regions(region, session):
+                api = FurbulousCatAPI(
+                    email="",
+                    password="",
+                    account_type=DEFAULT_ACCOUNT_TYPE,
+                    token=token,
+                    session=session,
+                    region=candidate,
+                )
+                _LOGGER.debug("Testing token by fetching device list in region %s", candidate)
+                try:
+                    devices = await self.hass.async_add_executor_job(api.get_devices)
+                except Exception as err:  # noqa: BLE001 - try the next region
+                    _LOGGER.debug("Token rejected in region %s: %s", candidate, err)
+                    continue
+                if devices:
+                    _LOGGER.info("Token validated successfully, found %d devices", len(devices))
+                    return candidate
+                fallback = fallback or candidate
+        finally:
+            await self.hass.async_add_executor_job(session.close)
+        if fallback is None:
+            raise FurbulousCatAuthError("Token rejected in every region")
+        return fallback
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Furbulous Cat options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_POLL_MODE,
+                        default=options.get(CONF_POLL_MODE, DEFAULT_POLL_MODE),
+                    ): vol.In(POLL_MODES),
+                    vol.Optional(
+                        CONF_ENTITY_PROFILE,
+                        default=entity_profile(self._entry),
+                    ): vol.In(ENTITY_PROFILES),
+                    vol.Optional(
+                        CONF_PREWARM,
+                        default=options.get(CONF_PREWARM, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_WATCHDOG_RECOVER,
+                        default=options.get(CONF_WATCHDOG_RECOVER, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PROFILING,
+                        default=options.get(CONF_PROFILING, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_RECORD_CASSETTE,
+                        default=options.get(CONF_RECORD_CASSETTE, False),
+                    ): bool,
+                }
+            ),
+        )
@@ -7,6 +7,42 @@ API_BASE_URL = "https://app.api.us.furbulouspet.com:1443"
 API_AUTH_ENDPOINT = "/app/v1/auth/login"
 API_DEVICE_LIST_ENDPOINT = "/app/v1/device/list"
 API_DEVICE_PROPERTIES_ENDPOINT = "/app/v1/device/properties/get"
+API_DEVICE_PUSH_UNREAD_ENDPOINT = "/app/v1/user/devicePushRecord/unread"
+
+# Regional API endpoints and the login payload fields that go with them
+REGION_AUTO = "auto"  # Probe latency and pick the fastest region the account logs in to
+REGION_US = "us"
+REGION_EU = "eu"
+API_REGIONS = {
+    REGION_US: {"base_url": API_BASE_URL, "iso": "US", "area": "1"},
+    REGION_EU: {"base_url": "https://app.api.fr.furbulouspet.com:1443", "iso": "DE", "area": "EU"},
+}
+REGIONS = [REGION_AUTO, *API_REGIONS]
+REGION_PROBE_TIMEOUT = 3  # seconds per endpoint
+
+# Device properties read by entities and visit detection; the rest of the
+# properties payload is not extracted
+CONSUMED_PROPERTIES = frozenset({
+    "workstatus",
+    "catWeight",
+    "errorReportEvent",
+    "completionStatus",
+    "handMode",
+    "excreteTimesEveryday",
+    "excreteTimerEveryday",
+    "catLitterType",
+    "FullAutoModeSwitch",
+    "catCleanOnOff",
+    "childLockOnOff",
+    "masterSleepOnOff",
+    "DisplaySwitch",
+    "mcuversion",
+    "wifivertion",
+    "trdversion",
+})
+
+# Firmware version strings, only shown by the full entity profile
+VERSION_PROPERTIES = frozenset({"mcuversion", "wifivertion", "trdversion"})
 
 # API Headers
 API_APPID = "a0baae0630f444b0811ea3c2eb212179"
@@ -17,9 +53,92 @@ API_USER_AGENT = "Furbulous/2.0.1 (com.furbulous.pet; build:202507031750; iOS 26
 # Configuration
 CONF_ACCOUNT_TYPE = "account_type"
 CONF_TOKEN = "token"
+CONF_POLL_MODE = "poll_mode"
+CONF_PROFILING = "profiling"
+CONF_RECORD_CASSETTE = "record_cassette"
+CONF_PREWARM = "prewarm"
+CONF_REGION = "region"
+CONF_ENTITY_PROFILE = "entity_profile"
+CONF_WATCHDOG_RECOVER = "watchdog_recover"
+CONF_BASE_URL = "base_url"  # Override of the API base URL (testing and self-hosted mirrors)
+
+# Poll modes for the fast coordinator
+POLL_MODE_FULL = "full"  # Fetch everything every cycle
+POLL_MODE_PUSH_GATED = "push_gated"  # Only check the unread push counter while idle
+POLL_MODES = [POLL_MODE_FULL, POLL_MODE_PUSH_GATED]
+
+# Entity profiles, each one a superset of the previous
+ENTITY_PROFILE_MINIMAL = "minimal"  # Core state and controls only
+ENTITY_PROFILE_STANDARD = "standard"  # Adds statistics and diagnostics
+ENTITY_PROFILE_FULL = "full"  # Adds redundant views of settings and firmware versions
+ENTITY_PROFILES = [ENTITY_PROFILE_MINIMAL, ENTITY_PROFILE_STANDARD, ENTITY_PROFILE_FULL]
+
+# Services
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+
+# Events
+EVENT_PROPERTY_CHANGED = f"{DOMAIN}_property_changed"
+EVENT_COORDINATOR_STALLED = f"{DOMAIN}_coordinator_stalled"
+EVENT_ERROR_FLAG_CHANGED = f"{DOMAIN}_error_flag_changed"
+
+# Dispatcher signal sent with (field, ids) when devices or pets are retired,
+# formatted with the config entry id
+SIGNAL_ITEMS_RETIRED = f"{DOMAIN}_items_retired_{{}}"
 
 # Default values
 DEFAULT_ACCOUNT_TYPE = 1
+DEFAULT_POLL_MODE = POLL_MODE_FULL
+DEFAULT_REGION = REGION_US
+DEFAULT_ENTITY_PROFILE = ENTITY_PROFILE_FULL  # Existing installs keep every entity
+
+# Profiling
+PROFILING_REPORT_SIZE = 20  # Slowest entities listed in diagnostics
+
+# Full refresh interval in push-gated mode even when the counter did not move
+PUSH_GATE_SAFETY_INTERVAL = 120  # seconds
+PUSH_GATE_MAX_FAILURES = 3  # Consecutive unread counter failures before gating is turned off
+
+# Request timeouts
+REQUEST_TIMEOUT = 10  # seconds, upper bound of a single request
+CLOCK_SKEW_TOLERANCE = 2  # seconds of clock difference ignored when signing
+POLL_DEADLINE_FRACTION = 0.8  # Share of the update interval a refresh may take
+
+# Dedicated worker pool for blocking API calls (per config entry)
+EXECUTOR_MAX_WORKERS = 4
+EXECUTOR_MAX_QUEUE = 16  # Waiting jobs before new ones are rejected
+
+# API traffic recording
+CASSETTE_MAX_BYTES = 50 * 1024 * 1024  # Uncompressed bytes recorded before the cassette is closed
+CASSETTE_MAX_AGE = 24 * 3600  # seconds of traffic recorded before the cassette is closed
+
+# Offline command queue
+COMMAND_QUEUE_MAX_AGE = 3600  # seconds, older queued commands are dropped instead of replayed
+
+# Coordinator watchdog
+WATCHDOG_INTERVAL = 30  # seconds between checks
+WATCHDOG_HUNG_FACTOR = 3  # Update intervals a single refresh may run before it counts as hung
+WATCHDOG_STALE_FACTOR = 10  # Update intervals without a successful refresh before it counts as stalled
+
+# HTTP transport
+PREWARM_LEAD = 2  # seconds before a scheduled poll to open the connection
+
+# Weight statistics
+WEIGHT_EWMA_ALPHA = 0.3  # Smoothing factor for the weight moving average
+WEIGHT_HISTORY_SIZE = 256  # Visits kept per box or pet (covers 30 days for a typical cat)
+WEIGHT_MEDIAN_WINDOW = 9  # Visits used for the rolling median
+
+# Daily usage windows
+USAGE_WINDOWS = (7, 30)  # Days covered by the usage average/min/max sensors
+
+# Waste bin fill prediction
+BIN_CAPACITY_LEARNING_RATE = 0.3  # How fast the learned cycles-to-full follows new observations
+
+# Multi-cat attribution
+ATTRIBUTION_LEARNING_RATE = 0.1  # How fast a pet's weight centroid follows its visits
+ATTRIBUTION_MAX_DEVIATION = 0.35  # Visits further than this fraction from every pet stay unassigned
+
+# Long-term statistics import
+STATISTICS_DAILY_RETENTION = 30  # Closed daily totals kept for the usage windows
 
 # Device Types
 PRODUCT_FURBULOUS_BOX = 1
@@ -41,7 +160,7 @@ LITTER_TYPE = {
     2: "Mixed",
 }
 
-# Error Codes (errorReportEvent values)
+# Error Codes (errorReportEvent bit flags, several can be set at once)
 # Based on analysis of app code and common IoT error patterns
 ERROR_CODES = {
     0: "No error",
@@ -76,5 +195,6 @@ ERROR_SEVERITY = {
 
 # Unit of measurement
 UNIT_GRAMS = "g"
+UNIT_GRAMS_PER_DAY = "g/d"
 UNIT_SECONDS = "s"
 UNIT_TIMES = "times"
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""JSON decoding of API responses, using orjson when it is available."""
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonLoads = Callable[[bytes], Any]
+
+
+def get_decoder() -> tuple[str, JsonLoads]:
+    """Return the name and loads function of the fastest available decoder."""
+    if orjson is not None:
+        return "orjson", orjson.loads
+    return "json", json.loads
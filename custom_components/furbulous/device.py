@@ -1,6 +1,8 @@
 """Device handling for Furbulous Cat integration."""
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN
@@ -16,3 +18,11 @@ def get_device_info(device_data: dict) -> DeviceInfo:
         sw_version=device_data.get("version"),
         configuration_url="https://app.furbulouspet.com",
     )
+
+
+def property_value(properties: dict[str, Any], key: str) -> Any:
+    """Return a property value whether or not it is wrapped in {"value": ...}."""
+    prop = properties.get(key)
+    if isinstance(prop, dict):
+        return prop.get("value")
+    return prop
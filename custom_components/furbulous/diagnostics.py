@@ -0,0 +1,46 @@
+"""Diagnostics support for Furbulous Cat."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_TOKEN, DOMAIN
+from .transport import transport_stats
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN, "identity_id", "username"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime = hass.data[DOMAIN][entry.entry_id]
+    store = runtime["store"]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "snapshot": {
+            "version": store.version,
+            "field_versions": store.field_versions,
+            "device_count": len(store.data.get("devices", [])),
+            "pet_count": len(store.data.get("pets", [])),
+        },
+        "api": {
+            "base_url": runtime["coordinator"].api.base_url,
+            "clock_offset_s": round(runtime["coordinator"].api.clock_offset, 1),
+            "json_decoder": runtime["coordinator"].api.decoder,
+            "transport": transport_stats(runtime["coordinator"].api.session),
+        },
+        "executor": runtime["executor"].metrics(),
+        "queued_commands": runtime["command_queue"].pending,
+        "fleet": runtime["fleet"].totals,
+        "watchdog": runtime["watchdog"].as_dict(),
+        "profiling": runtime["profiler"].report(),
+    }
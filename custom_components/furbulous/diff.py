@@ -0,0 +1,88 @@
+"""Structural diff between consecutive coordinator snapshots."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+CHANGE_DEVICE_ADDED = "device_added"
+CHANGE_DEVICE_REMOVED = "device_removed"
+CHANGE_PROPERTY = "property_changed"
+
+# Nested device fields handled separately or not worth reporting
+_SKIPPED_DEVICE_FIELDS = {"properties", "daily_stats"}
+
+
+@dataclass
+class SnapshotChange:
+    """One change between two snapshots."""
+
+    change_type: str
+    device_id: int | None
+    iotid: str | None
+    key: str | None = None
+    old_value: Any = None
+    new_value: Any = None
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return the change as event data."""
+        return asdict(self)
+
+
+def _diff_mapping(
+    changes: list[SnapshotChange],
+    device_id: int | None,
+    iotid: str | None,
+    old: dict[str, Any],
+    new: dict[str, Any],
+    skipped: set[str] | None = None,
+) -> None:
+    """Append a change for every key whose value differs."""
+    if old is new:
+        return
+    for key in old.keys() | new.keys():
+        if skipped and key in skipped:
+            continue
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value != new_value:
+            changes.append(
+                SnapshotChange(CHANGE_PROPERTY, device_id, iotid, key, old_value, new_value)
+            )
+
+
+def diff_snapshots(old: dict[str, Any] | None, new: dict[str, Any]) -> list[SnapshotChange]:
+    """Return the changes between two get_data snapshots.
+
+    Unchanged snapshots and unchanged devices are detected by identity first,
+    so an idle poll costs O(1).
+    """
+    if old is None or old is new:
+        return []
+
+    old_devices = {device.get("id"): device for device in old.get("devices", [])}
+    new_devices = {device.get("id"): device for device in new.get("devices", [])}
+    changes: list[SnapshotChange] = []
+
+    for device_id, device in new_devices.items():
+        previous = old_devices.get(device_id)
+        if previous is None:
+            changes.append(SnapshotChange(CHANGE_DEVICE_ADDED, device_id, device.get("iotid")))
+            continue
+        if previous is device:
+            continue
+
+        iotid = device.get("iotid")
+        _diff_mapping(changes, device_id, iotid, previous, device, _SKIPPED_DEVICE_FIELDS)
+        _diff_mapping(
+            changes,
+            device_id,
+            iotid,
+            previous.get("properties") or {},
+            device.get("properties") or {},
+        )
+
+    for device_id, device in old_devices.items():
+        if device_id not in new_devices:
+            changes.append(SnapshotChange(CHANGE_DEVICE_REMOVED, device_id, device.get("iotid")))
+
+    return changes
@@ -0,0 +1,116 @@
+"""Runtime discovery of new and removed devices and pets."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, SIGNAL_ITEMS_RETIRED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_track_new_items(
+    entry: ConfigEntry,
+    coordinator: DataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    field: str,
+    id_key: str,
+    build: Callable[[dict[str, Any]], Iterable[Entity]],
+) -> None:
+    """Add entities for every item of a snapshot list not seen before.
+
+    Runs once immediately and again each time the coordinator reports a
+    change, so boxes and pets added to the account show up without a reload.
+    Items are only forgotten once async_track_removed_items retires them, so
+    an empty list from a failed request does not re-add every entity; a
+    retired item gets fresh entities if it returns.
+    """
+    known: set[Any] = set()
+
+    @callback
+    def _async_retired(retired_field: str, ids: set[Any]) -> None:
+        if retired_field == field:
+            known.difference_update(ids)
+
+    @callback
+    def _async_check() -> None:
+        items = [item for item in coordinator.snapshot.get(field, []) if item.get(id_key) is not None]
+
+        entities: list[Entity] = []
+        for item in items:
+            item_id = item.get(id_key)
+            if item_id in known:
+                continue
+            known.add(item_id)
+            entities.extend(build(item))
+
+        if entities:
+            _LOGGER.debug("Adding %d entities for new %s", len(entities), field)
+            async_add_entities(entities)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(coordinator.hass, SIGNAL_ITEMS_RETIRED.format(entry.entry_id), _async_retired)
+    )
+    _async_check()
+    entry.async_on_unload(coordinator.async_add_listener(_async_check))
+
+
+@callback
+def async_track_removed_items(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: DataUpdateCoordinator
+) -> CALLBACK_TYPE:
+    """Retire the registry entries of devices and pets removed from the account.
+
+    Returns the function that stops tracking.
+    """
+    known_devices = {device.get("id") for device in coordinator.snapshot.get("devices", [])}
+    known_pets = {pet.get("pet_id") for pet in coordinator.snapshot.get("pets", [])}
+
+    @callback
+    def _async_check() -> None:
+        nonlocal known_devices, known_pets
+        devices = {device.get("id") for device in coordinator.snapshot.get("devices", [])}
+        pets = {pet.get("pet_id") for pet in coordinator.snapshot.get("pets", [])}
+
+        # An empty list is indistinguishable from a failed request, never
+        # retire everything at once
+        if devices:
+            device_registry = dr.async_get(hass)
+            removed_devices = known_devices - devices
+            for device_id in removed_devices:
+                device_entry = device_registry.async_get_device(identifiers={(DOMAIN, str(device_id))})
+                if device_entry:
+                    _LOGGER.info("Device %s was removed from the account, retiring it", device_id)
+                    device_registry.async_update_device(
+                        device_entry.id, remove_config_entry_id=entry.entry_id
+                    )
+            if removed_devices:
+                async_dispatcher_send(hass, SIGNAL_ITEMS_RETIRED.format(entry.entry_id), "devices", removed_devices)
+            known_devices = devices
+
+        if pets:
+            entity_registry = er.async_get(hass)
+            removed_pets = known_pets - pets
+            removed = {f"furbulous_pet_{pet_id}" for pet_id in removed_pets}
+            if removed:
+                for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+                    unique_id = entity_entry.unique_id
+                    if unique_id in removed or any(
+                        unique_id.startswith(f"{prefix}_") for prefix in removed
+                    ):
+                        _LOGGER.info("Pet entity %s was removed from the account, retiring it", entity_entry.entity_id)
+                        entity_registry.async_remove(entity_entry.entity_id)
+                async_dispatcher_send(hass, SIGNAL_ITEMS_RETIRED.format(entry.entry_id), "pets", removed_pets)
+            known_pets = pets
+
+    return coordinator.async_add_listener(_async_check)
@@ -0,0 +1,120 @@
+"""Decoding of the errorReportEvent bitmask."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any
+
+from .const import ERROR_CODES, ERROR_SEVERITY
+from .device import property_value
+
+# Flags meaning the litter or the waste bin is full
+BIN_FULL_MASK = 16 | 32
+
+# Severities from least to most serious
+_SEVERITY_ORDER = ("info", "unknown", "warning", "error")
+
+
+def error_value(properties: dict[str, Any]) -> int:
+    """Return the errorReportEvent value of a properties dict, 0 when missing."""
+    try:
+        return int(property_value(properties, "errorReportEvent") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@lru_cache(maxsize=256)
+def active_flags(code: int) -> tuple[int, ...]:
+    """Return the flags set in an error code, lowest first."""
+    return tuple(1 << bit for bit in range(code.bit_length()) if code >> bit & 1)
+
+
+def flag_description(flag: int) -> str:
+    """Return the description of a single flag."""
+    return ERROR_CODES.get(flag, f"Error {flag}")
+
+
+def flag_severity(flag: int) -> str:
+    """Return the severity of a single flag."""
+    return ERROR_SEVERITY.get(flag, "unknown")
+
+
+@lru_cache(maxsize=256)
+def describe(code: int) -> str:
+    """Return the descriptions of every flag set in an error code."""
+    if not code:
+        return ERROR_CODES[0]
+    return ", ".join(flag_description(flag) for flag in active_flags(code))
+
+
+@lru_cache(maxsize=256)
+def severity(code: int) -> str:
+    """Return the most serious severity of the flags set in an error code."""
+    if not code:
+        return ERROR_SEVERITY[0]
+    return max((flag_severity(flag) for flag in active_flags(code)), key=_SEVERITY_ORDER.index)
+
+
+def is_bin_full(code: int) -> bool:
+    """Return whether the litter or the waste bin is reported full."""
+    return bool(code & BIN_FULL_MASK)
+
+
+@dataclass
+class ErrorFlagChange:
+    """One error flag that was set or cleared."""
+
+    device_id: int | None
+    iotid: str | None
+    flag: int
+    active: bool
+    description: str
+    severity: str
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return the change as event data."""
+        return asdict(self)
+
+
+class ErrorFlagTracker:
+    """Track the error flags of every device between snapshots.
+
+    Only the devices a refresh changed are passed in, and the flags that
+    moved are found with a single XOR against the previous code. The first
+    code seen for a device is the baseline and is not reported.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._codes: dict[Any, int] = {}
+
+    def process(self, devices: list[dict[str, Any]]) -> list[ErrorFlagChange]:
+        """Return the flags set or cleared in the given device dicts."""
+        changes: list[ErrorFlagChange] = []
+        for device in devices:
+            properties = device.get("properties")
+            if properties is None:
+                continue
+            device_id = device.get("id")
+            code = error_value(properties)
+            previous = self._codes.get(device_id)
+            self._codes[device_id] = code
+            if previous is None or previous == code:
+                continue
+            for flag in active_flags(previous ^ code):
+                changes.append(
+                    ErrorFlagChange(
+                        device_id,
+                        device.get("iotid"),
+                        flag,
+                        bool(code & flag),
+                        flag_description(flag),
+                        flag_severity(flag),
+                    )
+                )
+        return changes
+
+    def forget(self, device_ids: list[Any]) -> None:
+        """Drop the codes of removed devices."""
+        for device_id in device_ids:
+            self._codes.pop(device_id, None)
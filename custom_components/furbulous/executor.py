@@ -0,0 +1,114 @@
+"""Bounded worker pool for the blocking API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class FurbulousCatBusyError(HomeAssistantError):
+    """Raised when the worker pool queue is full."""
+
+
+class FurbulousExecutor:
+    """Dedicated thread pool so a cloud outage cannot starve Home Assistant.
+
+    Jobs beyond ``max_queue`` waiting jobs are rejected. Jobs submitted with
+    a coalesce key share the result of an identical job already in flight
+    instead of queuing a duplicate.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        """Initialize the pool."""
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"furbulous_{name}")
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._pending = 0
+        self._running = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._coalesced = 0
+
+    @property
+    def queued(self) -> int:
+        """Return the number of jobs waiting for a worker."""
+        return self._pending - self._running
+
+    def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a job in a worker thread and keep the counters."""
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _job_done(self, _future: Future) -> None:
+        """Account for a finished or cancelled job."""
+        with self._lock:
+            self._pending -= 1
+
+    async def async_run(
+        self, func: Callable[..., _T], *args: Any, coalesce_key: Hashable | None = None
+    ) -> _T:
+        """Run a blocking call in the pool and return its result."""
+        if coalesce_key is not None and (inflight := self._inflight.get(coalesce_key)) is not None:
+            self._coalesced += 1
+            return await asyncio.shield(inflight)
+
+        if self.queued >= self.max_queue:
+            self._rejected += 1
+            _LOGGER.warning("Furbulous worker pool saturated (%d queued), rejecting %s", self.queued, getattr(func, "__name__", func))
+            raise FurbulousCatBusyError("Too many pending Furbulous API requests")
+
+        with self._lock:
+            self._pending += 1
+        self._max_queued = max(self._max_queued, self.queued)
+
+        job = self._pool.submit(self._run, func, *args)
+        job.add_done_callback(self._job_done)
+        future = asyncio.wrap_future(job)
+        if coalesce_key is not None:
+            self._inflight[coalesce_key] = future
+        try:
+            result = await future
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            if coalesce_key is not None and self._inflight.get(coalesce_key) is future:
+                del self._inflight[coalesce_key]
+        self._completed += 1
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue-depth and throughput counters."""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "running": self._running,
+            "queued": self.queued,
+            "max_queued": self._max_queued,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "coalesced": self._coalesced,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting for in-flight requests."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
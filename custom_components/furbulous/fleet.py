@@ -0,0 +1,65 @@
+"""Account-level aggregates maintained from per-device changes."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from .device import property_value
+from .errors import error_value, is_bin_full
+from .visits import WORKSTATUS_CAT_DETECTED
+
+FLEET_DAILY_USES = "daily_uses"
+FLEET_IN_ERROR = "in_error"
+FLEET_BINS_FULL = "bins_full"
+FLEET_OCCUPIED = "occupied"
+FLEET_OFFLINE = "offline"
+FLEET_FIELDS = (FLEET_DAILY_USES, FLEET_IN_ERROR, FLEET_BINS_FULL, FLEET_OCCUPIED, FLEET_OFFLINE)
+
+
+def device_contribution(device: dict[str, Any]) -> dict[str, int]:
+    """Return what a single device adds to each aggregate."""
+    properties = device.get("properties") or {}
+    error_code = error_value(properties)
+    return {
+        FLEET_DAILY_USES: int(device.get("daily_uses_actual") or 0),
+        FLEET_IN_ERROR: int(error_code != 0),
+        FLEET_BINS_FULL: int(is_bin_full(error_code)),
+        FLEET_OCCUPIED: int(property_value(properties, "workstatus") == WORKSTATUS_CAT_DETECTED),
+        FLEET_OFFLINE: int(device.get("device_online") != 1),
+    }
+
+
+class FleetAggregates:
+    """Totals over every box of an account.
+
+    Each device's contribution is remembered, so an update only subtracts
+    the old and adds the new contribution of the devices that changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self._contributions: dict[Any, dict[str, int]] = {}
+        self.totals: dict[str, int] = dict.fromkeys(FLEET_FIELDS, 0)
+
+    def update(self, changed: Iterable[dict[str, Any]], removed: Iterable[Any] = ()) -> None:
+        """Apply changed device dicts and removed device ids."""
+        for device_id in removed:
+            self._replace(device_id, None)
+        for device in changed:
+            self._replace(device.get("id"), device_contribution(device))
+
+    def _replace(self, device_id: Any, contribution: dict[str, int] | None) -> None:
+        """Swap the contribution of one device."""
+        previous = self._contributions.pop(device_id, None)
+        if previous is not None:
+            for field, value in previous.items():
+                self.totals[field] -= value
+        if contribution is not None:
+            self._contributions[device_id] = contribution
+            for field, value in contribution.items():
+                self.totals[field] += value
+
+    @property
+    def device_count(self) -> int:
+        """Return the number of devices counted."""
+        return len(self._contributions)
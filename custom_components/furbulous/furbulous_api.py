@@ -3,20 +3,32 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import threading
 import time
 import requests
+from email.utils import parsedate_to_datetime
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from .const import (
-    API_BASE_URL,
     API_AUTH_ENDPOINT,
     API_DEVICE_LIST_ENDPOINT,
     API_DEVICE_PROPERTIES_ENDPOINT,
+    API_DEVICE_PUSH_UNREAD_ENDPOINT,
     API_APPID,
     API_VERSION,
     API_PLATFORM,
     API_USER_AGENT,
+    API_REGIONS,
+    CLOCK_SKEW_TOLERANCE,
+    DEFAULT_REGION,
+    EXECUTOR_MAX_WORKERS,
+    REGION_PROBE_TIMEOUT,
+    REQUEST_TIMEOUT,
 )
+from .decoder import JsonLoads, get_decoder
+from .transport import create_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +37,188 @@ class FurbulousCatAuthError(Exception):
     """Exception raised for authentication errors."""
 
 
+class FurbulousCatDeadlineError(Exception):
+    """Exception raised when a refresh runs out of time."""
+
+
+class FurbulousCatConnectionError(Exception):
+    """Exception raised when the cloud cannot be reached."""
+
+
+class FurbulousCatSignatureError(Exception):
+    """Exception raised when the server rejects the request signature.
+
+    Usually caused by a local clock too far from the server clock; the
+    token is still valid, so this must not trigger re-authentication.
+    """
+
+
+# Fragments of error messages returned for a bad signature or timestamp
+# ("签名" = signature, "时间戳" = timestamp). A bare "sign" would also match
+# "please sign in again", which is a token error.
+_SIGNATURE_ERROR_HINTS = (
+    "signature",
+    "sign error",
+    "sign invalid",
+    "invalid sign",
+    "timestamp",
+    "签名",
+    "时间戳",
+)
+
+
+def _is_signature_error(result: dict) -> bool:
+    """Return True when an API error is about the signature, not the token."""
+    message = str(result.get("message", "")).lower()
+    return any(hint in message for hint in _SIGNATURE_ERROR_HINTS)
+
+
+def _is_cloud_outage(err: requests.exceptions.RequestException) -> bool:
+    """Return True when a request failed because the cloud is down, not rejected.
+
+    Connection errors, timeouts and 5xx server errors all mean the command
+    may succeed later.
+    """
+    if isinstance(err, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    response = getattr(err, "response", None)
+    return response is not None and response.status_code >= 500
+
+
+def _is_token_error(result: dict) -> bool:
+    """Return True when an API error means the token expired or is invalid."""
+    error_message = result.get("message", "")
+    # "无效的 Token" = Invalid Token in Chinese
+    # Also check for common auth error codes
+    return (
+        "token" in error_message.lower() or
+        "无效的" in error_message or  # Invalid in Chinese
+        "Token" in error_message or
+        result.get("code") in [401, 10401, 10402]  # Common auth error codes
+    )
+
+
+def probe_regions(session: requests.Session | None = None) -> dict[str, float]:
+    """Measure the round-trip time to every regional endpoint.
+
+    Returns the latency in seconds of each reachable region, fastest first.
+    Any HTTP answer counts as reachable, only connection errors and
+    timeouts exclude a region. A session created here is closed before
+    returning; a passed-in session is left open for the caller.
+    """
+    owned = session is None
+    session = session or requests.Session()
+    latencies = {}
+    try:
+        for region, settings in API_REGIONS.items():
+            start = time.perf_counter()
+            try:
+                session.head(settings["base_url"], timeout=REGION_PROBE_TIMEOUT)
+            except requests.exceptions.RequestException as err:
+                _LOGGER.debug("Region %s unreachable: %s", region, err)
+                continue
+            latencies[region] = time.perf_counter() - start
+            _LOGGER.debug("Region %s answered in %.0f ms", region, latencies[region] * 1000)
+    finally:
+        if owned:
+            session.close()
+    return dict(sorted(latencies.items(), key=lambda item: item[1]))
+
+
 class FurbulousCatAPI:
     """API client for Furbulous Cat."""
 
-    def __init__(self, email: str, password: str, account_type: int = 1, token: str | None = None) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        account_type: int = 1,
+        token: str | None = None,
+        base_url: str | None = None,
+        session: requests.Session | None = None,
+        region: str = DEFAULT_REGION,
+        property_keys: Iterable[str] | None = None,
+        json_loads: JsonLoads | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        The region selects the endpoint and the login country fields; an
+        explicit base_url overrides the endpoint. A custom session (for
+        example a cassette recorder or replay session) replaces the default
+        pooled keep-alive session. When property_keys is given, only those
+        device properties are extracted. json_loads replaces the default
+        decoder (orjson when installed, the stdlib otherwise).
+        """
+        self.region = region
+        self.base_url = base_url or API_REGIONS[region]["base_url"]
         self.email = email
         self.password = password
         self.account_type = account_type
         self.token = token  # Allow pre-set token
         self.identity_id = None
-        self.session = requests.Session()
+        # One connection per worker that can run a request concurrently
+        self.session = session or create_session(EXECUTOR_MAX_WORKERS)
         self.devices: list[dict[str, Any]] = []
+        self.property_keys = frozenset(property_keys) if property_keys is not None else None
+        if json_loads is None:
+            self.decoder, self.json_loads = get_decoder()
+        else:
+            self.decoder, self.json_loads = "custom", json_loads
+        # Raw body digest and parsed result of the last response per endpoint
+        self._response_cache: dict[str, tuple[bytes, dict]] = {}
+        # Extracted properties per iotid, keyed on the parsed result they came from
+        self._properties_cache: dict[str, tuple[dict, dict[str, Any]]] = {}
+        # Deadline of the get_data call running in the current thread
+        self._local = threading.local()
+        # Server clock minus local clock, estimated from response Date headers
+        self.clock_offset = 0.0
+
+    def _request_timeout(self) -> float:
+        """Return the timeout of the next request, capped by the current deadline."""
+        deadline = getattr(self._local, "deadline", None)
+        if deadline is None:
+            return REQUEST_TIMEOUT
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise FurbulousCatDeadlineError("Refresh deadline exceeded")
+        return min(REQUEST_TIMEOUT, remaining)
+
+    def _deadline_expired(self) -> bool:
+        """Return True when the current thread's deadline has passed."""
+        deadline = getattr(self._local, "deadline", None)
+        return deadline is not None and time.monotonic() >= deadline
+
+    def _timestamp(self) -> int:
+        """Return the signing timestamp, corrected for the server clock offset."""
+        return int(time.time() + self.clock_offset)
+
+    def _update_clock_offset(self, response: requests.Response) -> None:
+        """Estimate the server clock offset from the Date header of a response."""
+        date = response.headers.get("Date")
+        if not date:
+            return
+        try:
+            # The header has a one second resolution, assume mid-second
+            server_time = parsedate_to_datetime(date).timestamp() + 0.5
+        except (TypeError, ValueError):
+            return
+        offset = server_time - time.time()
+        if abs(offset) < CLOCK_SKEW_TOLERANCE:
+            offset = 0.0
+        if abs(offset - self.clock_offset) >= 1:
+            _LOGGER.info("Local clock is %.0f s off the Furbulous server clock, correcting signatures", -offset)
+            self.clock_offset = offset
+
+    def warm_up(self) -> None:
+        """Open or refresh a pooled connection ahead of a scheduled poll.
+
+        Pays the TCP and TLS handshake outside the poll itself when the
+        server closed the idle connection since the last request.
+        """
+        try:
+            self.session.head(self.base_url, timeout=self._request_timeout())
+        except requests.exceptions.RequestException as err:
+            _LOGGER.debug("Connection pre-warm failed: %s", err)
 
     def _generate_sign(self, timestamp: int, path: str) -> str:
         """Generate signature for API requests.
@@ -48,10 +230,22 @@ class FurbulousCatAPI:
         return hashlib.md5(data.encode()).hexdigest()
 
     def authenticate(self) -> bool:
-        """Authenticate with the Furbulous Cat API."""
-        url = f"{API_BASE_URL}{API_AUTH_ENDPOINT}"
+        """Authenticate with the Furbulous Cat API.
+
+        A login rejected for its signature is retried once after resyncing
+        the clock from the response.
+        """
+        try:
+            return self._authenticate()
+        except FurbulousCatSignatureError:
+            _LOGGER.info("Login signature rejected, retrying with the server clock")
+            return self._authenticate()
+
+    def _authenticate(self) -> bool:
+        """Send the login request."""
+        url = f"{self.base_url}{API_AUTH_ENDPOINT}"
         
-        timestamp = int(time.time())
+        timestamp = self._timestamp()
         sign = self._generate_sign(timestamp, API_AUTH_ENDPOINT)
         
         # DEBUG: Log signature calculation
@@ -65,9 +259,9 @@ class FurbulousCatAPI:
         
         payload = {
             "account_type": 1,
-            "area": "1",
+            "area": API_REGIONS[self.region]["area"],
             "client_token": "0acd1c78b8d16156bf59970de261cf2666e373c3042d57d94364b21caea31950",
-            "iso": "US",
+            "iso": API_REGIONS[self.region]["iso"],
             "password": self.password,
             "clientid": "65l0vltchd0l1q8",
             "brand": "iPhone",
@@ -93,7 +287,8 @@ class FurbulousCatAPI:
             _LOGGER.debug("Payload: %s", {**payload, "password": "***"})
             _LOGGER.debug("Headers: %s", headers)
             
-            response = self.session.post(url, json=payload, headers=headers, timeout=10)
+            response = self.session.post(url, json=payload, headers=headers, timeout=self._request_timeout())
+            self._update_clock_offset(response)
             
             _LOGGER.debug("Response status code: %s", response.status_code)
             _LOGGER.debug("Response body: %s", response.text)
@@ -106,6 +301,8 @@ class FurbulousCatAPI:
                         data.get("code"), data.get("message"))
             
             if data.get("code") != 0:
+                if _is_signature_error(data):
+                    raise FurbulousCatSignatureError(f"Login signature rejected: {data.get('message')}")
                 raise FurbulousCatAuthError(f"Authentication failed: {data.get('message')}")
             
             auth_data = data.get("data", {})
@@ -120,6 +317,8 @@ class FurbulousCatAPI:
             return True
             
         except requests.exceptions.RequestException as err:
+            if isinstance(err, requests.exceptions.Timeout) and self._deadline_expired():
+                raise FurbulousCatDeadlineError("Refresh deadline exceeded during authentication") from err
             _LOGGER.error("Error during authentication: %s", err)
             if hasattr(err, 'response') and err.response is not None:
                 _LOGGER.error("Response status: %s, body: %s", 
@@ -128,7 +327,7 @@ class FurbulousCatAPI:
 
     def _get_headers(self, endpoint: str) -> dict:
         """Generate headers for authenticated requests."""
-        timestamp = int(time.time())
+        timestamp = self._timestamp()
         sign = self._generate_sign(timestamp, endpoint)
         
         return {
@@ -144,9 +343,50 @@ class FurbulousCatAPI:
             "sign": sign,
         }
 
+    def _decode_response(self, endpoint: str, response: requests.Response) -> dict:
+        """Decode a response body, reusing the previous result when unchanged.
+
+        The raw body is hashed per endpoint. A byte-identical body returns the
+        previously parsed object without decoding it again.
+        """
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        cached = self._response_cache.get(endpoint)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        result = self.json_loads(response.content)
+        self._response_cache[endpoint] = (digest, result)
+        return result
+
+    def _send(self, method: str, endpoint: str, data: dict[str, Any] | None) -> requests.Response:
+        """Sign and send one request, learning the server clock from the reply."""
+        url = f"{self.base_url}{endpoint}"
+        # Extract path without query parameters for signature
+        headers = self._get_headers(endpoint.split('?')[0])
+        if method == "GET":
+            response = self.session.get(url, headers=headers, timeout=self._request_timeout())
+        elif method == "POST":
+            response = self.session.post(url, headers=headers, json=data or {}, timeout=self._request_timeout())
+        elif method == "PUT":
+            response = self.session.put(url, headers=headers, json=data or {}, timeout=self._request_timeout())
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        self._update_clock_offset(response)
+        return response
+
+    def _request(self, method: str, endpoint: str, data: dict[str, Any] | None) -> dict:
+        """Send one request and decode it, raising on HTTP errors."""
+        response = self._send(method, endpoint, data)
+        response.raise_for_status()
+        return self._decode_response(endpoint, response)
+
     def _make_authenticated_request(self, endpoint: str, method: str = "GET", data: dict[str, Any] | None = None) -> dict:
         """Make an authenticated request to the API.
-        
+
+        A rejected signature is re-signed once with the resynced clock and an
+        expired token is renewed once. Every retry goes through the same HTTP
+        status and API error checks as the first attempt.
+
         Args:
             endpoint: Full endpoint URL including query parameters
             method: HTTP method (GET or POST)
@@ -155,75 +395,54 @@ class FurbulousCatAPI:
         if not self.token:
             self.authenticate()
         
-        url = f"{API_BASE_URL}{endpoint}"
-        # Extract path without query parameters for signature
         base_endpoint = endpoint.split('?')[0]
-        headers = self._get_headers(base_endpoint)
-        
-        try:
-            if method == "GET":
-                response = self.session.get(url, headers=headers, timeout=10)
-            elif method == "POST":
-                response = self.session.post(url, headers=headers, json=data or {}, timeout=10)
-            elif method == "PUT":
-                response = self.session.put(url, headers=headers, json=data or {}, timeout=10)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            result = response.json()
-            
-            # Check if the response indicates success
-            if result.get("code") != 0:
-                error_message = result.get("message", "")
-                _LOGGER.warning("API returned error code %s: %s", result.get("code"), error_message)
-                
-                # Check for token expiration/invalid token errors
-                # "无效的 Token" = Invalid Token in Chinese
-                # Also check for common auth error codes
-                is_token_error = (
-                    "token" in error_message.lower() or 
-                    "无效的" in error_message or  # Invalid in Chinese
-                    "Token" in error_message or
-                    result.get("code") in [401, 10401, 10402]  # Common auth error codes
-                )
-                
-                if is_token_error:
-                    _LOGGER.info("Token expired or invalid, re-authenticating...")
+        resigned = False
+        reauthenticated = False
+
+        while True:
+            try:
+                result = self._request(method, endpoint, data)
+            except requests.exceptions.RequestException as err:
+                if isinstance(err, requests.exceptions.Timeout) and self._deadline_expired():
+                    raise FurbulousCatDeadlineError(f"Refresh deadline exceeded during {base_endpoint}") from err
+                _LOGGER.error("Error making authenticated request to %s: %s", endpoint, err)
+
+                # Retry authentication once if we get a 401
+                response = getattr(err, "response", None)
+                if response is not None and response.status_code == 401 and not reauthenticated:
+                    _LOGGER.info("Got 401 error, re-authenticating...")
                     self.authenticate()
-                    # Retry once with new token
-                    headers = self._get_headers(base_endpoint)
-                    if method == "GET":
-                        response = self.session.get(url, headers=headers, timeout=10)
-                    elif method == "POST":
-                        response = self.session.post(url, headers=headers, json=data or {}, timeout=10)
-                    elif method == "PUT":
-                        response = self.session.put(url, headers=headers, json=data or {}, timeout=10)
-                    result = response.json()
-                    
-                    if result.get("code") != 0:
-                        _LOGGER.error("Request failed even after re-authentication: %s", result.get("message"))
-            
-            return result
+                    reauthenticated = True
+                    continue
+                raise
 
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Error making authenticated request to %s: %s", endpoint, err)
-            
-            # Retry authentication if we get a 401
-            if hasattr(err, 'response') and err.response is not None and err.response.status_code == 401:
-                _LOGGER.info("Got 401 error, re-authenticating...")
+            # Check if the response indicates success
+            if result.get("code") == 0:
+                return result
+
+            _LOGGER.warning("API returned error code %s: %s", result.get("code"), result.get("message", ""))
+
+            # A rejected signature means a skewed clock, not an expired
+            # token: the offset was just resynced, re-sign and retry once
+            if _is_signature_error(result):
+                if resigned:
+                    raise FurbulousCatSignatureError(
+                        f"Signature rejected for {base_endpoint}: {result.get('message')}"
+                    )
+                _LOGGER.info("Signature rejected, retrying with the server clock")
+                resigned = True
+                continue
+
+            if _is_token_error(result):
+                if reauthenticated:
+                    _LOGGER.error("Request failed even after re-authentication: %s", result.get("message"))
+                    return result
+                _LOGGER.info("Token expired or invalid, re-authenticating...")
                 self.authenticate()
-                # Retry the request once
-                headers = self._get_headers(base_endpoint)
-                if method == "GET":
-                    response = self.session.get(url, headers=headers, timeout=10)
-                elif method == "POST":
-                    response = self.session.post(url, headers=headers, json=data or {}, timeout=10)
-                elif method == "PUT":
-                    response = self.session.put(url, headers=headers, json=data or {}, timeout=10)
-                return response.json()
-            
-            raise
+                reauthenticated = True
+                continue
+
+            return result
 
     def get_devices(self) -> list[dict[str, Any]]:
         """Get list of Furbulous devices."""
@@ -265,11 +484,21 @@ class FurbulousCatAPI:
             result = self._make_authenticated_request(endpoint)
 
             if result.get("code") == 0:
+                cached = self._properties_cache.get(iotid)
+                if cached is not None and cached[0] is result:
+                    return cached[1]
+
                 properties = result.get("data", {})
+                # Only walk the properties something reads
+                if self.property_keys is not None:
+                    items = [(key, properties[key]) for key in self.property_keys if key in properties]
+                else:
+                    items = properties.items()
+
                 # Extract just the values from the properties
                 # Each property is a dict with 'value' and 'time'
                 extracted_props = {}
-                for key, prop_data in properties.items():
+                for key, prop_data in items:
                     if isinstance(prop_data, dict) and 'value' in prop_data:
                         extracted_props[key] = prop_data['value']
                     else:
@@ -278,7 +507,7 @@ class FurbulousCatAPI:
                 _LOGGER.debug("Retrieved %d properties for device %s", len(extracted_props), iotid)
 
                 # Debug: Log sample of property keys to understand what's available
-                if extracted_props:
+                if extracted_props and _LOGGER.isEnabledFor(logging.DEBUG):
                     all_keys = list(extracted_props.keys())
                     _LOGGER.debug("ALL property keys for %s: %s", iotid, all_keys)
 
@@ -292,12 +521,15 @@ class FurbulousCatAPI:
                         if key in extracted_props:
                             _LOGGER.debug("Property %s = %s", key, extracted_props[key])
 
+                self._properties_cache[iotid] = (result, extracted_props)
                 return extracted_props
             else:
                 _LOGGER.warning("Failed to get properties for device %s: %s (code: %s)",
                               iotid, result.get("message"), result.get("code"))
                 return {}
 
+        except FurbulousCatDeadlineError:
+            raise
         except Exception as err:
             _LOGGER.warning("Error getting properties for device %s: %s", iotid, err)
             # Return empty dict instead of raising - properties are optional
@@ -312,6 +544,9 @@ class FurbulousCatAPI:
             
         Returns:
             True if successful
+
+        Raises:
+            FurbulousCatConnectionError: The cloud could not be reached or had a server error
             
         Example:
             api.set_device_property("849DC2F4F30B", {"childLockOnOff": 1})
@@ -333,6 +568,11 @@ class FurbulousCatAPI:
                 _LOGGER.error("Failed to set properties for %s: %s", iotid, result.get("message"))
                 return False
                 
+        except requests.exceptions.RequestException as err:
+            if _is_cloud_outage(err):
+                raise FurbulousCatConnectionError(f"Cannot reach the Furbulous cloud: {err}") from err
+            _LOGGER.error("Error setting properties for %s: %s", iotid, err)
+            return False
         except Exception as err:
             _LOGGER.error("Error setting properties for %s: %s", iotid, err)
             return False
@@ -346,6 +586,9 @@ class FurbulousCatAPI:
             
         Returns:
             True if successful
+
+        Raises:
+            FurbulousCatConnectionError: The cloud could not be reached or had a server error
         """
         try:
             endpoint = "/app/v1/device/disturb"
@@ -363,6 +606,11 @@ class FurbulousCatAPI:
                 _LOGGER.error("Failed to set DND mode for %s: %s", iotid, result.get("message"))
                 return False
                 
+        except requests.exceptions.RequestException as err:
+            if _is_cloud_outage(err):
+                raise FurbulousCatConnectionError(f"Cannot reach the Furbulous cloud: {err}") from err
+            _LOGGER.error("Error setting DND mode for %s: %s", iotid, err)
+            return False
         except Exception as err:
             _LOGGER.error("Error setting DND mode for %s: %s", iotid, err)
             return False
@@ -390,6 +638,8 @@ class FurbulousCatAPI:
                 _LOGGER.error("Failed to get pets: %s", result.get("message"))
                 return []
                 
+        except FurbulousCatDeadlineError:
+            raise
         except Exception as err:
             _LOGGER.error("Error getting pets: %s", err)
             return []
@@ -443,54 +693,155 @@ class FurbulousCatAPI:
                 _LOGGER.warning("Failed to get daily stats for device %s: %s", iotid, result.get("message"))
                 return {}
 
+        except FurbulousCatDeadlineError:
+            raise
         except Exception as err:
             _LOGGER.warning("Error getting daily stats for device %s: %s", iotid, err)
             return {}
 
-    def get_data(self) -> dict[str, Any]:
-        """Get data from the Furbulous Cat API."""
+    def get_unread_push_marker(self) -> Any:
+        """Get the unread device push record counter.
+
+        The counter moves whenever the device notifies the app (cat visit,
+        bin full, errors), which makes it a cheap change signal.
+
+        Returns:
+            The unread count, or a comparable representation of the payload
+            when it does not contain a recognizable count
+        """
+        result = self._make_authenticated_request(API_DEVICE_PUSH_UNREAD_ENDPOINT)
+
+        if result.get("code") != 0:
+            raise ValueError(f"Failed to get unread push records: {result.get('message')}")
+
+        data = result.get("data")
+        if isinstance(data, (int, float)):
+            return int(data)
+        if isinstance(data, dict):
+            for key in ("count", "unread", "num", "total"):
+                if isinstance(data.get(key), (int, float)):
+                    return int(data[key])
+        return repr(data)
+
+    @staticmethod
+    @contextmanager
+    def _phase(timings: list[tuple[str, float]] | None, name: str) -> Iterator[None]:
+        """Append the duration of the enclosed block to timings when given."""
+        if timings is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings.append((name, time.perf_counter() - start))
+
+    def get_data(
+        self,
+        include_pets: bool = True,
+        timings: list[tuple[str, float]] | None = None,
+        deadline: float | None = None,
+    ) -> dict[str, Any]:
+        """Get data from the Furbulous Cat API.
+
+        Args:
+            include_pets: Also fetch the pet list (the fast refresh skips it)
+            timings: Optional list receiving (phase, seconds) for each request
+            deadline: Optional time.monotonic() value the refresh must finish by.
+                Request timeouts shrink as it approaches; devices not reached
+                in time are returned with ``stale`` set and no fresh values,
+                so the previous ones are kept.
+        """
+        self._local.deadline = deadline
+        try:
+            return self._get_data(include_pets, timings)
+        finally:
+            self._local.deadline = None
+
+    def _get_data(
+        self, include_pets: bool, timings: list[tuple[str, float]] | None
+    ) -> dict[str, Any]:
+        """Fetch everything within the deadline of the current thread."""
         _LOGGER.debug("=== API get_data() called ===")
 
-        devices = self.get_devices()
+        if not self.token:
+            with self._phase(timings, "auth"):
+                self.authenticate()
+
+        with self._phase(timings, "device_list"):
+            devices = self.get_devices()
         _LOGGER.debug("Retrieved %d devices", len(devices))
 
         # Get properties and pet data for each device
         devices_with_properties = []
+        skipped = []
         for device in devices:
+            # Copy so that a cached device list is never mutated in place
+            device = dict(device)
             iotid = device.get("iotid")
-            device_name = device.get("name", "Unknown")  # Fixed: use 'name' not 'devicename'
-            if iotid:
-                _LOGGER.debug("Fetching properties for device: %s (iotid: %s)", device_name, iotid)
-                properties = self.get_device_properties(iotid)
-                device["properties"] = properties
-                _LOGGER.debug("Device %s has %d properties", device_name, len(properties))
-
-                # Fetch today's usage statistics from wcheader endpoint
-                _LOGGER.debug("Fetching daily stats for device: %s", device_name)
-                daily_stats = self.get_device_daily_stats(iotid)
-                device["daily_stats"] = daily_stats
-
-                # Extract today's usage count from daily_stats
-                if daily_stats:
-                    daily_uses = daily_stats.get("times", 0)
-                    device["daily_uses_actual"] = daily_uses
-                    _LOGGER.info("Device %s: Daily uses = %d, Avg duration = %d sec",
-                               device_name, daily_uses, daily_stats.get("avg_duration", 0))
-                else:
-                    device["daily_uses_actual"] = 0
+            if iotid and (skipped or self._deadline_expired()):
+                # Out of time: keep whatever the store already holds
+                device["stale"] = True
+                skipped.append(iotid)
+            elif iotid:
+                try:
+                    self._fetch_device_details(device, timings)
+                except FurbulousCatDeadlineError:
+                    # Never publish half a device
+                    device.pop("properties", None)
+                    device.pop("daily_stats", None)
+                    device["stale"] = True
+                    skipped.append(iotid)
 
             devices_with_properties.append(device)
 
-        # Get pets information
-        pets = self.get_pets()
-        _LOGGER.debug("Retrieved %d pets", len(pets))
-
-        # No need to get detailed info, /pet/list already returns everything
+        if skipped:
+            _LOGGER.warning("Refresh deadline reached, kept previous values for %d device(s): %s",
+                            len(skipped), ", ".join(skipped))
 
-        return {
+        data = {
             "authenticated": True,
             "token": self.token,
             "identity_id": self.identity_id,
             "devices": devices_with_properties,
-            "pets": pets,
         }
+
+        if include_pets and not self._deadline_expired():
+            # Get pets information
+            # No need to get detailed info, /pet/list already returns everything
+            try:
+                with self._phase(timings, "pets"):
+                    data["pets"] = self.get_pets()
+                _LOGGER.debug("Retrieved %d pets", len(data["pets"]))
+            except FurbulousCatDeadlineError:
+                # Leaving "pets" out keeps the previous list in the store
+                _LOGGER.debug("Refresh deadline reached while fetching pets, keeping the previous list")
+
+        return data
+
+    def _fetch_device_details(
+        self, device: dict[str, Any], timings: list[tuple[str, float]] | None
+    ) -> None:
+        """Add properties and daily statistics to a device dict."""
+        iotid = device["iotid"]
+        device_name = device.get("name", "Unknown")
+        _LOGGER.debug("Fetching properties for device: %s (iotid: %s)", device_name, iotid)
+        with self._phase(timings, f"properties:{iotid}"):
+            properties = self.get_device_properties(iotid)
+        device["properties"] = properties
+        _LOGGER.debug("Device %s has %d properties", device_name, len(properties))
+
+        # Fetch today's usage statistics from wcheader endpoint
+        _LOGGER.debug("Fetching daily stats for device: %s", device_name)
+        with self._phase(timings, f"wcheader:{iotid}"):
+            daily_stats = self.get_device_daily_stats(iotid)
+        device["daily_stats"] = daily_stats
+
+        # Extract today's usage count from daily_stats
+        if daily_stats:
+            daily_uses = daily_stats.get("times", 0)
+            device["daily_uses_actual"] = daily_uses
+            _LOGGER.info("Device %s: Daily uses = %d, Avg duration = %d sec",
+                       device_name, daily_uses, daily_stats.get("avg_duration", 0))
+        else:
+            device["daily_uses_actual"] = 0
@@ -0,0 +1,47 @@
+"""Entity profiles selecting which entities a box gets."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from .const import CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE, DOMAIN, ENTITY_PROFILES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def entity_profile(entry: ConfigEntry) -> str:
+    """Return the entity profile selected for an entry."""
+    profile = entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+    return profile if profile in ENTITY_PROFILES else DEFAULT_ENTITY_PROFILE
+
+
+@callback
+def async_apply_entity_profile(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    platform: str,
+    entities: Iterable[tuple[str, Entity]],
+) -> list[Entity]:
+    """Return the entities the profile includes.
+
+    Each entity comes with the smallest profile that includes it. Entities
+    left out are removed from the registry, so switching to a smaller
+    profile does not leave unavailable entities behind.
+    """
+    rank = ENTITY_PROFILES.index(entity_profile(entry))
+    registry = er.async_get(hass)
+    included: list[Entity] = []
+    for minimum, entity in entities:
+        if ENTITY_PROFILES.index(minimum) <= rank:
+            included.append(entity)
+            continue
+        entity_id = registry.async_get_entity_id(platform, DOMAIN, entity.unique_id)
+        if entity_id:
+            _LOGGER.debug("Removing %s, not part of the entity profile", entity_id)
+            registry.async_remove(entity_id)
+    return included
@@ -0,0 +1,75 @@
+"""Opt-in profiling of entity state writes and coordinator fan-out."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import PROFILING_REPORT_SIZE
+
+
+class TimingStats:
+    """Running count, total and maximum of a timed operation."""
+
+    __slots__ = ("count", "total", "maximum", "last")
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.last = 0.0
+
+    def add(self, duration: float) -> None:
+        """Record one duration in seconds."""
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0,
+            "max_ms": round(self.maximum * 1000, 3),
+            "last_ms": round(self.last * 1000, 3),
+            "total_ms": round(self.total * 1000, 3),
+        }
+
+
+class HotPathProfiler:
+    """Collect timings of the event-loop hot path.
+
+    Disabled by default. When enabled, the coordinators time every listener
+    they call (for entities this is the state computation and write) and the
+    whole fan-out of each refresh.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the profiler."""
+        self.enabled = enabled
+        self._listeners: dict[str, TimingStats] = {}
+        self._fanouts: dict[str, TimingStats] = {}
+
+    def record_listener(self, name: str, duration: float) -> None:
+        """Record the time spent in one coordinator listener."""
+        stats = self._listeners.get(name)
+        if stats is None:
+            stats = self._listeners[name] = TimingStats()
+        stats.add(duration)
+
+    def record_fanout(self, coordinator: str, duration: float) -> None:
+        """Record the time spent notifying all listeners of a coordinator."""
+        stats = self._fanouts.get(coordinator)
+        if stats is None:
+            stats = self._fanouts[coordinator] = TimingStats()
+        stats.add(duration)
+
+    def report(self, limit: int = PROFILING_REPORT_SIZE) -> dict[str, Any]:
+        """Return the slowest listeners and the fan-out timings."""
+        slowest = sorted(self._listeners.items(), key=lambda item: item[1].maximum, reverse=True)
+        return {
+            "enabled": self.enabled,
+            "slowest_entities": {name: stats.as_dict() for name, stats in slowest[:limit]},
+            "coordinator_fanout": {name: stats.as_dict() for name, stats in self._fanouts.items()},
+        }
@@ -0,0 +1,65 @@
+"""Fixed-size ring buffer used by the local statistics engines."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO that overwrites its oldest entry when full.
+
+    Memory use is bounded by the capacity, no matter how long the
+    integration keeps running.
+    """
+
+    def __init__(self, capacity: int, items: list[Any] | None = None) -> None:
+        """Initialize the buffer, optionally pre-filled (oldest first)."""
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self._capacity = capacity
+        self._items: list[Any] = [None] * capacity
+        self._start = 0
+        self._size = 0
+        for item in (items or [])[-capacity:]:
+            self.append(item)
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of entries."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate from the oldest to the newest entry."""
+        for offset in range(self._size):
+            yield self._items[(self._start + offset) % self._capacity]
+
+    def append(self, item: Any) -> None:
+        """Add an entry, dropping the oldest one when the buffer is full."""
+        if self._size < self._capacity:
+            self._items[(self._start + self._size) % self._capacity] = item
+            self._size += 1
+        else:
+            self._items[self._start] = item
+            self._start = (self._start + 1) % self._capacity
+
+    def last(self, count: int | None = None) -> list[Any]:
+        """Return the newest ``count`` entries (all when None), oldest first."""
+        if count is None:
+            return list(self)
+        count = max(0, min(count, self._size))
+        first = self._start + self._size - count
+        return [self._items[(first + offset) % self._capacity] for offset in range(count)]
+
+    def newest(self) -> Any | None:
+        """Return the most recent entry, or None when empty."""
+        if not self._size:
+            return None
+        return self._items[(self._start + self._size - 1) % self._capacity]
+
+    def to_list(self) -> list[Any]:
+        """Return the entries as a plain list for persistence."""
+        return list(self)
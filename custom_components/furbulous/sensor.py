@@ -1,25 +1,92 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FurbulousCatDataUpdateCoordinator
 from .const import (
     DOMAIN,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_MINIMAL,
+    ENTITY_PROFILE_STANDARD,
     WORK_STATUS,
     LITTER_TYPE,
-    ERROR_CODES,
     UNIT_GRAMS,
+    UNIT_GRAMS_PER_DAY,
     UNIT_SECONDS,
     UNIT_TIMES,
 )
+from .command_queue import FurbulousCommandQueue
 from .device import get_device_info
+from .discovery import async_track_new_items
+from .errors import active_flags, describe, severity
+from .fleet import (
+    FLEET_BINS_FULL,
+    FLEET_DAILY_USES,
+    FLEET_IN_ERROR,
+    FLEET_OCCUPIED,
+    FLEET_OFFLINE,
+    FleetAggregates,
+)
+from .attribution import PetWeightClusterer
+from .profiles import async_apply_entity_profile
+from .bin_predictor import WasteBinPredictor
+from .usage_windows import UsageWindows
+from .weight_stats import WeightStatistics
+
+# Weight statistic key -> (friendly name, unit, icon)
+WEIGHT_STATISTICS = {
+    "average": ("Visit weight average", UNIT_GRAMS, "mdi:scale-bathroom"),
+    "minimum": ("Visit weight minimum", UNIT_GRAMS, "mdi:arrow-collapse-down"),
+    "maximum": ("Visit weight maximum", UNIT_GRAMS, "mdi:arrow-collapse-up"),
+    "median": ("Visit weight median", UNIT_GRAMS, "mdi:scale-balance"),
+    "trend_7d": ("Visit weight trend (7 days)", UNIT_GRAMS_PER_DAY, "mdi:trending-up"),
+    "trend_30d": ("Visit weight trend (30 days)", UNIT_GRAMS_PER_DAY, "mdi:trending-up"),
+}
+
+# Usage window statistic -> (friendly name, icon)
+USAGE_WINDOW_STATISTICS = {
+    "avg_7d": ("Daily uses average (7 days)", "mdi:chart-line"),
+    "min_7d": ("Daily uses minimum (7 days)", "mdi:arrow-collapse-down"),
+    "max_7d": ("Daily uses maximum (7 days)", "mdi:arrow-collapse-up"),
+    "avg_30d": ("Daily uses average (30 days)", "mdi:chart-line"),
+    "min_30d": ("Daily uses minimum (30 days)", "mdi:arrow-collapse-down"),
+    "max_30d": ("Daily uses maximum (30 days)", "mdi:arrow-collapse-up"),
+}
+
+# Setting property -> friendly name
+SETTING_SENSORS = {
+    "FullAutoModeSwitch": "Full auto mode",
+    "catCleanOnOff": "Automatic cleaning",
+    "childLockOnOff": "Child lock",
+    "masterSleepOnOff": "Sleep mode",
+    "DisplaySwitch": "Display",
+    "handMode": "Manual mode",
+}
+
+# Firmware version property -> friendly name
+VERSION_SENSORS = {
+    "mcuversion": "MCU version",
+    "wifivertion": "WiFi version",
+    "trdversion": "TRD version",
+}
+
+# Fleet aggregate -> (friendly name, unit, icon)
+FLEET_SENSORS = {
+    FLEET_DAILY_USES: ("Total daily uses", UNIT_TIMES, "mdi:counter"),
+    FLEET_IN_ERROR: ("Boxes in error", None, "mdi:alert-circle"),
+    FLEET_BINS_FULL: ("Bins full", None, "mdi:delete-alert"),
+    FLEET_OCCUPIED: ("Boxes occupied", None, "mdi:cat"),
+    FLEET_OFFLINE: ("Boxes offline", None, "mdi:cloud-off-outline"),
+}
 
 
 async def async_setup_entry(
@@ -30,61 +97,101 @@ async def async_setup_entry(
     """Set up Furbulous Cat sensors."""
     coordinators = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = coordinators["coordinator"]
-
-    entities = []
-    
-    # Add a sensor for each device
-    devices = coordinator.data.get("devices", [])
-    for device in devices:
+    fast_coordinator = coordinators["fast_coordinator"]
+    weight_stats = coordinators["weight_stats"]
+    attribution = coordinators["attribution"]
+    command_queue = coordinators["command_queue"]
+    usage_windows = coordinators["usage_windows"]
+    bin_predictor = coordinators["bin_predictor"]
+
+    @callback
+    def _build_device_entities(device: dict) -> list[SensorEntity]:
+        """Create the sensors of a device included in the entity profile."""
         device_id = device.get("id")
         iotid = device.get("iotid")
-        
+
         # Basic sensors
-        entities.extend([
-            FurbulousCatDeviceSensor(coordinator, device_id, "status"),
-            FurbulousCatDeviceSensor(coordinator, device_id, "online"),
-            FurbulousCatDeviceSensor(coordinator, device_id, "last_active"),
-        ])
-        
+        entities: list[tuple[str, SensorEntity]] = [
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatDeviceSensor(coordinator, device_id, "status")),
+            (ENTITY_PROFILE_STANDARD, FurbulousCatDeviceSensor(coordinator, device_id, "online")),
+            (ENTITY_PROFILE_STANDARD, FurbulousCatDeviceSensor(coordinator, device_id, "last_active")),
+        ]
+
         # Property-based sensors
         if iotid:
             entities.extend([
                 # Weight and usage
-                FurbulousCatPropertySensor(coordinator, device_id, "catWeight", "Cat weight"),
-                FurbulousCatDailyUsesSensor(coordinator, device_id),  # Use actual API data
-                FurbulousCatPropertySensor(coordinator, device_id, "excreteTimerEveryday", "Daily duration"),
+                (ENTITY_PROFILE_MINIMAL, FurbulousCatPropertySensor(coordinator, device_id, "catWeight", "Cat weight")),
+                (ENTITY_PROFILE_MINIMAL, FurbulousCatDailyUsesSensor(coordinator, device_id)),  # Use actual API data
+                (ENTITY_PROFILE_STANDARD, FurbulousCatPropertySensor(coordinator, device_id, "excreteTimerEveryday", "Daily duration")),
 
                 # Status sensors
-                FurbulousCatPropertySensor(coordinator, device_id, "workstatus", "Operating status"),
-                FurbulousCatPropertySensor(coordinator, device_id, "errorReportEvent", "Error"),
-                FurbulousCatPropertySensor(coordinator, device_id, "completionStatus", "Completion status"),
-
-                # Settings sensors
-                FurbulousCatPropertySensor(coordinator, device_id, "catLitterType", "Litter type"),
-                FurbulousCatPropertySensor(coordinator, device_id, "FullAutoModeSwitch", "Full auto mode"),
-                FurbulousCatPropertySensor(coordinator, device_id, "catCleanOnOff", "Automatic cleaning"),
-                FurbulousCatPropertySensor(coordinator, device_id, "childLockOnOff", "Child lock"),
-                FurbulousCatPropertySensor(coordinator, device_id, "masterSleepOnOff", "Sleep mode"),
-                FurbulousCatPropertySensor(coordinator, device_id, "DisplaySwitch", "Display"),
-                FurbulousCatPropertySensor(coordinator, device_id, "handMode", "Manual mode"),
-
-                # Version sensors
-                FurbulousCatPropertySensor(coordinator, device_id, "mcuversion", "MCU version"),
-                FurbulousCatPropertySensor(coordinator, device_id, "wifivertion", "WiFi version"),
-                FurbulousCatPropertySensor(coordinator, device_id, "trdversion", "TRD version"),
+                (ENTITY_PROFILE_MINIMAL, FurbulousCatPropertySensor(coordinator, device_id, "workstatus", "Operating status")),
+                (ENTITY_PROFILE_MINIMAL, FurbulousCatPropertySensor(coordinator, device_id, "errorReportEvent", "Error")),
+                (ENTITY_PROFILE_STANDARD, FurbulousCatPropertySensor(coordinator, device_id, "completionStatus", "Completion status")),
+                (ENTITY_PROFILE_STANDARD, FurbulousCatPropertySensor(coordinator, device_id, "catLitterType", "Litter type")),
             ])
-    
-    # Add pet sensors
-    pets = coordinator.data.get("pets", [])
-    for pet in pets:
+
+            # Settings sensors, duplicated by the switches and binary sensors
+            entities.extend(
+                (ENTITY_PROFILE_FULL, FurbulousCatPropertySensor(coordinator, device_id, key, name, enabled_default=False))
+                for key, name in SETTING_SENSORS.items()
+            )
+
+            # Version sensors
+            entities.extend(
+                (ENTITY_PROFILE_FULL, FurbulousCatPropertySensor(coordinator, device_id, key, name, enabled_default=False))
+                for key, name in VERSION_SENSORS.items()
+            )
+
+            # Commands waiting for the cloud to come back
+            entities.extend([
+                (ENTITY_PROFILE_STANDARD, FurbulousCatCommandQueueSensor(coordinator, command_queue, device_id, iotid)),
+                (ENTITY_PROFILE_STANDARD, FurbulousCatCommandQueueAgeSensor(coordinator, command_queue, device_id, iotid)),
+            ])
+
+            # Rolling weight statistics over every visit to the box (updated from
+            # visits seen by the fast coordinator)
+            entities.extend(
+                (ENTITY_PROFILE_STANDARD, FurbulousCatWeightStatisticSensor(fast_coordinator, weight_stats, device_id, iotid, stat))
+                for stat in WEIGHT_STATISTICS
+            )
+
+            # Waste bin fill prediction (updated from cycles seen by the fast coordinator)
+            entities.extend([
+                (ENTITY_PROFILE_STANDARD, FurbulousCatWasteBinFillSensor(fast_coordinator, bin_predictor, device_id, iotid)),
+                (ENTITY_PROFILE_STANDARD, FurbulousCatWasteBinTimeToFullSensor(fast_coordinator, bin_predictor, device_id, iotid)),
+            ])
+
+            # Daily usage windows (closed at the local day boundary)
+            entities.extend(
+                (ENTITY_PROFILE_STANDARD, FurbulousCatUsageWindowSensor(coordinator, usage_windows, device_id, iotid, stat))
+                for stat in USAGE_WINDOW_STATISTICS
+            )
+        return async_apply_entity_profile(hass, config_entry, Platform.SENSOR, entities)
+
+    @callback
+    def _build_pet_entities(pet: dict) -> list[SensorEntity]:
+        """Create the sensors of a pet."""
         pet_id = pet.get("pet_id")
-        if pet_id:
-            entities.append(FurbulousCatPetSensor(coordinator, pet_id))
-    
-    # Add general status sensor
-    entities.append(FurbulousCatStatusSensor(coordinator))
-    
-    async_add_entities(entities)
+        return async_apply_entity_profile(hass, config_entry, Platform.SENSOR, [
+            (ENTITY_PROFILE_MINIMAL, FurbulousCatPetSensor(coordinator, pet_id)),
+            (ENTITY_PROFILE_STANDARD, FurbulousCatPetVisitsSensor(fast_coordinator, attribution, pet_id)),
+            (ENTITY_PROFILE_STANDARD, FurbulousCatPetWeightSensor(fast_coordinator, attribution, weight_stats, pet_id)),
+        ])
+
+    # Add general status sensor and account-level aggregates
+    async_add_entities([
+        FurbulousCatStatusSensor(coordinator),
+        *(
+            FurbulousCatFleetSensor(fast_coordinator, coordinators["fleet"], config_entry.entry_id, aggregate)
+            for aggregate in FLEET_SENSORS
+        ),
+    ])
+
+    # Add sensors for each device and pet, including ones added later on
+    async_track_new_items(config_entry, coordinator, async_add_entities, "devices", "id", _build_device_entities)
+    async_track_new_items(config_entry, coordinator, async_add_entities, "pets", "pet_id", _build_pet_entities)
 
 
 class FurbulousCatStatusSensor(CoordinatorEntity, SensorEntity):
@@ -99,8 +206,8 @@ class FurbulousCatStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if self.coordinator.data.get("authenticated"):
-            device_count = len(self.coordinator.data.get("devices", []))
+        if self.coordinator.snapshot.get("authenticated"):
+            device_count = len(self.coordinator.snapshot.get("devices", []))
             return f"{device_count} device(s)"
         return "Disconnected"
 
@@ -108,11 +215,44 @@ class FurbulousCatStatusSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self) -> dict:
         """Return additional attributes."""
         return {
-            "identity_id": self.coordinator.data.get("identity_id"),
-            "device_count": len(self.coordinator.data.get("devices", [])),
+            "identity_id": self.coordinator.snapshot.get("identity_id"),
+            "device_count": len(self.coordinator.snapshot.get("devices", [])),
         }
 
 
+class FurbulousCatFleetSensor(CoordinatorEntity, SensorEntity):
+    """Aggregate over every box of the account."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        fleet: FleetAggregates,
+        entry_id: str,
+        aggregate: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._fleet = fleet
+        self._aggregate = aggregate
+        friendly_name, unit, icon = FLEET_SENSORS[aggregate]
+        self._attr_name = f"Furbulous Cat {friendly_name}"
+        self._attr_unique_id = f"furbulous_{entry_id}_fleet_{aggregate}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+
+    @property
+    def native_value(self) -> int:
+        """Return the aggregate."""
+        return self._fleet.totals[self._aggregate]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        return {"device_count": self._fleet.device_count}
+
+
 class FurbulousCatDeviceSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Furbulous Cat device sensor."""
 
@@ -136,7 +276,7 @@ class FurbulousCatDeviceSensor(CoordinatorEntity, SensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -223,6 +363,7 @@ class FurbulousCatPropertySensor(CoordinatorEntity, SensorEntity):
         device_id: int,
         property_key: str,
         friendly_name: str,
+        enabled_default: bool = True,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -230,6 +371,7 @@ class FurbulousCatPropertySensor(CoordinatorEntity, SensorEntity):
         self._property_key = property_key
         self._friendly_name = friendly_name
         self._attr_unique_id = f"furbulous_{device_id}_{property_key}"
+        self._attr_entity_registry_enabled_default = enabled_default
         
         # Set device info
         device = self.device_data
@@ -239,7 +381,7 @@ class FurbulousCatPropertySensor(CoordinatorEntity, SensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -290,8 +432,8 @@ class FurbulousCatPropertySensor(CoordinatorEntity, SensorEntity):
             return LITTER_TYPE.get(int(value), f"Unknown ({value})") if value is not None else None
 
         elif self._property_key == "errorReportEvent":
-            # Error code mapping
-            return ERROR_CODES.get(int(value), f"Error {value}") if value is not None else None
+            # Error flags, several can be set at once
+            return describe(int(value)) if value is not None else None
 
         elif self._property_key in ["FullAutoModeSwitch", "catCleanOnOff", "childLockOnOff",
                                      "masterSleepOnOff", "DisplaySwitch", "handMode",
@@ -375,15 +517,11 @@ class FurbulousCatPropertySensor(CoordinatorEntity, SensorEntity):
         if self._property_key == "errorReportEvent" and value is not None:
             error_code = int(value)
             attrs["error_code"] = error_code
-            attrs["error_message"] = ERROR_CODES.get(error_code, f"Unknown error {error_code}")
-            attrs["error_severity"] = self._get_error_severity(error_code)
+            attrs["error_message"] = describe(error_code)
+            attrs["error_severity"] = severity(error_code)
+            attrs["active_errors"] = list(active_flags(error_code))
         
         return attrs
-    
-    def _get_error_severity(self, error_code: int) -> str:
-        """Get error severity level."""
-        from .const import ERROR_SEVERITY
-        return ERROR_SEVERITY.get(error_code, "unknown")
 
     @property
     def available(self) -> bool:
@@ -411,7 +549,7 @@ class FurbulousCatPetSensor(CoordinatorEntity, SensorEntity):
 
     def _get_pet_data(self) -> dict:
         """Get pet data from coordinator."""
-        pets = self.coordinator.data.get("pets", [])
+        pets = self.coordinator.snapshot.get("pets", [])
         for pet in pets:
             if pet.get("pet_id") == self._pet_id:
                 return pet
@@ -512,7 +650,7 @@ class FurbulousCatDailyUsesSensor(CoordinatorEntity, SensorEntity):
     @property
     def device_data(self) -> dict | None:
         """Get the device data from coordinator."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self._device_id:
                 return device
@@ -565,3 +703,374 @@ class FurbulousCatDailyUsesSensor(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         return self.device_data is not None
+
+
+class FurbulousCatWeightStatisticSensor(CoordinatorEntity, SensorEntity):
+    """Sensor exposing a rolling weight statistic over every visit to a box."""
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        weight_stats: WeightStatistics,
+        device_id: int,
+        stats_key: str,
+        statistic: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._weight_stats = weight_stats
+        self._device_id = device_id
+        self._stats_key = stats_key
+        self._statistic = statistic
+        self._friendly_name, unit, icon = WEIGHT_STATISTICS[statistic]
+        self._attr_unique_id = f"furbulous_{device_id}_weight_{statistic}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+
+        # Set device info
+        device = self.device_data
+        if device:
+            self._attr_device_info = get_device_info(device)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the trends as they age on days without visits."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._weight_stats.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def device_data(self) -> dict | None:
+        """Get the device data from coordinator."""
+        devices = self.coordinator.snapshot.get("devices", [])
+        for device in devices:
+            if device.get("id") == self._device_id:
+                return device
+        return None
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        device = self.device_data
+        if device:
+            device_name = device.get("name", f"Device {self._device_id}")
+            return f"{device_name} - {self._friendly_name}"
+        return f"Furbulous Device {self._device_id} - {self._friendly_name}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic value."""
+        return self._weight_stats.get(self._stats_key).get(self._statistic)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        stats = self._weight_stats.get(self._stats_key)
+        if not stats:
+            return {}
+        return {
+            "samples": stats.get("samples"),
+            "last_weight": stats.get("last"),
+            "last_visit": datetime.fromtimestamp(stats["last_visit"], tz=timezone.utc).isoformat(),
+        }
+
+
+class FurbulousCatUsageWindowSensor(CoordinatorEntity, SensorEntity):
+    """Sensor exposing a statistic over the last days of daily uses."""
+
+    _attr_native_unit_of_measurement = UNIT_TIMES
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        usage_windows: UsageWindows,
+        device_id: int,
+        iotid: str,
+        statistic: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._usage_windows = usage_windows
+        self._device_id = device_id
+        self._iotid = iotid
+        self._statistic = statistic
+        self._friendly_name, icon = USAGE_WINDOW_STATISTICS[statistic]
+        self._attr_unique_id = f"furbulous_{device_id}_uses_{statistic}"
+        self._attr_icon = icon
+
+        # Set device info
+        device = self.device_data
+        if device:
+            self._attr_device_info = get_device_info(device)
+
+    @property
+    def device_data(self) -> dict | None:
+        """Get the device data from coordinator."""
+        devices = self.coordinator.snapshot.get("devices", [])
+        for device in devices:
+            if device.get("id") == self._device_id:
+                return device
+        return None
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        device = self.device_data
+        if device:
+            device_name = device.get("name", f"Device {self._device_id}")
+            return f"{device_name} - {self._friendly_name}"
+        return f"Furbulous Device {self._device_id} - {self._friendly_name}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic value."""
+        return self._usage_windows.get(self._iotid).get(self._statistic)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        stats = self._usage_windows.get(self._iotid)
+        if not stats:
+            return {}
+        return {"days": stats.get("days"), "last_day": stats.get("last_day")}
+
+
+class FurbulousCatWasteBinFillSensor(CoordinatorEntity, SensorEntity):
+    """Estimated waste bin fill level from cleaning cycles since it was emptied."""
+
+    _key = "waste_bin_fill"
+    _label = "Waste bin fill"
+    _attr_native_unit_of_measurement = "%"
+    _attr_icon = "mdi:delete-variant"
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        bin_predictor: WasteBinPredictor,
+        device_id: int,
+        iotid: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._bin_predictor = bin_predictor
+        self._device_id = device_id
+        self._iotid = iotid
+        self._attr_unique_id = f"furbulous_{device_id}_{self._key}"
+
+        # Set device info
+        device = self.device_data
+        if device:
+            self._attr_device_info = get_device_info(device)
+
+    @property
+    def device_data(self) -> dict | None:
+        """Get the device data from coordinator."""
+        devices = self.coordinator.snapshot.get("devices", [])
+        for device in devices:
+            if device.get("id") == self._device_id:
+                return device
+        return None
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        device = self.device_data
+        if device:
+            device_name = device.get("name", f"Device {self._device_id}")
+            return f"{device_name} - {self._label}"
+        return f"Furbulous Device {self._device_id} - {self._label}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the estimated fill percentage."""
+        state = self._bin_predictor.get(self._iotid)
+        return state.fill_percent() if state else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        state = self._bin_predictor.get(self._iotid)
+        if not state:
+            return {}
+        return {
+            "cycles_since_empty": state.cycles,
+            "visits_since_empty": state.visits,
+            "learned_capacity_cycles": round(state.capacity, 1) if state.capacity else None,
+            "emptied_at": datetime.fromtimestamp(state.emptied_at, tz=timezone.utc).isoformat(),
+        }
+
+
+class FurbulousCatWasteBinTimeToFullSensor(FurbulousCatWasteBinFillSensor):
+    """Estimated time until the waste bin is full at the recent cycle rate."""
+
+    _key = "waste_bin_time_to_full"
+    _label = "Waste bin time to full"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = "h"
+    _attr_icon = "mdi:timer-sand"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the estimated hours until the bin is full."""
+        state = self._bin_predictor.get(self._iotid)
+        return state.hours_to_full(time.time()) if state else None
+
+
+class FurbulousCatPetVisitsSensor(CoordinatorEntity, SensorEntity):
+    """Visits attributed to a pet by weight clustering."""
+
+    _attr_native_unit_of_measurement = UNIT_TIMES
+    _attr_icon = "mdi:paw"
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        attribution: PetWeightClusterer,
+        pet_id: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attribution = attribution
+        self._pet_id = pet_id
+        self._attr_unique_id = f"furbulous_pet_{pet_id}_visits_today"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        for pet in self.coordinator.snapshot.get("pets", []):
+            if pet.get("pet_id") == self._pet_id:
+                return f"Furbulous Cat - {pet.get('nickname', f'Pet {self._pet_id}')} - Visits today"
+        return f"Furbulous Cat - Pet {self._pet_id} - Visits today"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of visits attributed today."""
+        return self._attribution.counters(self._pet_id)["today"]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        counters = self._attribution.counters(self._pet_id)
+        attrs = {
+            "pet_id": self._pet_id,
+            "total_visits": counters["total"],
+            "last_weight": counters.get("last_weight"),
+        }
+        if counters.get("last_visit"):
+            attrs["last_visit"] = datetime.fromtimestamp(counters["last_visit"], tz=timezone.utc).isoformat()
+        return attrs
+
+
+class FurbulousCatPetWeightSensor(CoordinatorEntity, SensorEntity):
+    """Weight of a pet estimated from the visits attributed to it."""
+
+    _attr_native_unit_of_measurement = UNIT_GRAMS
+    _attr_icon = "mdi:scale-bathroom"
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        attribution: PetWeightClusterer,
+        weight_stats: WeightStatistics,
+        pet_id: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attribution = attribution
+        self._weight_stats = weight_stats
+        self._pet_id = pet_id
+        self._attr_unique_id = f"furbulous_pet_{pet_id}_weight"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the trends as they age on days without visits."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._weight_stats.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        for pet in self.coordinator.snapshot.get("pets", []):
+            if pet.get("pet_id") == self._pet_id:
+                return f"Furbulous Cat - {pet.get('nickname', f'Pet {self._pet_id}')} - Weight"
+        return f"Furbulous Cat - Pet {self._pet_id} - Weight"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the smoothed weight, falling back to the cluster centroid."""
+        stats = self._weight_stats.get(f"pet_{self._pet_id}")
+        if stats.get("average") is not None:
+            return stats["average"]
+        return self._attribution.centroid(self._pet_id)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        stats = self._weight_stats.get(f"pet_{self._pet_id}")
+        return {
+            "pet_id": self._pet_id,
+            "cluster_centroid": self._attribution.centroid(self._pet_id),
+            "minimum": stats.get("minimum"),
+            "maximum": stats.get("maximum"),
+            "median": stats.get("median"),
+            "trend_7d": stats.get("trend_7d"),
+            "trend_30d": stats.get("trend_30d"),
+            "samples": stats.get("samples", 0),
+        }
+
+
+class FurbulousCatCommandQueueSensor(SensorEntity):
+    """Number of commands queued for a device while the cloud is unreachable.
+
+    Not a coordinator entity: it must stay available during the outages it
+    reports on.
+    """
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:tray-full"
+    _key = "command_queue"
+    _label = "Queued commands"
+
+    def __init__(
+        self,
+        coordinator: FurbulousCatDataUpdateCoordinator,
+        command_queue: FurbulousCommandQueue,
+        device_id: int,
+        iotid: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self._command_queue = command_queue
+        self._device_id = device_id
+        self._iotid = iotid
+        self._attr_unique_id = f"furbulous_{device_id}_{self._key}"
+        for device in coordinator.snapshot.get("devices", []):
+            if device.get("id") == device_id:
+                self._attr_device_info = get_device_info(device)
+                self._attr_name = f"{device.get('name', f'Device {device_id}')} - {self._label}"
+                break
+        else:
+            self._attr_name = f"Furbulous Device {device_id} - {self._label}"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow queue changes."""
+        self.async_on_remove(self._command_queue.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of queued commands."""
+        return self._command_queue.depth(self._iotid)
+
+
+class FurbulousCatCommandQueueAgeSensor(FurbulousCatCommandQueueSensor):
+    """Time the oldest queued command of a device was issued."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:tray-alert"
+    _key = "command_queue_oldest"
+    _label = "Oldest queued command"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the oldest queued command was issued."""
+        oldest = self._command_queue.oldest(self._iotid)
+        if oldest is None:
+            return None
+        return datetime.fromtimestamp(oldest, tz=timezone.utc)
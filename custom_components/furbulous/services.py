@@ -0,0 +1,120 @@
+"""Services for the Furbulous Cat integration."""
+from __future__ import annotations
+
+import cProfile
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SERVICE_PROFILE_REFRESH
+from .snapshot import FIELD_DEVICES, FIELD_PETS
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_REAUTHENTICATE = "reauthenticate"
+ATTR_CPROFILE = "cprofile"
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_REAUTHENTICATE, default=False): cv.boolean,
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+
+def _ms(seconds: float) -> float:
+    """Convert seconds to rounded milliseconds."""
+    return round(seconds * 1000, 1)
+
+
+async def _async_profile_refresh(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Run one instrumented refresh and return its per-phase breakdown."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    runtime = hass.data.get(DOMAIN, {}).get(entry_id)
+    if runtime is None:
+        raise HomeAssistantError(f"Furbulous config entry {entry_id} is not loaded")
+
+    coordinator = runtime["coordinator"]
+    fast_coordinator = runtime["fast_coordinator"]
+    api = coordinator.api
+    timings: list[tuple[str, float]] = []
+    profiler = cProfile.Profile() if call.data[ATTR_CPROFILE] else None
+
+    def _fetch() -> dict[str, Any]:
+        """Fetch everything in the executor, profiled when requested."""
+        if call.data[ATTR_REAUTHENTICATE] and api.email:
+            start = time.perf_counter()
+            api.authenticate()
+            timings.append(("auth", time.perf_counter() - start))
+        if profiler:
+            profiler.enable()
+        try:
+            return api.get_data(True, timings=timings)
+        finally:
+            if profiler:
+                profiler.disable()
+
+    total_start = time.perf_counter()
+    data = await coordinator.executor.async_run(_fetch)
+    fetch_done = time.perf_counter()
+
+    version = coordinator.async_apply_snapshot(data, (FIELD_DEVICES, FIELD_PETS))
+    coordinator.async_set_updated_data(version)
+    fast_coordinator.async_set_updated_data(version)
+    dispatch_done = time.perf_counter()
+
+    phases: dict[str, float] = {}
+    devices: dict[str, dict[str, float]] = {}
+    for name, duration in timings:
+        phase, _, iotid = name.partition(":")
+        if iotid:
+            devices.setdefault(iotid, {})[phase] = _ms(duration)
+            phases[phase] = phases.get(phase, 0) + _ms(duration)
+        else:
+            phases[phase] = _ms(duration)
+    phases["listener_dispatch"] = _ms(dispatch_done - fetch_done)
+
+    result: dict[str, Any] = {
+        "total_ms": _ms(dispatch_done - total_start),
+        "phases": phases,
+        "devices": devices,
+    }
+
+    if profiler:
+        path = hass.config.path(f"furbulous_profile_{int(time.time())}.prof")
+        await hass.async_add_executor_job(profiler.dump_stats, path)
+        result["cprofile_path"] = path
+
+    _LOGGER.info("Profiled refresh for %s: %s", entry_id, result)
+    return result
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH):
+        return
+
+    async def _handle_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        return await _async_profile_refresh(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        _handle_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services when the last entry is unloaded."""
+    if not hass.data.get(DOMAIN):
+        hass.services.async_remove(DOMAIN, SERVICE_PROFILE_REFRESH)
@@ -0,0 +1,91 @@
+"""Shared snapshot store for both refresh cadences."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .diff import SnapshotChange, diff_snapshots
+
+_LOGGER = logging.getLogger(__name__)
+
+FIELD_DEVICES = "devices"
+FIELD_PETS = "pets"
+
+
+class FurbulousSnapshotStore:
+    """Single copy of the account data, written field by field.
+
+    Both coordinators merge their get_data results into the store. The
+    snapshot is copy-on-write: unchanged devices keep their previous dict,
+    so only changed devices are replaced and readers can compare by
+    identity. Every change bumps the global version and the version of the
+    fields that moved.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.data: dict[str, Any] = {FIELD_DEVICES: [], FIELD_PETS: []}
+        self.version = 0
+        self.field_versions: dict[str, int] = {}
+        # Device dicts replaced and device ids dropped by the last apply
+        self.changed_devices: list[dict[str, Any]] = []
+        self.removed_devices: list[Any] = []
+
+    def _bump(self, field: str) -> None:
+        """Record a change of field at the next version."""
+        self.field_versions[field] = self.version + 1
+
+    def apply(self, new: dict[str, Any], fields: tuple[str, ...] = (FIELD_DEVICES, FIELD_PETS)) -> list[SnapshotChange]:
+        """Merge the given fields of a get_data result and return the changes."""
+        old = self.data
+        snapshot = dict(old)
+        changed = False
+        self.changed_devices = []
+        self.removed_devices = []
+
+        for key in ("authenticated", "token", "identity_id"):
+            if key in new and new[key] != old.get(key):
+                snapshot[key] = new[key]
+                changed = True
+
+        if FIELD_DEVICES in fields and FIELD_DEVICES in new:
+            previous = {device.get("id"): device for device in old[FIELD_DEVICES]}
+            devices = []
+            for device in new[FIELD_DEVICES]:
+                device_id = device.get("id")
+                current = previous.get(device_id)
+                # Devices skipped at the refresh deadline keep their values
+                if current is not None and (device.get("stale") or current == device):
+                    devices.append(current)
+                    continue
+                devices.append(device)
+                self.changed_devices.append(device)
+                self._bump(f"device:{device_id}")
+                changed = True
+            if len(devices) != len(old[FIELD_DEVICES]) or any(
+                device.get("id") not in previous for device in devices
+            ):
+                current_ids = {device.get("id") for device in devices}
+                self.removed_devices = [device_id for device_id in previous if device_id not in current_ids]
+                self._bump(FIELD_DEVICES)
+                changed = True
+            snapshot[FIELD_DEVICES] = devices
+
+        if FIELD_PETS in fields and FIELD_PETS in new and new[FIELD_PETS] != old[FIELD_PETS]:
+            snapshot[FIELD_PETS] = new[FIELD_PETS]
+            self._bump(FIELD_PETS)
+            changed = True
+
+        if not changed:
+            return []
+
+        # The initial load is not reported as a change
+        changes = diff_snapshots(old, snapshot) if self.version else []
+        self.version += 1
+        self.data = snapshot
+        _LOGGER.debug("Snapshot store updated to version %d", self.version)
+        return changes
+
+    def field_version(self, field: str) -> int:
+        """Return the version at which a field last changed."""
+        return self.field_versions.get(field, 0)
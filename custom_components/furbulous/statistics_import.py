@@ -0,0 +1,243 @@
+"""Batched import of usage aggregates into Home Assistant long-term statistics."""
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant < 2025.4 only knows has_mean
+    StatisticMeanType = None
+
+from .const import DOMAIN, STATISTICS_DAILY_RETENTION, UNIT_SECONDS, UNIT_TIMES
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+
+def _hour_start(timestamp: float) -> datetime:
+    """Return the UTC start of the hour containing timestamp."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _day_start(day: str) -> datetime:
+    """Return the start of a local day, floored to the UTC hour.
+
+    Statistics must start on a UTC hour; local midnight is not one in half-
+    and quarter-hour time zones.
+    """
+    return _hour_start(
+        datetime.combine(date.fromisoformat(day), datetime.min.time(), dt_util.DEFAULT_TIME_ZONE).timestamp()
+    )
+
+
+def _statistic_id(iotid: str, kind: str) -> str:
+    """Return the external statistic id for a device metric."""
+    return f"{DOMAIN}:{iotid.lower()}_{kind}"
+
+
+def _metadata(iotid: str, kind: str, name: str, unit: str, *, mean: bool, total: bool) -> StatisticMetaData:
+    """Return the metadata of a device statistic for the running Home Assistant version."""
+    metadata = StatisticMetaData(
+        has_sum=total,
+        name=name,
+        source=DOMAIN,
+        statistic_id=_statistic_id(iotid, kind),
+        unit_of_measurement=unit,
+    )
+    if StatisticMeanType is None:
+        metadata["has_mean"] = mean
+    else:
+        metadata["mean_type"] = StatisticMeanType.ARITHMETIC if mean else StatisticMeanType.NONE
+    return metadata
+
+
+class UsageStatisticsImporter:
+    """Write hourly and daily usage aggregates straight into long-term statistics.
+
+    Hourly visit counts come from locally detected visits, daily uses and
+    durations from the wcheader daily stats. Aggregates are buffered and
+    imported in one batch per statistic, each bucket once. Rows are keyed by
+    their start time, so a retried import replaces what it already wrote.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the importer."""
+        self.hass = hass
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.statistics_import")
+        self._devices: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted buffers."""
+        stored = await self._store.async_load() or {}
+        self._devices = stored.get("devices", {})
+        for device in self._devices.values():
+            # Older versions froze a sum per retained day and re-imported every day
+            uses_sum = device.pop("uses_sum", None)
+            if uses_sum:
+                last = max(uses_sum)
+                device.setdefault("daily_uses_sum", uses_sum[last])
+                device.setdefault("daily_imported", {"daily_uses": last, "avg_duration": last})
+            device.setdefault("daily_uses_sum", 0)
+            device.setdefault("daily_imported", {})
+
+    def _device(self, iotid: str, name: str | None = None) -> dict[str, Any]:
+        """Return the buffer of a device, creating it when needed."""
+        device = self._devices.setdefault(
+            iotid,
+            {
+                "name": name or iotid,
+                "hourly": {},
+                "visits_sum": 0,
+                "days": {},
+                "daily_uses_sum": 0,
+                "daily_imported": {},
+                "current": None,
+            },
+        )
+        if name:
+            device["name"] = name
+        return device
+
+    def record_visit(self, iotid: str, timestamp: float) -> None:
+        """Count a locally detected visit in its hourly bucket."""
+        bucket = str(int(_hour_start(timestamp).timestamp()))
+        hourly = self._device(iotid)["hourly"]
+        hourly[bucket] = hourly.get(bucket, 0) + 1
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def update_daily(self, data: dict[str, Any]) -> set[str]:
+        """Track today's totals and return the devices that closed a day."""
+        today = dt_util.now().date().isoformat()
+        closed: set[str] = set()
+        for device_data in data.get("devices", []):
+            iotid = device_data.get("iotid")
+            daily_stats = device_data.get("daily_stats")
+            if not iotid or not daily_stats:
+                continue
+
+            device = self._device(iotid, device_data.get("name"))
+            current = device["current"]
+            if current and current["day"] != today:
+                device["days"][current["day"]] = {
+                    "uses": current["uses"],
+                    "avg_duration": current["avg_duration"],
+                }
+                # Keep only the retention window
+                for day in sorted(device["days"])[:-STATISTICS_DAILY_RETENTION]:
+                    device["days"].pop(day)
+                closed.add(iotid)
+
+            device["current"] = {
+                "day": today,
+                "uses": daily_stats.get("times", 0),
+                "avg_duration": daily_stats.get("avg_duration", 0),
+            }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return closed
+
+    def closed_days(self, iotid: str) -> list[tuple[str, int]]:
+        """Return the retained daily use counts of a device, oldest first."""
+        device = self._devices.get(iotid)
+        if not device:
+            return []
+        return [(day, device["days"][day]["uses"]) for day in sorted(device["days"])]
+
+    def async_flush(self) -> None:
+        """Import every completed bucket in one batch per statistic."""
+        if "recorder" not in self.hass.config.components:
+            return
+
+        current_hour = str(int(_hour_start(dt_util.utcnow().timestamp()).timestamp()))
+        for iotid, device in self._devices.items():
+            self._flush_hourly(iotid, device, current_hour)
+            self._flush_daily(iotid, device)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _flush_hourly(self, iotid: str, device: dict[str, Any], current_hour: str) -> None:
+        """Import completed hourly visit buckets."""
+        completed = sorted((start for start in device["hourly"] if int(start) < int(current_hour)), key=int)
+        if not completed:
+            return
+
+        running = device["visits_sum"]
+        rows: list[StatisticData] = []
+        for start in completed:
+            count = device["hourly"][start]
+            running += count
+            rows.append(
+                StatisticData(
+                    start=datetime.fromtimestamp(int(start), tz=timezone.utc),
+                    state=count,
+                    sum=running,
+                )
+            )
+
+        metadata = _metadata(iotid, "visits", f"{device['name']} visits", UNIT_TIMES, mean=False, total=True)
+        if not self._import(metadata, rows):
+            return
+        _LOGGER.debug("Imported %d hourly visit buckets for %s", len(rows), iotid)
+
+        device["visits_sum"] = running
+        for start in completed:
+            device["hourly"].pop(start)
+
+    def _flush_daily(self, iotid: str, device: dict[str, Any]) -> None:
+        """Import the daily totals closed since the last successful import.
+
+        The last imported day is tracked per statistic, so a day is imported
+        once and a failed import is retried on the next flush.
+        """
+        imported = device["daily_imported"]
+
+        new_days = [day for day in sorted(device["days"]) if day > imported.get("daily_uses", "")]
+        if new_days:
+            running = device["daily_uses_sum"]
+            rows: list[StatisticData] = []
+            for day in new_days:
+                uses = device["days"][day]["uses"]
+                running += uses
+                rows.append(StatisticData(start=_day_start(day), state=uses, sum=running))
+            metadata = _metadata(
+                iotid, "daily_uses", f"{device['name']} daily uses", UNIT_TIMES, mean=False, total=True
+            )
+            if self._import(metadata, rows):
+                device["daily_uses_sum"] = running
+                imported["daily_uses"] = new_days[-1]
+                _LOGGER.debug("Imported %d daily use rows for %s", len(rows), iotid)
+
+        new_days = [day for day in sorted(device["days"]) if day > imported.get("avg_duration", "")]
+        if new_days:
+            rows = []
+            for day in new_days:
+                duration = device["days"][day]["avg_duration"]
+                rows.append(StatisticData(start=_day_start(day), mean=duration, min=duration, max=duration))
+            metadata = _metadata(
+                iotid, "avg_duration", f"{device['name']} average duration", UNIT_SECONDS, mean=True, total=False
+            )
+            if self._import(metadata, rows):
+                imported["avg_duration"] = new_days[-1]
+                _LOGGER.debug("Imported %d daily duration rows for %s", len(rows), iotid)
+
+    def _import(self, metadata: StatisticMetaData, rows: list[StatisticData]) -> bool:
+        """Import rows of one statistic, so a rejected row cannot block the others."""
+        try:
+            async_add_external_statistics(self.hass, metadata, rows)
+        except Exception as err:
+            _LOGGER.error("Importing %s statistics failed: %s", metadata["statistic_id"], err)
+            return False
+        return True
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"devices": self._devices}
+
@@ -6,7 +6,7 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -15,6 +15,7 @@ from homeassistant.helpers.update_coordinator import (
 
 from .const import DOMAIN
 from .device import get_device_info
+from .discovery import async_track_new_items
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,17 +29,18 @@ async def async_setup_entry(
     coordinators = hass.data[DOMAIN][entry.entry_id]
     coordinator = coordinators["coordinator"]
 
-    switches = []
-    for device in coordinator.data.get("devices", []):
+    @callback
+    def _build_device_entities(device: dict[str, Any]) -> list[SwitchEntity]:
+        """Create the switches of a device."""
         # Add switches for HomeKit compatibility
-        switches.extend([
+        return [
             FurbulousCatAutoCleanSwitch(coordinator, device),
             FurbulousCatFullAutoModeSwitch(coordinator, device),
             FurbulousCatDNDSwitch(coordinator, device),
             FurbulousCatChildLockSwitch(coordinator, device),
-        ])
+        ]
 
-    async_add_entities(switches)
+    async_track_new_items(entry, coordinator, async_add_entities, "devices", "id", _build_device_entities)
 
 
 class FurbulousCatAutoCleanSwitch(CoordinatorEntity, SwitchEntity):
@@ -58,7 +60,7 @@ class FurbulousCatAutoCleanSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if auto clean is on."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("iotid") == self.device_data["iotid"]:
                 properties = device.get("properties", {})
@@ -72,8 +74,7 @@ class FurbulousCatAutoCleanSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on auto clean."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_set_property(
             iotid,
             {"catCleanOnOff": 1}
         )
@@ -86,8 +87,7 @@ class FurbulousCatAutoCleanSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off auto clean."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_set_property(
             iotid,
             {"catCleanOnOff": 0}
         )
@@ -115,7 +115,7 @@ class FurbulousCatFullAutoModeSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if full auto mode is on."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("iotid") == self.device_data["iotid"]:
                 properties = device.get("properties", {})
@@ -129,8 +129,7 @@ class FurbulousCatFullAutoModeSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on full auto mode."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_set_property(
             iotid,
             {"FullAutoModeSwitch": 1}
         )
@@ -143,8 +142,7 @@ class FurbulousCatFullAutoModeSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off full auto mode."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_set_property(
             iotid,
             {"FullAutoModeSwitch": 0}
         )
@@ -172,7 +170,7 @@ class FurbulousCatDNDSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if DND is on."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("id") == self.device_data["id"]:
                 return device.get("is_disturb", 0) == 1
@@ -181,8 +179,7 @@ class FurbulousCatDNDSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on DND."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_disturb,
+        success = await self.coordinator.command_queue.async_set_disturb(
             iotid,
             True
         )
@@ -195,8 +192,7 @@ class FurbulousCatDNDSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off DND."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_disturb,
+        success = await self.coordinator.command_queue.async_set_disturb(
             iotid,
             False
         )
@@ -224,7 +220,7 @@ class FurbulousCatChildLockSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if child lock is on."""
-        devices = self.coordinator.data.get("devices", [])
+        devices = self.coordinator.snapshot.get("devices", [])
         for device in devices:
             if device.get("iotid") == self.device_data["iotid"]:
                 properties = device.get("properties", {})
@@ -238,8 +234,7 @@ class FurbulousCatChildLockSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on child lock."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_set_property(
             iotid,
             {"childLockOnOff": 1}
         )
@@ -252,8 +247,7 @@ class FurbulousCatChildLockSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off child lock."""
         iotid = self.device_data["iotid"]
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.api.set_device_property,
+        success = await self.coordinator.command_queue.async_set_property(
             iotid,
             {"childLockOnOff": 0}
         )
@@ -0,0 +1,163 @@
+"""Tuned HTTP transport for the Furbulous Cat API client."""
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection, HTTPSConnection
+
+from .profiling import TimingStats
+
+# Keep idle connections open across poll intervals and detect dead peers
+SOCKET_OPTIONS = [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+class TransportStats:
+    """Connection reuse and handshake counters of one session."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.compressed_responses = 0
+        self.handshakes = TimingStats()
+
+    def record_request(self, response: requests.Response) -> None:
+        """Count a completed request."""
+        with self._lock:
+            self.requests += 1
+            if response.headers.get("Content-Encoding"):
+                self.compressed_responses += 1
+
+    def record_handshake(self, duration: float) -> None:
+        """Record the connect (TCP and TLS) time of a new connection."""
+        with self._lock:
+            self.handshakes.add(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats for diagnostics."""
+        opened = self.handshakes.count
+        return {
+            "requests": self.requests,
+            "connections_opened": opened,
+            "connection_reuse_ratio": round(1 - opened / self.requests, 3) if self.requests else 0,
+            "compressed_responses": self.compressed_responses,
+            "handshake": self.handshakes.as_dict(),
+        }
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTP connection reporting how long it took to connect."""
+
+    def __init__(self, *args: Any, transport_stats: TransportStats, **kwargs: Any) -> None:
+        """Initialize the connection."""
+        super().__init__(*args, **kwargs)
+        self._transport_stats = transport_stats
+
+    def connect(self) -> None:
+        """Connect and record the duration."""
+        start = time.perf_counter()
+        super().connect()
+        self._transport_stats.record_handshake(time.perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection reporting how long the TCP and TLS handshake took."""
+
+    def __init__(self, *args: Any, transport_stats: TransportStats, **kwargs: Any) -> None:
+        """Initialize the connection."""
+        super().__init__(*args, **kwargs)
+        self._transport_stats = transport_stats
+
+    def connect(self) -> None:
+        """Connect and record the duration."""
+        start = time.perf_counter()
+        super().connect()
+        self._transport_stats.record_handshake(time.perf_counter() - start)
+
+
+class _TrackingPoolManager(PoolManager):
+    """Pool manager whose connections report to a TransportStats."""
+
+    def __init__(self, transport_stats: TransportStats, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool manager."""
+        super().__init__(*args, **kwargs)
+        self._transport_stats = transport_stats
+
+    def _new_pool(self, scheme: str, host: str, port: int, request_context: dict[str, Any] | None = None):
+        """Create a connection pool using the timed connection classes."""
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.ConnectionCls = _TimedHTTPSConnection if scheme == "https" else _TimedHTTPConnection
+        pool.conn_kw["transport_stats"] = self._transport_stats
+        return pool
+
+
+class FurbulousHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with a sized keep-alive pool and connection statistics."""
+
+    def __init__(self, pool_size: int, stats: TransportStats | None = None) -> None:
+        """Initialize the adapter."""
+        self.stats = stats or TransportStats()
+        super().__init__(pool_connections=2, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        """Create the tracking pool manager."""
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager = _TrackingPoolManager(
+            self.stats,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            socket_options=SOCKET_OPTIONS,
+            **pool_kwargs,
+        )
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        """Send a request and count it."""
+        response = super().send(request, *args, **kwargs)
+        self.stats.record_request(response)
+        return response
+
+
+def create_session(pool_size: int) -> requests.Session:
+    """Return a session with a keep-alive pool sized to the request concurrency.
+
+    Compressed responses are negotiated explicitly; requests decodes them
+    transparently.
+    """
+    session = requests.Session()
+    adapter = FurbulousHTTPAdapter(pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+    return session
+
+
+def reset_transport(session: Any, pool_size: int) -> None:
+    """Mount a fresh adapter on a session and close every pooled connection.
+
+    Works on wrapped sessions (cassette recorder) as well. Statistics carry
+    over to the new adapter.
+    """
+    adapters = getattr(session, "adapters", None) or {}
+    previous = adapters.get("https://")
+    stats = previous.stats if isinstance(previous, FurbulousHTTPAdapter) else None
+    adapter = FurbulousHTTPAdapter(pool_size, stats)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if previous is not None:
+        previous.close()
+
+
+def transport_stats(session: Any) -> dict[str, Any] | None:
+    """Return the connection statistics of a session created by create_session."""
+    adapters = getattr(session, "adapters", None) or {}
+    adapter = adapters.get("https://")
+    if isinstance(adapter, FurbulousHTTPAdapter):
+        return adapter.stats.as_dict()
+    return None
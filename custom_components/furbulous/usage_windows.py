@@ -0,0 +1,55 @@
+"""Sliding windows over the daily usage totals closed by the statistics importer."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .const import USAGE_WINDOWS
+from .statistics_import import UsageStatisticsImporter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _window_stats(days: list[tuple[str, int]]) -> dict[str, Any]:
+    """Return the window statistics of completed daily use counts (oldest first)."""
+    uses = [count for _, count in days]
+    stats: dict[str, Any] = {"days": len(uses)}
+    for window in USAGE_WINDOWS:
+        recent = uses[-window:]
+        if not recent:
+            continue
+        stats[f"avg_{window}d"] = round(sum(recent) / len(recent), 1)
+        stats[f"min_{window}d"] = min(recent)
+        stats[f"max_{window}d"] = max(recent)
+    stats["last_day"] = days[-1][0] if days else None
+    return stats
+
+
+class UsageWindows:
+    """Daily usage windows for every device of a config entry.
+
+    The closed days come from UsageStatisticsImporter, which already rolls
+    today's wcheader totals over at the local day boundary and persists them.
+    Statistics are cached per device and recomputed only when a day closes.
+    """
+
+    def __init__(self, statistics_importer: UsageStatisticsImporter) -> None:
+        """Initialize the windows."""
+        self._statistics_importer = statistics_importer
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def refresh(self, iotids: set[str]) -> None:
+        """Recompute the windows of devices that just closed a day."""
+        for iotid in iotids:
+            self._stats[iotid] = _window_stats(self._statistics_importer.closed_days(iotid))
+            _LOGGER.debug("Closed daily usage of %s: %s", iotid, self._stats[iotid])
+
+    def get(self, iotid: str) -> dict[str, Any]:
+        """Return the cached window statistics of a device."""
+        stats = self._stats.get(iotid)
+        if stats is None:
+            days = self._statistics_importer.closed_days(iotid)
+            if not days:
+                return {}
+            stats = self._stats[iotid] = _window_stats(days)
+        return stats
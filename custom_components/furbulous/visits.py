@@ -0,0 +1,69 @@
+"""Local visit detection for Furbulous Cat boxes."""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# workstatus value reported while a cat is inside the box
+WORKSTATUS_CAT_DETECTED = 5
+
+
+@dataclass
+class Visit:
+    """A completed litter box visit detected from consecutive snapshots."""
+
+    device_id: int
+    iotid: str
+    weight: int
+    ended_at: float
+
+
+class VisitDetector:
+    """Detect completed visits from workstatus transitions.
+
+    A visit ends when a box leaves the "Cat detected" state. The cat weight
+    reported at that moment is attached to the visit. Work per snapshot is
+    O(devices) and no extra API calls are made.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self._last_status: dict[str, Any] = {}
+        self._last_weight: dict[str, int] = {}
+
+    def process(self, data: dict[str, Any]) -> list[Visit]:
+        """Return the visits that ended since the previous snapshot."""
+        visits: list[Visit] = []
+        now = time.time()
+
+        for device in data.get("devices", []):
+            iotid = device.get("iotid")
+            if not iotid:
+                continue
+
+            properties = device.get("properties", {})
+            status = properties.get("workstatus")
+            weight = properties.get("catWeight")
+
+            # Remember the last non-zero weight seen while the cat was inside,
+            # some firmwares reset catWeight as soon as the cat leaves.
+            if status == WORKSTATUS_CAT_DETECTED and weight:
+                self._last_weight[iotid] = int(weight)
+
+            previous = self._last_status.get(iotid)
+            self._last_status[iotid] = status
+
+            if previous == WORKSTATUS_CAT_DETECTED and status != WORKSTATUS_CAT_DETECTED:
+                visit_weight = int(weight) if weight else self._last_weight.get(iotid, 0)
+                self._last_weight.pop(iotid, None)
+                if visit_weight <= 0:
+                    _LOGGER.debug("Visit on %s ended without a usable weight", iotid)
+                    continue
+                _LOGGER.debug("Visit detected on %s: %d g", iotid, visit_weight)
+                visits.append(Visit(device.get("id"), iotid, visit_weight, now))
+
+        return visits
@@ -0,0 +1,166 @@
+"""Watchdog detecting coordinators that stopped refreshing."""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    EVENT_COORDINATOR_STALLED,
+    WATCHDOG_HUNG_FACTOR,
+    WATCHDOG_INTERVAL,
+    WATCHDOG_STALE_FACTOR,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+REASON_HUNG = "hung"
+REASON_STALE = "stale"
+
+
+class FurbulousWatchdog:
+    """Check the coordinators of an entry for hung and stalled refreshes.
+
+    A refresh running for several update intervals is hung; a coordinator
+    without a successful refresh for much longer is stale. On the first
+    detection a repair issue is raised, an event fired and, when given, the
+    recover callback is run once. The issue is cleared on the next
+    successful refresh.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinators: Iterable[DataUpdateCoordinator],
+        recover: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the watchdog."""
+        self.hass = hass
+        self._entry = entry
+        self._coordinators = list(coordinators)
+        self._recover = recover
+        self._started = time.monotonic()
+        # Coordinator name -> reason of the current stall
+        self.stalled: dict[str, str] = {}
+        self._stalled_at: dict[str, float] = {}
+        self.stall_count = 0
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Start checking periodically and return the function that stops it."""
+        unsub = async_track_time_interval(self.hass, self._async_check, timedelta(seconds=WATCHDOG_INTERVAL))
+
+        @callback
+        def _async_stop() -> None:
+            unsub()
+            # Issues of an unloaded entry cannot clear themselves anymore
+            for coordinator in self._coordinators:
+                ir.async_delete_issue(self.hass, DOMAIN, self._issue_id(coordinator))
+
+        return _async_stop
+
+    @callback
+    def _async_check(self, _now: datetime | None = None) -> None:
+        """Look for coordinators that stopped refreshing."""
+        now = time.monotonic()
+        for coordinator in self._coordinators:
+            if coordinator.update_interval is None:
+                continue
+            interval = coordinator.update_interval.total_seconds()
+            if coordinator.name in self._stalled_at:
+                last_success = getattr(coordinator, "last_success", None)
+                if last_success is not None and last_success > self._stalled_at[coordinator.name]:
+                    self._async_recovered(coordinator)
+                continue
+            reason, seconds = self._stall_reason(coordinator, interval, now)
+            if reason is not None:
+                self._async_stalled(coordinator, reason, seconds)
+
+    def _stall_reason(
+        self, coordinator: DataUpdateCoordinator, interval: float, now: float
+    ) -> tuple[str | None, float]:
+        """Return why a coordinator is stalled, if it is, and for how long."""
+        started = getattr(coordinator, "refresh_started", None)
+        if started is not None and now - started > interval * WATCHDOG_HUNG_FACTOR:
+            return REASON_HUNG, now - started
+        last_success = getattr(coordinator, "last_success", None) or self._started
+        if now - last_success > interval * WATCHDOG_STALE_FACTOR:
+            return REASON_STALE, now - last_success
+        return None, 0.0
+
+    @callback
+    def _async_stalled(self, coordinator: DataUpdateCoordinator, reason: str, seconds: float) -> None:
+        """Report a stall and try to recover from it."""
+        self.stalled[coordinator.name] = reason
+        self._stalled_at[coordinator.name] = time.monotonic()
+        self.stall_count += 1
+        _LOGGER.warning(
+            "Furbulous coordinator %s is %s: no refresh completed for %.0f s", coordinator.name, reason, seconds
+        )
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            self._issue_id(coordinator),
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key="coordinator_stalled",
+            translation_placeholders={
+                "coordinator": coordinator.name,
+                "reason": reason,
+                "seconds": str(round(seconds)),
+            },
+        )
+        self.hass.bus.async_fire(
+            EVENT_COORDINATOR_STALLED,
+            {
+                "entry_id": self._entry.entry_id,
+                "coordinator": coordinator.name,
+                "reason": reason,
+                "seconds": round(seconds),
+            },
+        )
+        if self._recover is not None:
+            _LOGGER.info("Recreating the Furbulous HTTP connections")
+            self.hass.async_add_executor_job(self._recover)
+
+    @callback
+    def _async_recovered(self, coordinator: DataUpdateCoordinator) -> None:
+        """Clear the issue of a coordinator that refreshes again."""
+        self.stalled.pop(coordinator.name)
+        self._stalled_at.pop(coordinator.name)
+        _LOGGER.info("Furbulous coordinator %s refreshes again", coordinator.name)
+        ir.async_delete_issue(self.hass, DOMAIN, self._issue_id(coordinator))
+
+    def _issue_id(self, coordinator: DataUpdateCoordinator) -> str:
+        """Return the repair issue id of a coordinator."""
+        return f"coordinator_stalled_{self._entry.entry_id}_{slugify(coordinator.name)}"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the watchdog state for diagnostics."""
+        now = time.monotonic()
+        return {
+            "stalled": dict(self.stalled),
+            "stall_count": self.stall_count,
+            "coordinators": {
+                coordinator.name: {
+                    "refresh_running_s": round(now - coordinator.refresh_started, 1)
+                    if getattr(coordinator, "refresh_started", None) is not None
+                    else None,
+                    "since_last_success_s": round(now - coordinator.last_success, 1)
+                    if getattr(coordinator, "last_success", None) is not None
+                    else None,
+                }
+                for coordinator in self._coordinators
+            },
+        }
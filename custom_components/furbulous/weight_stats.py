@@ -0,0 +1,234 @@
+"""Constant-memory rolling weight statistics per litter box and per attributed pet."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    WEIGHT_EWMA_ALPHA,
+    WEIGHT_HISTORY_SIZE,
+    WEIGHT_MEDIAN_WINDOW,
+)
+from .ring_buffer import RingBuffer
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+SECONDS_PER_DAY = 86400
+
+
+class TrendWindow:
+    """Least-squares weight slope over the samples of the last ``days`` days.
+
+    Running sums are updated as samples enter and leave the window, so adding
+    a sample or ageing the window costs amortized O(1). Times are measured in
+    days from the first sample added since the window was last empty.
+    """
+
+    def __init__(self, days: int) -> None:
+        """Initialize an empty window."""
+        self._span = days * SECONDS_PER_DAY
+        self._points: deque[tuple[float, int]] = deque()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear the running sums."""
+        self._origin: float | None = None
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+
+    def _accumulate(self, timestamp: float, weight: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a sample from the running sums."""
+        x = (timestamp - self._origin) / SECONDS_PER_DAY
+        self._sum_x += sign * x
+        self._sum_y += sign * weight
+        self._sum_xx += sign * x * x
+        self._sum_xy += sign * x * weight
+
+    def add(self, timestamp: float, weight: int) -> None:
+        """Add a sample and drop the ones that fell out of the window."""
+        if self._origin is None:
+            self._origin = timestamp
+        self._points.append((timestamp, weight))
+        self._accumulate(timestamp, weight, 1)
+        self.expire(timestamp)
+
+    def expire(self, now: float) -> bool:
+        """Drop samples older than the window (or beyond the history size)."""
+        since = now - self._span
+        expired = False
+        while self._points and (self._points[0][0] < since or len(self._points) > WEIGHT_HISTORY_SIZE):
+            self._accumulate(*self._points.popleft(), -1)
+            expired = True
+        if not self._points:
+            self._reset()
+        return expired
+
+    def slope(self) -> float | None:
+        """Return the slope in grams per day, or None with fewer than two samples."""
+        count = len(self._points)
+        if count < 2:
+            return None
+        denominator = count * self._sum_xx - self._sum_x ** 2
+        if denominator <= 1e-9:
+            return None
+        return round((count * self._sum_xy - self._sum_x * self._sum_y) / denominator, 1)
+
+
+class WeightTracker:
+    """Incremental weight statistics for one series of visits.
+
+    The last WEIGHT_HISTORY_SIZE samples are kept in a ring buffer for
+    persistence. Minimum and maximum follow monotonic queues, the median
+    sorts only its small window and the trends keep running sums, so a
+    visit costs amortized O(1) instead of a pass over the history.
+    """
+
+    def __init__(self, samples: list[tuple[float, int]] | None = None, ewma: float | None = None) -> None:
+        """Initialize the tracker from persisted samples."""
+        self._samples = RingBuffer(WEIGHT_HISTORY_SIZE)
+        self._added = 0
+        self._minimum: deque[tuple[int, int]] = deque()
+        self._maximum: deque[tuple[int, int]] = deque()
+        self._trends = {"trend_7d": TrendWindow(7), "trend_30d": TrendWindow(30)}
+        self.ewma = ewma
+        self.stats: dict[str, Any] = {}
+        for timestamp, weight in (samples or [])[-WEIGHT_HISTORY_SIZE:]:
+            self._append(timestamp, weight)
+        self.expire(time.time())
+
+    def _append(self, timestamp: float, weight: int) -> None:
+        """Feed a sample to the ring buffer, extremes and trend windows."""
+        index = self._added
+        self._added += 1
+        self._samples.append((timestamp, weight))
+
+        # Monotonic queues: the front is the extreme of the retained samples
+        while self._minimum and self._minimum[-1][1] >= weight:
+            self._minimum.pop()
+        while self._maximum and self._maximum[-1][1] <= weight:
+            self._maximum.pop()
+        self._minimum.append((index, weight))
+        self._maximum.append((index, weight))
+        oldest = self._added - WEIGHT_HISTORY_SIZE
+        for queue in (self._minimum, self._maximum):
+            while queue[0][0] < oldest:
+                queue.popleft()
+
+        for window in self._trends.values():
+            window.add(timestamp, weight)
+
+    def add(self, weight: int, timestamp: float) -> None:
+        """Record a visit weight in grams."""
+        self._append(timestamp, weight)
+        if self.ewma is None:
+            self.ewma = float(weight)
+        else:
+            self.ewma = WEIGHT_EWMA_ALPHA * weight + (1 - WEIGHT_EWMA_ALPHA) * self.ewma
+        self._refresh()
+
+    def expire(self, now: float) -> bool:
+        """Age the trend windows and return whether a trend changed."""
+        expired = False
+        for window in self._trends.values():
+            expired |= window.expire(now)
+        if expired or not self.stats:
+            self._refresh()
+        return expired
+
+    def _refresh(self) -> None:
+        """Rebuild the cached statistics from the incremental state."""
+        last = self._samples.newest()
+        if last is None:
+            self.stats = {}
+            return
+
+        recent = sorted(weight for _, weight in self._samples.last(WEIGHT_MEDIAN_WINDOW))
+        middle = len(recent) // 2
+        if len(recent) % 2:
+            median = recent[middle]
+        else:
+            median = (recent[middle - 1] + recent[middle]) / 2
+
+        self.stats = {
+            "last": last[1],
+            "average": round(self.ewma, 1) if self.ewma is not None else None,
+            "minimum": self._minimum[0][1],
+            "maximum": self._maximum[0][1],
+            "median": median,
+            **{key: window.slope() for key, window in self._trends.items()},
+            "samples": len(self._samples),
+            "last_visit": last[0],
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        return {"samples": [list(sample) for sample in self._samples], "ewma": self.ewma}
+
+
+class WeightStatistics:
+    """Weight trackers of a config entry, persisted to storage.
+
+    Litter boxes are tracked by iotid, for every visit they weigh, and
+    attributed pets by ``pet_<pet_id>``.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the statistics store."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.weight_stats")
+        self._trackers: dict[str, WeightTracker] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Load persisted samples."""
+        stored = await self._store.async_load() or {}
+        # Older versions saved the trackers under "cats"
+        for key, tracker_data in (stored.get("trackers") or stored.get("cats") or {}).items():
+            self._trackers[key] = WeightTracker(
+                tracker_data.get("samples"), tracker_data.get("ewma")
+            )
+        _LOGGER.debug("Loaded weight statistics for %d series", len(self._trackers))
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call update_callback whenever the trends age without a visit."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    def add(self, key: str, weight: int, timestamp: float) -> None:
+        """Record a visit weight for the box iotid or pet key."""
+        tracker = self._trackers.setdefault(key, WeightTracker())
+        tracker.add(weight, timestamp)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_expire(self, now: float) -> None:
+        """Age every trend window and notify listeners when one changed."""
+        expired = False
+        for tracker in self._trackers.values():
+            expired |= tracker.expire(now)
+        if expired:
+            for update_callback in list(self._listeners):
+                update_callback()
+
+    def get(self, key: str) -> dict[str, Any]:
+        """Return the cached statistics for a box iotid or pet key."""
+        tracker = self._trackers.get(key)
+        return tracker.stats if tracker else {}
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"trackers": {key: tracker.as_dict() for key, tracker in self._trackers.items()}}
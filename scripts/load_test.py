@@ -0,0 +1,312 @@
+"""Load-test harness for the Furbulous Cat integration.
+
+Starts a local fake Furbulous API and a test Home Assistant instance with
+several config entries, then reports API executor occupancy and rejections,
+event-loop lag, memory and state writes per second while the number of boxes
+grows.
+
+Requires the development dependencies of a Home Assistant custom
+integration (``pip install pytest-homeassistant-custom-component``).
+Run it from the repository root:
+
+    python scripts/load_test.py --accounts 3 --boxes 1 10 25 50 --duration 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.core import Event, HomeAssistant, callback  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.furbulous.const import CONF_BASE_URL, DOMAIN  # noqa: E402
+
+_LOGGER = logging.getLogger("furbulous.load_test")
+
+
+class FakeFurbulousAPI:
+    """Minimal stand-in for the Furbulous cloud.
+
+    Every account owns ``boxes`` devices. Each device randomly goes through
+    visits and cleaning cycles so that state changes look like real traffic.
+    """
+
+    def __init__(self, accounts: int, latency: float) -> None:
+        """Initialize the fake API."""
+        self.accounts = accounts
+        self.boxes = 0
+        self.latency = latency
+        self.requests = 0
+        self._status: dict[str, int] = {}
+
+    def set_boxes(self, boxes: int) -> None:
+        """Change the number of boxes per account."""
+        self.boxes = boxes
+
+    def _account(self, request: web.Request) -> int:
+        """Return the account index encoded in the token."""
+        token = request.headers.get("authorization", "token-0")
+        return int(token.rsplit("-", 1)[-1])
+
+    def _iotid(self, account: int, box: int) -> str:
+        """Return the iotid of a box."""
+        return f"LT{account:03d}{box:05d}"
+
+    async def _reply(self, data) -> web.Response:
+        """Return a successful API response after the simulated latency."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.json_response({"code": 0, "message": "Success", "data": data})
+
+    async def login(self, request: web.Request) -> web.Response:
+        """Handle POST /app/v1/auth/login."""
+        payload = await request.json()
+        account = int(payload["account"].split("@")[0].rsplit("-", 1)[-1])
+        return await self._reply({"token": f"token-{account}", "identityid": f"identity-{account}"})
+
+    async def device_list(self, request: web.Request) -> web.Response:
+        """Handle GET /app/v1/device/list."""
+        account = self._account(request)
+        return await self._reply([
+            {
+                "id": account * 100000 + box,
+                "name": f"Box {account}-{box}",
+                "iotid": self._iotid(account, box),
+                "device_online": 1,
+                "is_disturb": 0,
+                "product_name": "Furbulous Box",
+                "active_time": int(time.time()),
+                "platform": 2,
+            }
+            for box in range(self.boxes)
+        ])
+
+    async def properties(self, request: web.Request) -> web.Response:
+        """Handle GET /app/v1/device/properties/get."""
+        iotid = request.query["iotid"]
+        status = self._status.get(iotid, 0)
+        # Idle boxes occasionally get a visit, busy ones go back to idle
+        if status == 0 and random.random() < 0.05:
+            status = 5
+        elif status == 5:
+            status = 2
+        elif status == 2:
+            status = 0
+        self._status[iotid] = status
+
+        now = int(time.time() * 1000)
+        values = {
+            "workstatus": status,
+            "catWeight": random.randint(3800, 4200) if status == 5 else 0,
+            "errorReportEvent": 0,
+            "catCleanOnOff": 1,
+            "FullAutoModeSwitch": 1,
+            "childLockOnOff": 0,
+            "masterSleepOnOff": 0,
+            "DisplaySwitch": 1,
+            "handMode": 0,
+            "completionStatus": 1,
+            "catLitterType": 0,
+            "excreteTimerEveryday": 120,
+            "mcuversion": "1.0.0",
+            "wifivertion": "1.0.0",
+            "trdversion": "1.0.0",
+        }
+        return await self._reply({key: {"value": value, "time": now} for key, value in values.items()})
+
+    async def daily_stats(self, request: web.Request) -> web.Response:
+        """Handle GET /app/v1/device/data/wcheader."""
+        return await self._reply({"times": 3, "avg_duration": 60, "times_diff": 0, "avg_diff": 0})
+
+    async def pets(self, request: web.Request) -> web.Response:
+        """Handle GET /app/v1/pet/list."""
+        return await self._reply({"list": [{"pet_id": 1, "nickname": "Load", "weight": 4.0}]})
+
+    async def unread(self, request: web.Request) -> web.Response:
+        """Handle GET /app/v1/user/devicePushRecord/unread."""
+        return await self._reply({"count": 0})
+
+    async def write(self, request: web.Request) -> web.Response:
+        """Handle property and DND writes."""
+        return await self._reply({})
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_post("/app/v1/auth/login", self.login)
+        app.router.add_get("/app/v1/device/list", self.device_list)
+        app.router.add_get("/app/v1/device/properties/get", self.properties)
+        app.router.add_get("/app/v1/device/data/wcheader", self.daily_stats)
+        app.router.add_get("/app/v1/pet/list", self.pets)
+        app.router.add_get("/app/v1/user/devicePushRecord/unread", self.unread)
+        app.router.add_post("/app/v1/device/properties/set", self.write)
+        app.router.add_put("/app/v1/device/disturb", self.write)
+        return app
+
+
+@dataclass
+class Sample:
+    """Metrics collected during one load step."""
+
+    loop_lag: list[float] = field(default_factory=list)
+    executor_busy: list[int] = field(default_factory=list)
+    executor_queued: list[int] = field(default_factory=list)
+    executor_rejected: int = 0
+    state_writes: int = 0
+
+
+async def _sample(hass: HomeAssistant, sample: Sample, stop: asyncio.Event) -> None:
+    """Sample event-loop lag and API executor occupancy every 100 ms.
+
+    Occupancy is summed over the per-entry FurbulousExecutor pools, which
+    run every cloud request; the loop's default executor is not used.
+    """
+    interval = 0.1
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        sample.loop_lag.append(max(0.0, time.perf_counter() - start - interval))
+        metrics = [
+            runtime["executor"].metrics()
+            for runtime in hass.data.get(DOMAIN, {}).values()
+            if isinstance(runtime, dict) and "executor" in runtime
+        ]
+        sample.executor_busy.append(sum(item["running"] for item in metrics))
+        sample.executor_queued.append(sum(item["queued"] for item in metrics))
+        # Executors are recreated on every reload, so the counter covers this step
+        sample.executor_rejected = sum(item["rejected"] for item in metrics)
+
+
+async def _run_step(
+    hass: HomeAssistant, api: FakeFurbulousAPI, entries: list[MockConfigEntry], boxes: int, duration: float, fast_interval: float
+) -> dict:
+    """Set up the entries with the given box count and measure them."""
+    api.set_boxes(boxes)
+    for entry in entries:
+        await hass.config_entries.async_reload(entry.entry_id)
+        coordinators = hass.data[DOMAIN][entry.entry_id]
+        coordinators["fast_coordinator"].update_interval = timedelta(seconds=fast_interval)
+    await hass.async_block_till_done()
+
+    sample = Sample()
+
+    @callback
+    def _count_state_write(event: Event) -> None:
+        sample.state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample(hass, sample, stop))
+    requests_before = api.requests
+    gc.collect()
+    memory_before = tracemalloc.get_traced_memory()[0]
+
+    await asyncio.sleep(duration)
+
+    stop.set()
+    await sampler
+    unsub()
+    memory_after, memory_peak = tracemalloc.get_traced_memory()
+
+    lag = sorted(sample.loop_lag) or [0.0]
+    return {
+        "boxes": boxes * len(entries),
+        "loop_lag_p50_ms": statistics.median(lag) * 1000,
+        "loop_lag_p99_ms": lag[int(len(lag) * 0.99) - 1] * 1000 if len(lag) > 1 else lag[0] * 1000,
+        "executor_busy_max": max(sample.executor_busy, default=0),
+        "executor_queue_max": max(sample.executor_queued, default=0),
+        "executor_rejected": sample.executor_rejected,
+        "memory_delta_kb": (memory_after - memory_before) / 1024,
+        "memory_peak_kb": memory_peak / 1024,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "state_writes_per_s": sample.state_writes / duration,
+        "api_requests_per_s": (api.requests - requests_before) / duration,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the load test."""
+    api = FakeFurbulousAPI(args.accounts, args.latency)
+    runner = web.AppRunner(api.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    tracemalloc.start()
+    results = []
+    async with async_test_home_assistant() as hass:
+        # Allow loading the integration from custom_components/
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+        entries = []
+        for account in range(args.accounts):
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                unique_id=f"load-{account}@example.com",
+                data={
+                    "email": f"load-{account}@example.com",
+                    "password": "load-test",
+                    CONF_BASE_URL: base_url,
+                },
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+
+        api.set_boxes(args.boxes[0])
+        for entry in entries:
+            await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        for boxes in args.boxes:
+            _LOGGER.info("Measuring %d account(s) x %d box(es)", args.accounts, boxes)
+            results.append(await _run_step(hass, api, entries, boxes, args.duration, args.fast_interval))
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    await runner.cleanup()
+
+    columns = list(results[0])
+    print(" | ".join(columns))
+    for result in results:
+        print(" | ".join(f"{result[column]:.1f}" if isinstance(result[column], float) else str(result[column]) for column in columns))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=2, help="Config entries to create")
+    parser.add_argument("--boxes", type=int, nargs="+", default=[1, 10, 25, 50], help="Boxes per account for each step")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds measured per step")
+    parser.add_argument("--fast-interval", type=float, default=20, help="Fast coordinator interval in seconds")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated cloud latency in seconds")
+    parser.add_argument("--port", type=int, default=18443, help="Port of the fake API")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
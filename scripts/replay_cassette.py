@@ -0,0 +1,50 @@
+"""Replay a recorded cassette through the API client and visit detection.
+
+Cassettes are recorded by enabling "Record API traffic" in the integration
+options. This script replays one offline to benchmark the client and the
+visit-detection logic against real traffic:
+
+    python scripts/replay_cassette.py furbulous_<entry>_<ts>.jsonl.gz --cycles 500
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import types
+from pathlib import Path
+
+# Load the submodules without the package __init__, which needs Home Assistant
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "furbulous"
+package = types.ModuleType("furbulous")
+package.__path__ = [str(PACKAGE_DIR)]
+sys.modules["furbulous"] = package
+
+from furbulous.cassette import ReplaySession  # noqa: E402
+from furbulous.furbulous_api import FurbulousCatAPI  # noqa: E402
+from furbulous.visits import VisitDetector  # noqa: E402
+
+
+def main() -> None:
+    """Run the replay benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette", help="Path to a .jsonl.gz cassette")
+    parser.add_argument("--cycles", type=int, default=100, help="Number of get_data cycles to run")
+    parser.add_argument("--speed", type=float, default=0, help="Replay speed factor (0 = no recorded latency)")
+    args = parser.parse_args()
+
+    session = ReplaySession.load(args.cassette, speed=args.speed)
+    api = FurbulousCatAPI(email="", password="", token="replay", session=session)
+    detector = VisitDetector()
+
+    visits = 0
+    start = time.perf_counter()
+    for _ in range(args.cycles):
+        visits += len(detector.process(api.get_data()))
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.cycles} cycles in {elapsed:.3f} s ({elapsed / args.cycles * 1000:.2f} ms/cycle), {visits} visit(s) detected")
+
+
+if __name__ == "__main__":
+    main()
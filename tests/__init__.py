@@ -0,0 +1 @@
+"""Tests for the Furbulous Cat integration."""
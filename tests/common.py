@@ -0,0 +1,22 @@
+"""Helpers shared by the Furbulous Cat tests."""
+from __future__ import annotations
+
+from typing import Any
+
+
+def make_device(
+    device_id: int = 1,
+    iotid: str = "IOT001",
+    workstatus: int = 0,
+    error: int = 0,
+    **properties: Any,
+) -> dict[str, Any]:
+    """Return a device dict shaped like the get_data result."""
+    values = {"workstatus": workstatus, "errorReportEvent": error, **properties}
+    return {
+        "id": device_id,
+        "iotid": iotid,
+        "name": f"Box {device_id}",
+        "device_online": 1,
+        "properties": {key: {"value": value, "time": 0} for key, value in values.items()},
+    }
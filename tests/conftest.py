@@ -0,0 +1,10 @@
+"""Fixtures for Furbulous Cat tests."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow loading the integration from custom_components/ in every test."""
+    yield
@@ -0,0 +1,77 @@
+"""Tests for multi-cat visit attribution."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.furbulous.attribution import PetWeightClusterer, pet_weight_grams
+
+PETS = [
+    {"pet_id": 1, "nickname": "Small", "weight": 3.5},
+    {"pet_id": 2, "nickname": "Large", "weight": 6.0},
+]
+
+
+def test_pet_weight_grams() -> None:
+    """Kilograms are converted, grams passed through and invalid values ignored."""
+    assert pet_weight_grams({"weight": 4.2}) == 4200
+    assert pet_weight_grams({"weight": 4200}) == 4200
+    assert pet_weight_grams({"weight": 0}) is None
+    assert pet_weight_grams({"weight": "heavy"}) is None
+
+
+async def test_assigns_nearest_pet(hass: HomeAssistant) -> None:
+    """A visit goes to the pet with the nearest centroid, which follows it."""
+    clusterer = PetWeightClusterer(hass, "entry")
+    clusterer.update_pets(PETS)
+    now = dt_util.utcnow().timestamp()
+
+    assert clusterer.assign(3600, now) == 1
+    assert clusterer.assign(5900, now) == 2
+    assert clusterer.centroid(1) == 3510
+    assert clusterer.counters(1)["total"] == 1
+    assert clusterer.counters(1)["today"] == 1
+
+
+async def test_rejects_outliers(hass: HomeAssistant) -> None:
+    """Weights far from every pet stay unassigned."""
+    clusterer = PetWeightClusterer(hass, "entry")
+    clusterer.update_pets(PETS)
+
+    assert clusterer.assign(12000, dt_util.utcnow().timestamp()) is None
+    assert clusterer.assign(4000, dt_util.utcnow().timestamp()) is not None
+
+
+async def test_empty_pet_list_keeps_centroids(hass: HomeAssistant) -> None:
+    """A failed pet fetch (empty list) does not drop learned centroids."""
+    clusterer = PetWeightClusterer(hass, "entry")
+    clusterer.update_pets(PETS)
+    clusterer.update_pets([])
+
+    assert clusterer.centroid(1) == 3500
+    assert clusterer.centroid(2) == 6000
+
+
+async def test_forget_drops_retired_pets(hass: HomeAssistant) -> None:
+    """Retired pets lose their centroid and counters."""
+    clusterer = PetWeightClusterer(hass, "entry")
+    clusterer.update_pets(PETS)
+    clusterer.assign(3500, dt_util.utcnow().timestamp())
+
+    clusterer.forget({1})
+
+    assert clusterer.centroid(1) is None
+    assert clusterer.counters(1) == {"total": 0, "today": 0}
+    assert clusterer.assign(5000, dt_util.utcnow().timestamp()) == 2
+
+
+async def test_today_follows_the_configured_time_zone(hass: HomeAssistant) -> None:
+    """A visit from the previous local day does not count for today."""
+    clusterer = PetWeightClusterer(hass, "entry")
+    clusterer.update_pets(PETS)
+    local_midnight = dt_util.start_of_local_day()
+
+    clusterer.assign(3500, local_midnight.timestamp() - 60)
+
+    assert clusterer.counters(1)["total"] == 1
+    assert clusterer.counters(1)["today"] == 0
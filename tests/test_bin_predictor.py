@@ -0,0 +1,65 @@
+"""Tests for the waste bin fill prediction."""
+from __future__ import annotations
+
+from custom_components.furbulous.bin_predictor import WORKSTATUS_CLEANING, WasteBinState
+from custom_components.furbulous.visits import WORKSTATUS_CAT_DETECTED
+
+IDLE = 0
+BIN_FULL = 32
+
+
+def _cycle(state: WasteBinState, now: float, *statuses: int) -> None:
+    """Feed a sequence of workstatus values with no error."""
+    for status in statuses:
+        state.process(status, 0, now)
+
+
+def test_visit_straight_into_cleaning() -> None:
+    """A cat leaving straight into a cleaning cycle counts a visit and a cycle."""
+    state = WasteBinState(emptied_at=0)
+
+    _cycle(state, 0, IDLE, WORKSTATUS_CAT_DETECTED, WORKSTATUS_CLEANING, IDLE)
+
+    assert state.visits == 1
+    assert state.cycles == 1
+
+
+def test_first_status_is_a_baseline() -> None:
+    """The first status seen does not count as a transition."""
+    state = WasteBinState(emptied_at=0)
+
+    assert not state.process(WORKSTATUS_CLEANING, 0, 0)
+    assert state.cycles == 0
+
+
+def test_learns_capacity_and_empties() -> None:
+    """A full report teaches the capacity; clearing it empties the bin."""
+    state = WasteBinState(emptied_at=0)
+    for _ in range(10):
+        _cycle(state, 0, IDLE, WORKSTATUS_CLEANING)
+
+    assert state.fill_percent() is None
+    assert state.process(IDLE, BIN_FULL, 3600)
+    assert state.capacity == 10
+    assert state.fill_percent() == 100.0
+    assert state.hours_to_full(3600) == 0.0
+
+    assert state.process(IDLE, 0, 7200)
+    assert state.cycles == 0
+    assert state.emptied_at == 7200
+    assert state.fill_percent() == 0.0
+
+
+def test_hours_to_full() -> None:
+    """The remaining cycles are projected at the rate since the bin was emptied."""
+    state = WasteBinState(cycles=5, emptied_at=0, capacity=10.0)
+
+    assert state.fill_percent() == 50.0
+    assert state.hours_to_full(5 * 3600) == 5.0
+
+
+def test_round_trip() -> None:
+    """A state rebuilt from as_dict() keeps its counters and capacity."""
+    state = WasteBinState(cycles=3, visits=4, emptied_at=100, capacity=12.5, full=False)
+
+    assert WasteBinState(**state.as_dict()).as_dict() == state.as_dict()
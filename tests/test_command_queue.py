@@ -0,0 +1,156 @@
+"""Tests for the durable device command queue."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.furbulous.command_queue import FurbulousCommandQueue
+from custom_components.furbulous.const import COMMAND_QUEUE_MAX_AGE, DOMAIN
+from custom_components.furbulous.executor import FurbulousExecutor
+from custom_components.furbulous.furbulous_api import FurbulousCatConnectionError
+
+IOTID = "IOT001"
+
+
+class FakeAPI:
+    """API stand-in that can be switched offline."""
+
+    def __init__(self) -> None:
+        """Initialize the fake."""
+        self.online = True
+        self.sent: list[tuple[str, Any]] = []
+
+    def _send(self, command: tuple[str, Any]) -> bool:
+        """Record a command or fail like an unreachable cloud."""
+        if not self.online:
+            raise FurbulousCatConnectionError("offline")
+        self.sent.append(command)
+        return True
+
+    def set_device_property(self, iotid: str, properties: dict[str, Any]) -> bool:
+        """Set device properties."""
+        return self._send(("property", properties))
+
+    def set_device_disturb(self, iotid: str, is_disturb: bool) -> bool:
+        """Set Do Not Disturb."""
+        return self._send(("disturb", is_disturb))
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    """Return an online fake API."""
+    return FakeAPI()
+
+
+@pytest.fixture
+async def queue(hass: HomeAssistant, api: FakeAPI) -> FurbulousCommandQueue:
+    """Return a loaded command queue."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    executor = FurbulousExecutor("test", 1, 4)
+    command_queue = FurbulousCommandQueue(hass, entry, api, executor)
+    await command_queue.async_load()
+    yield command_queue
+    executor.shutdown()
+
+
+async def test_sends_when_online(queue: FurbulousCommandQueue, api: FakeAPI) -> None:
+    """Commands go straight out while the cloud answers."""
+    assert await queue.async_set_property(IOTID, {"childLockOnOff": 1})
+
+    assert api.sent == [("property", {"childLockOnOff": 1})]
+    assert queue.depth(IOTID) == 0
+
+
+async def test_offline_writes_collapse(queue: FurbulousCommandQueue, api: FakeAPI) -> None:
+    """Writes to the same property while offline keep only the latest value."""
+    api.online = False
+
+    assert await queue.async_set_property(IOTID, {"childLockOnOff": 1})
+    assert await queue.async_set_disturb(IOTID, True)
+    assert await queue.async_set_property(IOTID, {"childLockOnOff": 0})
+    assert queue.depth(IOTID) == 2
+
+    api.online = True
+    await queue.async_replay()
+
+    assert api.sent == [("disturb", True), ("property", {"childLockOnOff": 0})]
+    assert queue.pending == 0
+
+
+async def test_writes_queue_behind_a_backlog(queue: FurbulousCommandQueue, api: FakeAPI) -> None:
+    """A new write waits behind queued ones to keep the order."""
+    api.online = False
+    await queue.async_set_property(IOTID, {"childLockOnOff": 1})
+    api.online = True
+
+    await queue.async_set_property(IOTID, {"DisplaySwitch": 0})
+
+    assert api.sent == []
+    assert queue.depth(IOTID) == 2
+
+
+async def test_actions_are_never_queued(queue: FurbulousCommandQueue, api: FakeAPI) -> None:
+    """One-shot actions fail right away when the cloud is unreachable."""
+    api.online = False
+
+    with pytest.raises(HomeAssistantError):
+        await queue.async_send_action(IOTID, {"handMode": 1})
+
+    assert queue.pending == 0
+
+
+async def test_replay_stops_at_a_connection_error(queue: FurbulousCommandQueue, api: FakeAPI) -> None:
+    """Commands stay queued while the cloud is still unreachable."""
+    api.online = False
+    await queue.async_set_property(IOTID, {"childLockOnOff": 1})
+
+    await queue.async_replay()
+
+    assert queue.depth(IOTID) == 1
+
+
+async def test_stale_commands_are_dropped(
+    queue: FurbulousCommandQueue, api: FakeAPI, freezer: FrozenDateTimeFactory
+) -> None:
+    """Commands older than the maximum age are not replayed."""
+    api.online = False
+    await queue.async_set_property(IOTID, {"childLockOnOff": 1})
+    freezer.tick(COMMAND_QUEUE_MAX_AGE + 1)
+    api.online = True
+
+    await queue.async_replay()
+
+    assert api.sent == []
+    assert queue.pending == 0
+
+
+async def test_load_drops_queued_actions(hass: HomeAssistant, hass_storage: dict[str, Any], api: FakeAPI) -> None:
+    """Actions persisted by older versions are never replayed after a restart."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.command_queue"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.command_queue",
+        "data": {
+            "devices": {
+                IOTID: [
+                    ["property", "handMode", 1, 0],
+                    ["property", "childLockOnOff", 1, 0],
+                ]
+            }
+        },
+    }
+    executor = FurbulousExecutor("test", 1, 4)
+    command_queue = FurbulousCommandQueue(hass, entry, api, executor)
+
+    await command_queue.async_load()
+    executor.shutdown()
+
+    assert command_queue.depth(IOTID) == 1
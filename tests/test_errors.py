@@ -0,0 +1,79 @@
+"""Tests for the errorReportEvent bitmask decoding."""
+from __future__ import annotations
+
+from custom_components.furbulous.errors import (
+    ErrorFlagTracker,
+    active_flags,
+    describe,
+    error_value,
+    is_bin_full,
+    severity,
+)
+
+from .common import make_device
+
+
+def test_error_value() -> None:
+    """Wrapped, bare, missing and invalid values are all decoded."""
+    assert error_value({"errorReportEvent": {"value": 36, "time": 0}}) == 36
+    assert error_value({"errorReportEvent": 4}) == 4
+    assert error_value({}) == 0
+    assert error_value({"errorReportEvent": "n/a"}) == 0
+
+
+def test_decode_combined_flags() -> None:
+    """A combined code is split into its flags."""
+    assert active_flags(36) == (4, 32)
+    assert describe(36) == "Motor error - Rotation blocked, Waste bin full - Need to empty"
+    assert describe(0) == "No error"
+    assert describe(2048) == "Error 2048"
+
+
+def test_severity() -> None:
+    """The most serious flag wins and unknown flags rank above info."""
+    assert severity(0) == "info"
+    assert severity(4096) == "info"
+    assert severity(4096 | 32) == "warning"
+    assert severity(32 | 4) == "error"
+    assert severity(2048) == "unknown"
+
+
+def test_is_bin_full() -> None:
+    """Litter and waste bin full flags are detected inside combined codes."""
+    assert is_bin_full(16)
+    assert is_bin_full(32 | 4096)
+    assert not is_bin_full(4)
+
+
+def test_tracker_reports_transitions() -> None:
+    """Only flags that were set or cleared are reported, after a baseline."""
+    tracker = ErrorFlagTracker()
+
+    assert tracker.process([make_device(error=4)]) == []
+
+    changes = tracker.process([make_device(error=4 | 32)])
+    assert [(change.flag, change.active, change.severity) for change in changes] == [(32, True, "warning")]
+
+    changes = tracker.process([make_device(error=32)])
+    assert [(change.flag, change.active) for change in changes] == [(4, False)]
+
+    assert tracker.process([make_device(error=32)]) == []
+
+
+def test_tracker_forget() -> None:
+    """A forgotten device starts from a new baseline."""
+    tracker = ErrorFlagTracker()
+    tracker.process([make_device(error=4)])
+
+    tracker.forget([1])
+
+    assert tracker.process([make_device(error=0)]) == []
+
+
+def test_tracker_skips_devices_without_properties() -> None:
+    """Devices without properties do not reset the baseline."""
+    tracker = ErrorFlagTracker()
+    tracker.process([make_device(error=4)])
+
+    assert tracker.process([{"id": 1, "iotid": "IOT001"}]) == []
+    assert len(tracker.process([make_device(error=0)])) == 1
@@ -0,0 +1,92 @@
+"""Tests for the bounded API worker pool."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from custom_components.furbulous.executor import FurbulousCatBusyError, FurbulousExecutor
+
+
+class BlockingJob:
+    """Blocking callable that waits until released."""
+
+    def __init__(self) -> None:
+        """Initialize the job."""
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self) -> int:
+        """Run in a worker thread."""
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return self.calls
+
+
+async def test_runs_jobs_and_counts_them() -> None:
+    """Results are returned and failures counted."""
+    executor = FurbulousExecutor("test", 2, 4)
+
+    def _fail() -> None:
+        raise RuntimeError("boom")
+
+    try:
+        assert await executor.async_run(lambda value: value * 2, 21) == 42
+        with pytest.raises(RuntimeError):
+            await executor.async_run(_fail)
+    finally:
+        executor.shutdown()
+
+    metrics = executor.metrics()
+    assert metrics["completed"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["running"] == 0
+    assert metrics["queued"] == 0
+
+
+async def test_coalesces_identical_jobs() -> None:
+    """A job with the key of one in flight shares its result."""
+    executor = FurbulousExecutor("test", 2, 4)
+    job = BlockingJob()
+    try:
+        first = asyncio.ensure_future(executor.async_run(job, coalesce_key="get_data"))
+        await asyncio.to_thread(job.started.wait, 5)
+        second = asyncio.ensure_future(executor.async_run(job, coalesce_key="get_data"))
+        await asyncio.sleep(0)
+        job.release.set()
+
+        assert await first == 1
+        assert await second == 1
+    finally:
+        executor.shutdown()
+
+    assert job.calls == 1
+    assert executor.metrics()["coalesced"] == 1
+
+
+async def test_rejects_when_the_queue_is_full() -> None:
+    """Jobs beyond max_queue waiting jobs are rejected, not queued."""
+    executor = FurbulousExecutor("test", 1, 1)
+    job = BlockingJob()
+    try:
+        running = asyncio.ensure_future(executor.async_run(job))
+        await asyncio.to_thread(job.started.wait, 5)
+        waiting = asyncio.ensure_future(executor.async_run(job))
+        await asyncio.sleep(0)
+        assert executor.queued == 1
+
+        with pytest.raises(FurbulousCatBusyError):
+            await executor.async_run(job)
+
+        job.release.set()
+        await asyncio.gather(running, waiting)
+    finally:
+        executor.shutdown()
+
+    metrics = executor.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["completed"] == 2
+    assert metrics["max_queued"] == 1
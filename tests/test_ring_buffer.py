@@ -0,0 +1,50 @@
+"""Tests for the fixed-size ring buffer."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.furbulous.ring_buffer import RingBuffer
+
+
+def test_keeps_the_newest_entries() -> None:
+    """A full buffer overwrites its oldest entry."""
+    buffer = RingBuffer(3)
+    for item in range(5):
+        buffer.append(item)
+
+    assert len(buffer) == 3
+    assert list(buffer) == [2, 3, 4]
+    assert buffer.newest() == 4
+    assert buffer.to_list() == [2, 3, 4]
+
+
+def test_prefill_keeps_the_tail() -> None:
+    """Pre-filled items beyond the capacity are dropped, oldest first."""
+    buffer = RingBuffer(2, [1, 2, 3])
+
+    assert list(buffer) == [2, 3]
+
+
+@pytest.mark.parametrize(
+    ("count", "expected"),
+    [(None, [3, 4, 5, 6]), (2, [5, 6]), (10, [3, 4, 5, 6]), (0, []), (-1, [])],
+)
+def test_last(count: int | None, expected: list[int]) -> None:
+    """last() returns the newest entries, oldest first, across the wrap-around."""
+    buffer = RingBuffer(4, [1, 2, 3, 4, 5, 6])
+
+    assert buffer.last(count) == expected
+
+
+def test_empty_buffer() -> None:
+    """An empty buffer has no newest entry."""
+    buffer = RingBuffer(2)
+
+    assert buffer.newest() is None
+    assert buffer.last(1) == []
+
+
+def test_capacity_must_be_positive() -> None:
+    """A buffer needs room for at least one entry."""
+    with pytest.raises(ValueError):
+        RingBuffer(0)
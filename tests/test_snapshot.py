@@ -0,0 +1,98 @@
+"""Tests for the shared snapshot store and the snapshot diff."""
+from __future__ import annotations
+
+from custom_components.furbulous.diff import (
+    CHANGE_DEVICE_ADDED,
+    CHANGE_DEVICE_REMOVED,
+    CHANGE_PROPERTY,
+    diff_snapshots,
+)
+from custom_components.furbulous.snapshot import FIELD_DEVICES, FIELD_PETS, FurbulousSnapshotStore
+
+from .common import make_device
+
+
+def test_initial_load_is_not_a_change() -> None:
+    """The first apply stores the data without reporting changes."""
+    store = FurbulousSnapshotStore()
+
+    assert store.apply({"devices": [make_device()], "pets": []}) == []
+    assert store.version == 1
+    assert len(store.changed_devices) == 1
+
+
+def test_unchanged_devices_keep_their_dict() -> None:
+    """An identical poll keeps the version and the device identity."""
+    store = FurbulousSnapshotStore()
+    store.apply({"devices": [make_device()], "pets": []})
+    device = store.data[FIELD_DEVICES][0]
+
+    assert store.apply({"devices": [make_device()], "pets": []}) == []
+    assert store.version == 1
+    assert store.data[FIELD_DEVICES][0] is device
+    assert store.changed_devices == []
+
+
+def test_changed_device_is_reported() -> None:
+    """Only the device that moved is replaced and diffed."""
+    store = FurbulousSnapshotStore()
+    store.apply({"devices": [make_device(1, "A"), make_device(2, "B")], "pets": []})
+    untouched = store.data[FIELD_DEVICES][1]
+
+    changes = store.apply({"devices": [make_device(1, "A", workstatus=5), make_device(2, "B")], "pets": []})
+
+    assert [change.change_type for change in changes] == [CHANGE_PROPERTY]
+    assert changes[0].key == "workstatus"
+    assert [device["id"] for device in store.changed_devices] == [1]
+    assert store.data[FIELD_DEVICES][1] is untouched
+    assert store.field_version("device:1") == 2
+    assert store.field_version("device:2") == 1
+
+
+def test_removed_device() -> None:
+    """A device missing from the poll is reported as removed."""
+    store = FurbulousSnapshotStore()
+    store.apply({"devices": [make_device(1, "A"), make_device(2, "B")], "pets": []})
+
+    changes = store.apply({"devices": [make_device(1, "A")], "pets": []})
+
+    assert store.removed_devices == [2]
+    assert [change.change_type for change in changes] == [CHANGE_DEVICE_REMOVED]
+    assert store.field_version(FIELD_DEVICES) == 2
+
+
+def test_stale_device_keeps_previous_values() -> None:
+    """A device skipped at the refresh deadline keeps its last values."""
+    store = FurbulousSnapshotStore()
+    store.apply({"devices": [make_device(workstatus=5)], "pets": []})
+
+    store.apply({"devices": [{**make_device(workstatus=0), "stale": True}], "pets": []})
+
+    assert store.data[FIELD_DEVICES][0]["properties"]["workstatus"]["value"] == 5
+    assert store.version == 1
+
+
+def test_only_requested_fields_are_merged() -> None:
+    """The fast cadence does not overwrite the pets of the regular one."""
+    store = FurbulousSnapshotStore()
+    store.apply({"devices": [], "pets": [{"pet_id": 1}]})
+
+    store.apply({"devices": [make_device()], "pets": []}, (FIELD_DEVICES,))
+
+    assert store.data[FIELD_PETS] == [{"pet_id": 1}]
+
+
+def test_diff_snapshots() -> None:
+    """Added, removed and changed devices are reported; identity short-cuts."""
+    old = {"devices": [make_device(1, "A"), make_device(2, "B")]}
+    new = {"devices": [make_device(1, "A", error=32), make_device(3, "C")]}
+
+    changes = diff_snapshots(old, new)
+
+    assert diff_snapshots(old, old) == []
+    assert diff_snapshots(None, new) == []
+    assert {(change.change_type, change.device_id, change.key) for change in changes} == {
+        (CHANGE_PROPERTY, 1, "errorReportEvent"),
+        (CHANGE_DEVICE_ADDED, 3, None),
+        (CHANGE_DEVICE_REMOVED, 2, None),
+    }
@@ -0,0 +1,149 @@
+"""Tests for the usage statistics importer and the usage windows built on it."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.furbulous import statistics_import
+from custom_components.furbulous.statistics_import import UsageStatisticsImporter, _day_start
+from custom_components.furbulous.usage_windows import UsageWindows
+
+IOTID = "IOT001"
+
+
+def _poll(uses: int, duration: int = 60) -> dict[str, Any]:
+    """Return a snapshot with today's wcheader totals of one device."""
+    return {"devices": [{"iotid": IOTID, "name": "Box", "daily_stats": {"times": uses, "avg_duration": duration}}]}
+
+
+@pytest.fixture
+async def importer(hass: HomeAssistant) -> UsageStatisticsImporter:
+    """Return a loaded importer with the recorder marked as available."""
+    hass.config.components.add("recorder")
+    statistics_importer = UsageStatisticsImporter(hass, "entry")
+    await statistics_importer.async_load()
+    return statistics_importer
+
+
+def _close_days(importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory, uses: list[int]) -> None:
+    """Poll once per day so that every value but the last is closed."""
+    for count in uses:
+        importer.update_daily(_poll(count))
+        freezer.tick(86400)
+
+
+async def test_rollover_closes_the_previous_day(
+    importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory
+) -> None:
+    """The first poll of a new day closes the previous one."""
+    freezer.move_to("2026-03-10 12:00:00+00:00")
+
+    assert importer.update_daily(_poll(3)) == set()
+    assert importer.update_daily(_poll(4)) == set()
+    freezer.tick(86400)
+
+    assert importer.update_daily(_poll(1)) == {IOTID}
+    assert [uses for _, uses in importer.closed_days(IOTID)] == [4]
+
+
+async def test_hourly_buckets_import_once(importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory) -> None:
+    """Completed hourly visit buckets are imported and dropped; the current one waits."""
+    freezer.move_to("2026-03-10 12:30:00+00:00")
+    now = dt_util.utcnow().timestamp()
+    importer.record_visit(IOTID, now - 3600)
+    importer.record_visit(IOTID, now - 3600)
+    importer.record_visit(IOTID, now)
+
+    with patch.object(statistics_import, "async_add_external_statistics") as add_statistics:
+        importer.async_flush()
+
+    metadata, rows = add_statistics.call_args_list[0].args[1:]
+    assert metadata["statistic_id"] == "furbulous:iot001_visits"
+    assert [(row["state"], row["sum"]) for row in rows] == [(2, 2)]
+
+
+async def test_closed_days_import_once(importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory) -> None:
+    """Each closed day is imported once, with a continuous running sum."""
+    freezer.move_to("2026-03-10 12:00:00+00:00")
+    _close_days(importer, freezer, [3, 5])
+    importer.update_daily(_poll(1))
+
+    with patch.object(statistics_import, "async_add_external_statistics") as add_statistics:
+        importer.async_flush()
+        first = {call.args[1]["statistic_id"]: call.args[2] for call in add_statistics.call_args_list}
+        add_statistics.reset_mock()
+
+        importer.async_flush()
+        assert add_statistics.call_count == 0
+
+        freezer.tick(86400)
+        importer.update_daily(_poll(2))
+        importer.async_flush()
+        second = {call.args[1]["statistic_id"]: call.args[2] for call in add_statistics.call_args_list}
+
+    assert [(row["state"], row["sum"]) for row in first["furbulous:iot001_daily_uses"]] == [(3, 3), (5, 8)]
+    assert [row["mean"] for row in first["furbulous:iot001_avg_duration"]] == [60, 60]
+    assert [(row["state"], row["sum"]) for row in second["furbulous:iot001_daily_uses"]] == [(1, 9)]
+
+
+async def test_failed_import_is_retried(importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory) -> None:
+    """A rejected import does not advance the last imported day."""
+    freezer.move_to("2026-03-10 12:00:00+00:00")
+    _close_days(importer, freezer, [3])
+    importer.update_daily(_poll(1))
+
+    with patch.object(statistics_import, "async_add_external_statistics", side_effect=ValueError):
+        importer.async_flush()
+    with patch.object(statistics_import, "async_add_external_statistics") as add_statistics:
+        importer.async_flush()
+
+    assert add_statistics.call_count == 2
+
+
+async def test_metadata_mean_type(importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory) -> None:
+    """mean_type is set where Home Assistant supports it, has_mean otherwise."""
+    freezer.move_to("2026-03-10 12:00:00+00:00")
+    _close_days(importer, freezer, [3])
+    importer.update_daily(_poll(1))
+
+    with patch.object(statistics_import, "async_add_external_statistics") as add_statistics:
+        importer.async_flush()
+
+    metadata = {call.args[1]["statistic_id"]: call.args[1] for call in add_statistics.call_args_list}
+    duration = metadata["furbulous:iot001_avg_duration"]
+    if statistics_import.StatisticMeanType is None:
+        assert duration["has_mean"] is True
+    else:
+        assert duration["mean_type"] == statistics_import.StatisticMeanType.ARITHMETIC
+        assert "has_mean" not in duration
+
+
+def test_day_start_is_floored_to_the_utc_hour(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Local midnight in a half-hour time zone starts at the previous UTC hour."""
+    monkeypatch.setattr(dt_util, "DEFAULT_TIME_ZONE", dt_util.get_time_zone("Asia/Kolkata"))
+
+    assert _day_start("2026-03-10") == datetime(2026, 3, 9, 18, 0, tzinfo=timezone.utc)
+
+
+async def test_usage_windows(importer: UsageStatisticsImporter, freezer: FrozenDateTimeFactory) -> None:
+    """The 7 and 30 day windows are derived from the importer's closed days."""
+    freezer.move_to("2026-03-01 12:00:00+00:00")
+    windows = UsageWindows(importer)
+    assert windows.get(IOTID) == {}
+
+    _close_days(importer, freezer, list(range(1, 11)))
+    windows.refresh(importer.update_daily(_poll(0)))
+
+    stats = windows.get(IOTID)
+    assert stats["days"] == 10
+    assert stats["avg_7d"] == 7.0
+    assert stats["min_7d"] == 4
+    assert stats["max_30d"] == 10
+    assert stats["avg_30d"] == 5.5
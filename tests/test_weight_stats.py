@@ -0,0 +1,100 @@
+"""Tests for the incremental weight statistics."""
+from __future__ import annotations
+
+import random
+import time
+
+from custom_components.furbulous.const import WEIGHT_HISTORY_SIZE, WEIGHT_MEDIAN_WINDOW
+from custom_components.furbulous.weight_stats import SECONDS_PER_DAY, TrendWindow, WeightTracker
+
+
+def _slope(points: list[tuple[float, int]]) -> float | None:
+    """Return the least-squares slope in grams per day, computed from scratch."""
+    if len(points) < 2:
+        return None
+    mean_x = sum(ts for ts, _ in points) / len(points)
+    mean_y = sum(weight for _, weight in points) / len(points)
+    denominator = sum((ts - mean_x) ** 2 for ts, _ in points)
+    numerator = sum((ts - mean_x) * (weight - mean_y) for ts, weight in points)
+    return numerator / denominator * SECONDS_PER_DAY
+
+
+def test_trend_window_slope() -> None:
+    """A steady gain of 10 g per day gives a slope of 10."""
+    window = TrendWindow(7)
+    start = 1_700_000_000
+    assert window.slope() is None
+
+    for day in range(5):
+        window.add(start + day * SECONDS_PER_DAY, 4000 + 10 * day)
+
+    assert window.slope() == 10.0
+
+
+def test_trend_window_ages_without_samples() -> None:
+    """Samples older than the window are dropped when it is aged."""
+    window = TrendWindow(7)
+    start = 1_700_000_000
+    window.add(start, 4000)
+    window.add(start + SECONDS_PER_DAY, 4010)
+
+    assert not window.expire(start + 2 * SECONDS_PER_DAY)
+    assert window.expire(start + 8 * SECONDS_PER_DAY)
+    assert window.slope() is None
+
+
+def test_tracker_matches_a_full_recompute() -> None:
+    """Incremental extremes, median and trends match a pass over the history."""
+    rng = random.Random(42)
+    tracker = WeightTracker()
+    now = time.time() - 90 * SECONDS_PER_DAY
+    history: list[tuple[float, int]] = []
+
+    for visit in range(WEIGHT_HISTORY_SIZE * 2):
+        now += rng.uniform(0.05, 0.4) * SECONDS_PER_DAY
+        weight = 4000 + visit + rng.randint(-60, 60)
+        tracker.add(weight, now)
+        history.append((now, weight))
+
+        kept = history[-WEIGHT_HISTORY_SIZE:]
+        weights = [weight for _, weight in kept]
+        stats = tracker.stats
+        assert stats["minimum"] == min(weights)
+        assert stats["maximum"] == max(weights)
+        assert stats["samples"] == len(kept)
+        if len(weights) >= WEIGHT_MEDIAN_WINDOW:
+            recent = sorted(weights[-WEIGHT_MEDIAN_WINDOW:])
+            assert stats["median"] == recent[WEIGHT_MEDIAN_WINDOW // 2]
+        for key, days in (("trend_7d", 7), ("trend_30d", 30)):
+            expected = _slope([point for point in kept if point[0] >= now - days * SECONDS_PER_DAY])
+            if expected is None:
+                assert stats[key] is None
+            else:
+                assert abs(stats[key] - expected) <= 0.11
+
+
+def test_tracker_ewma() -> None:
+    """The average follows the exponentially weighted moving average."""
+    tracker = WeightTracker()
+    now = time.time()
+    tracker.add(4000, now)
+    tracker.add(4100, now + 60)
+
+    assert tracker.stats["average"] == 4030.0
+    assert tracker.stats["last"] == 4100
+
+
+def test_tracker_round_trip_and_expiry() -> None:
+    """A tracker rebuilt from its saved samples ages its trends on its own."""
+    tracker = WeightTracker()
+    now = time.time() - 3 * SECONDS_PER_DAY
+    for day in range(3):
+        tracker.add(4000 + 5 * day, now + day * SECONDS_PER_DAY)
+
+    saved = tracker.as_dict()
+    restored = WeightTracker(saved["samples"], saved["ewma"])
+    assert restored.stats == tracker.stats
+
+    assert restored.expire(now + 10 * SECONDS_PER_DAY)
+    assert restored.stats["trend_7d"] is None
+    assert restored.stats["trend_30d"] is not None